@@ -0,0 +1,57 @@
+import sys
+import os
+import glob
+import shutil
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.algorithms.accelerated import COMPILED_MODULE
+
+ALGORITHMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'algorithms')
+SOURCE = os.path.join(ALGORITHMS_DIR, 'sorting_algorithms.py')
+DEPENDENCIES = [os.path.join(ALGORITHMS_DIR, 'base_cases.py')]
+
+def build():
+    """Compile src/algorithms/sorting_algorithms.py with mypyc as an optional accelerated module"""
+    try:
+        from mypyc.build import mypycify
+        from setuptools import setup
+    except ImportError:
+        print("❌ mypyc is not installed; run `pip install mypy setuptools` to build the accelerated module")
+        return 1
+    
+    build_dir = tempfile.mkdtemp(prefix='mypyc_build_')
+    package_dir = os.path.join(build_dir, 'src', 'algorithms')
+    os.makedirs(package_dir)
+    
+    
+    for init in (os.path.join(build_dir, 'src', '__init__.py'), os.path.join(package_dir, '__init__.py')):
+        open(init, 'w').close()
+    module_path = os.path.join('src', 'algorithms', f'{COMPILED_MODULE}.py')
+    shutil.copyfile(SOURCE, os.path.join(build_dir, module_path))
+    for dependency in DEPENDENCIES:
+        shutil.copy2(dependency, package_dir)
+    
+    cwd = os.getcwd()
+    try:
+        os.chdir(build_dir)
+        print(f"🔧 Compiling {os.path.basename(SOURCE)} with mypyc...")
+        setup(name='sorting_algorithms_accelerated',
+              ext_modules=mypycify([module_path], opt_level='3'),
+              script_args=['build_ext', '--inplace'])
+    finally:
+        os.chdir(cwd)
+    
+    
+    built = glob.glob(os.path.join(package_dir, f'{COMPILED_MODULE}*.so')) + \
+        glob.glob(os.path.join(package_dir, f'{COMPILED_MODULE}*.pyd'))
+    for extension in built:
+        shutil.copy2(extension, ALGORITHMS_DIR)
+        print(f"✅ Installed {os.path.basename(extension)}")
+    
+    shutil.rmtree(build_dir, ignore_errors=True)
+    return 0 if built else 1
+
+if __name__ == "__main__":
+    sys.exit(build())
@@ -1,59 +1,287 @@
 import sys
 import os
+import time
+import argparse
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.data_generation.data_generator import DataGenerator
-from src.algorithms.sorting_algorithms import QuickSort, MergeSort, HeapSort
+from src.data_generation.dataset_pipeline import DatasetPipeline
+from src.algorithms.registry import create_algorithms, ALGORITHM_FACTORIES, STRING_ALGORITHM_FACTORIES
 from src.analysis.performance_analyzer import PerformanceAnalyzer
 from src.analysis.visualizer import Visualizer
+from src.analysis.profiler import CellProfiler
+from src.analysis.distributed import BenchmarkCoordinator, BenchmarkWorker
+from src.analysis.interpreter_comparison import InterpreterComparison, save_comparison
+from src.analysis.calibration import calibrate_and_apply
+from src.analysis.cache_sweep import run_cache_sweep
+from src.analysis.metrics import BenchmarkMetrics, MetricsServer, MetricsFileWriter
 from src.utils.config import Config
+from src.utils.helpers import generate_random_array
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sorting algorithms comparative analysis")
+    parser.add_argument('--compact', action='store_true',
+                        help="benchmark compact typed arrays at Config.COMPACT_DATA_SIZES")
+    parser.add_argument('--strings', action='store_true',
+                        help="benchmark string datasets with the string sorts alongside the comparison sorts")
+    parser.add_argument('--compiled', action='store_true',
+                        help="also benchmark the mypyc-compiled algorithms built by build_accelerated.py")
+    parser.add_argument('--cached', action='store_true',
+                        help="also benchmark each algorithm behind the content-addressed sort result cache")
+    parser.add_argument('--profile', nargs='*', metavar='ALGO:TYPE:SIZE',
+                        help="profile matching cells ('*' wildcards); no selector profiles every cell")
+    parser.add_argument('--profile-top', type=int, default=None,
+                        help="number of hot functions to report per algorithm")
+    parser.add_argument('--recalibrate', action='store_true',
+                        help="re-run calibration before the analysis instead of using the saved tuning profile")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="serve live OpenMetrics at http://METRICS_HOST:PORT/metrics during the run")
+    parser.add_argument('--metrics-file', nargs='?', const=Config.METRICS_FILE, default=None,
+                        help="periodically rewrite live OpenMetrics to this file (default: Config.METRICS_FILE)")
+    
+    subparsers = parser.add_subparsers(dest='command')
+    
+    coordinator = subparsers.add_parser('coordinator', help="serve benchmark cells to remote workers")
+    coordinator.add_argument('--host', default=Config.DISTRIBUTED_HOST)
+    coordinator.add_argument('--port', type=int, default=Config.DISTRIBUTED_PORT)
+    coordinator.add_argument('--authkey', default=os.environ.get(Config.DISTRIBUTED_AUTHKEY_ENV),
+                             help=f"shared secret for workers (default: ${Config.DISTRIBUTED_AUTHKEY_ENV}, "
+                                  f"or a random key printed at startup)")
+    coordinator.add_argument('--seed', type=int, default=Config.DISTRIBUTED_SEED)
+    coordinator.add_argument('--sizes', type=int, nargs='+', default=None)
+    
+    worker = subparsers.add_parser('worker', help="pull and run cells from a coordinator")
+    worker.add_argument('--host', default=Config.DISTRIBUTED_HOST)
+    worker.add_argument('--port', type=int, default=Config.DISTRIBUTED_PORT)
+    worker.add_argument('--authkey', default=os.environ.get(Config.DISTRIBUTED_AUTHKEY_ENV),
+                        help=f"the key printed by the coordinator (default: ${Config.DISTRIBUTED_AUTHKEY_ENV})")
+    
+    interpreters = subparsers.add_parser('interpreters', help="run the matrix under several Python interpreters")
+    interpreters.add_argument('--interpreters', nargs='+', default=None,
+                              help="interpreter names or paths (default: Config.INTERPRETERS)")
+    interpreters.add_argument('--seed', type=int, default=Config.DISTRIBUTED_SEED)
+    interpreters.add_argument('--sizes', type=int, nargs='+', default=None)
+    
+    calibrate = subparsers.add_parser('calibrate', help="tune per-machine thresholds and save a tuning profile")
+    calibrate.add_argument('--sizes', type=int, nargs='+', default=None)
+    calibrate.add_argument('--trials', type=int, default=None)
+    
+    sweep = subparsers.add_parser('sweep', help="run one of the parameter sweeps (default: the cache-boundary sweep)")
+    sweep.add_argument('target', nargs='?', default='cache', choices=['cache'] + list(SWEEP_TARGETS),
+                       help="which sweep to run")
+    sweep.add_argument('--max-size', type=int, default=None,
+                       help="largest array size to run (default: Config.CACHE_SWEEP_MAX_SIZE)")
+    sweep.add_argument('--data-types', nargs='+', default=None,
+                       help="data types to sweep (default: Config.CACHE_SWEEP_DATA_TYPES)")
+    sweep.add_argument('--compact', action='store_true',
+                       help="sweep compact typed arrays instead of lists")
+    sweep.add_argument('--size', type=int, default=None,
+                       help="problem size for the non-cache sweeps (default: the sweep's Config setting)")
+    sweep.add_argument('--algorithm', choices=list(ALGORITHM_FACTORIES), default='Quick Sort',
+                       help="algorithm used by sweeps that take one")
+    
+    return parser.parse_args()
+
+def save_and_plot(performance_analyzer, results):
+    # Generate visualizations
+    print("\n📊 Generating visualizations...")
+    Visualizer().create_all_plots(results)
+    print("✅ Visualizations saved to results/graphs/")
+    
+    # Save results
+    print("\n💾 Saving results...")
+    performance_analyzer.save_results(results)
+    performance_analyzer.save_results_columnar(results)
+    print("✅ Results saved to results/performance_data/")
+
+def run_coordinator(args):
+    authkey = args.authkey.encode() if args.authkey else None
+    coordinator = BenchmarkCoordinator(data_sizes=args.sizes, seed=args.seed,
+                                       address=(args.host, args.port), authkey=authkey)
+    coordinator.start()
+    if authkey is None:
+        print(f"🔑 Start workers with --authkey {coordinator.authkey.decode()}")
+    results = coordinator.run()
+    print("✅ Distributed analysis completed")
+    
+    save_and_plot(PerformanceAnalyzer(), results)
+
+def run_worker(args):
+    if not args.authkey:
+        print(f"❌ Pass the coordinator's key with --authkey or ${Config.DISTRIBUTED_AUTHKEY_ENV}")
+        return
+    
+    worker = BenchmarkWorker((args.host, args.port), args.authkey.encode())
+    cells_done = worker.run()
+    print(f"✅ Worker {worker.worker_id} finished {cells_done} cells")
+
+def run_interpreter_comparison(args):
+    comparison = InterpreterComparison(args.interpreters, seed=args.seed, data_sizes=args.sizes).run()
+    if not comparison['interpreters']:
+        print("❌ No interpreter completed the benchmark")
+        return
+    
+    save_comparison(comparison)
+    plot_path = Visualizer().create_interpreter_speedup_plot(comparison)
+    print(f"✅ Interpreter speedups plotted to {plot_path}")
+
+def run_calibration(args):
+    profile = calibrate_and_apply(args.sizes, args.trials)
+    print("✅ Tuned parameters:")
+    for name, value in profile['parameters'].items():
+        print(f"   • {name}: {value}")
+
+def start_metrics(args):
+    if args.metrics_port is None and args.metrics_file is None:
+        return None, []
+    
+    metrics = BenchmarkMetrics()
+    exporters = []
+    if args.metrics_port is not None:
+        server = MetricsServer(metrics, port=args.metrics_port).start()
+        host, port = server.address
+        print(f"📡 Serving metrics at http://{host}:{port}/metrics")
+        exporters.append(server)
+    if args.metrics_file is not None:
+        writer = MetricsFileWriter(metrics, args.metrics_file).start()
+        print(f"📡 Writing metrics to {writer.path} every {writer.interval:.0f}s")
+        exporters.append(writer)
+    return metrics, exporters
+
+def stop_metrics(exporters):
+    for exporter in exporters:
+        exporter.stop()
+
+def sweep_merge_fan_in(analyzer, args):
+    return analyzer.analyze_merge_fan_in(generate_random_array(args.size or Config.MERGE_FAN_IN_SWEEP_SIZE))
+
+def sweep_selection(analyzer, args):
+    return analyzer.analyze_selection(generate_random_array(args.size or Config.SELECTION_SWEEP_SIZE))
+
+def sweep_incremental_inserts(analyzer, args):
+    algorithm = create_algorithms([args.algorithm])[args.algorithm]
+    return analyzer.analyze_incremental_inserts(algorithm, total_size=args.size)
+
+def sweep_batch_sorting(analyzer, args):
+    algorithm = create_algorithms([args.algorithm])[args.algorithm]
+    return analyzer.analyze_batch_sorting(algorithm, total_elements=args.size)
+
+def sweep_indirect_sorting(analyzer, args):
+    algorithm = create_algorithms([args.algorithm])[args.algorithm]
+    return analyzer.analyze_indirect_sorting(algorithm, size=args.size)
+
+SWEEP_TARGETS = {
+    'fan-in': sweep_merge_fan_in,
+    'selection': sweep_selection,
+    'incremental': sweep_incremental_inserts,
+    'batch': sweep_batch_sorting,
+    'records': sweep_indirect_sorting
+}
+
+def run_target_sweep(args):
+    metrics, exporters = start_metrics(args)
+    performance_analyzer = PerformanceAnalyzer(metrics)
+    try:
+        sweep = SWEEP_TARGETS[args.target](performance_analyzer, args)
+    finally:
+        stop_metrics(exporters)
+    
+    print("\n💾 Saving results...")
+    timestamp = time.strftime('%Y%m%d_%H%M%S')
+    performance_analyzer.save_results(sweep, f"{args.target.replace('-', '_')}_sweep_{timestamp}.json")
+
+def run_sweep(args):
+    if args.target != 'cache':
+        return run_target_sweep(args)
+    
+    metrics, exporters = start_metrics(args)
+    performance_analyzer = PerformanceAnalyzer(metrics)
+    algorithms = create_algorithms(list(ALGORITHM_FACTORIES))
+    try:
+        results = run_cache_sweep(performance_analyzer, algorithms, data_types=args.data_types,
+                                  compact=args.compact, max_size=args.max_size)
+    finally:
+        stop_metrics(exporters)
+    
+    print("\n💾 Saving results...")
+    timestamp = time.strftime('%Y%m%d_%H%M%S')
+    performance_analyzer.save_results(results, f"cache_sweep_{timestamp}.json")
+    performance_analyzer.save_results_columnar(results, f"cache_sweep_{timestamp}")
+    
+    visualizer = Visualizer()
+    for data_type in results['data_types']:
+        plot_path = visualizer.create_cache_sweep_plot(results, data_type)
+        print(f"✅ Cache sweep plotted to {plot_path}")
 
 def main():
     """Main function to run the sorting algorithms analysis"""
+    args = parse_args()
+    
+    if args.command == 'coordinator':
+        return run_coordinator(args)
+    if args.command == 'worker':
+        return run_worker(args)
+    if args.command == 'interpreters':
+        return run_interpreter_comparison(args)
+    if args.command == 'calibrate':
+        return run_calibration(args)
+    if args.command == 'sweep':
+        return run_sweep(args)
+    if args.strings and (args.compact or args.compiled):
+        print("❌ --strings cannot be combined with --compact or --compiled")
+        return
+    
     print("🔍 Starting Sorting Algorithms Comparative Analysis")
     print("=" * 60)
     
     # Initialize components
     config = Config()
-    data_generator = DataGenerator()
-    performance_analyzer = PerformanceAnalyzer()
-    visualizer = Visualizer()
+    metrics, exporters = start_metrics(args)
+    performance_analyzer = PerformanceAnalyzer(metrics)
+    
+    # Tune thresholds for this machine on first use
+    if args.recalibrate or Config.TUNING_PROFILE is None:
+        calibrate_and_apply()
+    else:
+        print(f"🎛️  Using tuning profile {Config.TUNING_PROFILE}")
     
     # Define algorithms to test
-    algorithms = {
-        'Quick Sort': QuickSort(),
-        'Merge Sort': MergeSort(),
-        'Heap Sort': HeapSort()
-    }
+    names = list(ALGORITHM_FACTORIES) + (list(STRING_ALGORITHM_FACTORIES) if args.strings else [])
+    algorithms = create_algorithms(names, include_compiled=args.compiled, include_cached=args.cached)
     
     print(f"📊 Testing {len(algorithms)} algorithms:")
     for name in algorithms.keys():
         print(f"   • {name}")
     
-    print(f"📈 Data sizes: {config.DATA_SIZES}")
-    print(f"📋 Data types: {config.DATA_TYPES}")
+    data_sizes = config.COMPACT_DATA_SIZES if args.compact else config.DATA_SIZES
+    data_types = config.STRING_DATA_TYPES if args.strings else config.DATA_TYPES
+    print(f"📈 Data sizes: {data_sizes}")
+    print(f"📋 Data types: {data_types}")
     print()
     
-    # Generate test data
-    print("🔧 Generating test data...")
-    test_data = data_generator.generate_all_datasets()
-    print(f"✅ Generated {len(test_data)} datasets")
+    # Stream test data; the next dataset is prepared in the background while the current one is timed
+    test_data = DatasetPipeline(data_sizes, compact=args.compact, data_types=data_types)
+    print(f"🔧 {len(test_data)} datasets will be generated on demand "
+          f"({test_data.mode} prefetch, at most {test_data.max_live} in memory)")
     
     # Run performance analysis
     print("\n⚡ Running performance analysis...")
-    results = performance_analyzer.analyze_algorithms(algorithms, test_data)
+    profiler = None
+    if args.profile is not None:
+        profiler = CellProfiler(args.profile, top_n=args.profile_top)
+    try:
+        results = performance_analyzer.analyze_algorithms(algorithms, test_data, profiler=profiler)
+    finally:
+        stop_metrics(exporters)
     print("✅ Performance analysis completed")
     
-    # Generate visualizations
-    print("\n📊 Generating visualizations...")
-    visualizer.create_all_plots(results)
-    print("✅ Visualizations saved to results/graphs/")
+    if args.compiled:
+        performance_analyzer.print_compiled_speedups(results)
+    if args.cached:
+        performance_analyzer.print_cached_speedups(results)
+        results['cached_sorting'] = performance_analyzer.analyze_cached_sorting(algorithms['Quick Sort'])
     
-    # Save results
-    print("\n💾 Saving results...")
-    performance_analyzer.save_results(results)
-    print("✅ Results saved to results/performance_data/")
+    save_and_plot(performance_analyzer, results)
     
     print("\n🎉 Analysis completed successfully!")
     print("📁 Check the 'results' directory for outputs")
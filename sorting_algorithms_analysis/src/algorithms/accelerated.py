@@ -0,0 +1,71 @@
+
+from typing import Any, List
+from . import sorting_algorithms as _pure
+from .sorting_algorithms import SortingAlgorithm
+
+try:
+    from . import _sorting_algorithms_compiled as _compiled
+except ImportError:
+    _compiled = None
+
+COMPILED_AVAILABLE = _compiled is not None
+COMPILED_MODULE = '_sorting_algorithms_compiled'
+ACCELERATED_CLASSES = ['QuickSort', 'MergeSort', 'HeapSort', 'MultiwayMergeSort']
+
+class CompiledAlgorithm(SortingAlgorithm):
+    
+    def __init__(self, class_name: str, *args, **kwargs):
+        if class_name not in ACCELERATED_CLASSES:
+            raise ValueError(f"No compiled build of {class_name}")
+        
+        self.fallback = getattr(_pure, class_name)(*args, **kwargs)
+        self.compiled = getattr(_compiled, class_name)(*args, **kwargs) if _compiled is not None else None
+        self._compiled_buffers = self.compiled is not None
+    
+    @property
+    def is_compiled(self) -> bool:
+        return self.compiled is not None
+    
+    def sort(self, arr: List[int]) -> List[int]:
+        if self.compiled is None:
+            return self.fallback.sort(arr)
+        return self.compiled.sort(arr)
+    
+    def sort_buffer(self, buf: Any, out: Any = None) -> Any:
+        if self._compiled_buffers:
+            try:
+                return self.compiled.sort_buffer(buf, out)
+            except TypeError:
+                
+                self._compiled_buffers = False
+        return self.fallback.sort_buffer(buf, out)
+    
+    def argsort(self, keys: List[Any]) -> List[int]:
+        if self.compiled is not None:
+            try:
+                return self.compiled.argsort(keys)
+            except TypeError:
+                pass
+        return self.fallback.argsort(keys)
+    
+    @property
+    def name(self) -> str:
+        if self.compiled is None:
+            return self.fallback.name
+        return f"{self.fallback.name} (compiled)"
+    
+    @property
+    def time_complexity_best(self) -> str:
+        return self.fallback.time_complexity_best
+    
+    @property
+    def time_complexity_average(self) -> str:
+        return self.fallback.time_complexity_average
+    
+    @property
+    def time_complexity_worst(self) -> str:
+        return self.fallback.time_complexity_worst
+    
+    @property
+    def space_complexity(self) -> str:
+        return self.fallback.space_complexity
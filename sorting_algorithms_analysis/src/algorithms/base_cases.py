@@ -0,0 +1,115 @@
+
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SORTING_NETWORKS: Dict[int, List[Tuple[int, int]]] = {
+    2: [(0, 1)],
+    3: [(0, 2), (0, 1), (1, 2)],
+    4: [(0, 1), (2, 3), (0, 2), (1, 3), (1, 2)],
+    5: [(0, 3), (1, 4), (0, 2), (1, 3), (0, 1), (2, 4), (1, 2), (3, 4), (2, 3)],
+    6: [(0, 5), (1, 3), (2, 4), (1, 2), (3, 4), (0, 3), (2, 5), (0, 1), (2, 3), (4, 5), (1, 2), (3, 4)],
+    7: [(0, 2), (1, 3), (4, 6), (0, 4), (1, 5), (2, 6), (0, 1), (2, 3), (4, 5),
+        (2, 4), (3, 5), (1, 4), (3, 6), (1, 2), (3, 4), (5, 6)],
+    8: [(0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7), (0, 1), (2, 3), (4, 5), (6, 7),
+        (2, 4), (3, 5), (1, 4), (3, 6), (1, 2), (3, 4), (5, 6)],
+    9:  [(4, 8), (5, 6), (0, 5), (1, 7), (3, 4), (0, 1), (2, 3), (4, 5), (6, 8), (0, 2),
+         (1, 3), (6, 7), (1, 2), (4, 6), (5, 7), (1, 4), (2, 6), (5, 8), (2, 4), (3, 6),
+         (3, 5), (6, 8), (3, 4), (5, 6), (7, 8), (6, 7)],
+    10: [(4, 8), (5, 6), (0, 5), (1, 7), (2, 9), (3, 4), (0, 1), (2, 3), (4, 5), (6, 8),
+         (7, 9), (0, 2), (1, 3), (6, 7), (8, 9), (1, 2), (4, 6), (5, 7), (1, 4), (2, 6),
+         (5, 8), (2, 4), (3, 6), (3, 5), (6, 8), (7, 9), (3, 4), (5, 6), (7, 8), (6, 7)],
+    11: [(4, 8), (5, 6), (9, 10), (0, 5), (1, 7), (2, 9), (3, 4), (0, 1), (2, 3), (4, 5),
+         (6, 8), (7, 9), (0, 2), (1, 3), (4, 10), (6, 7), (8, 9), (1, 2), (4, 6), (5, 7),
+         (8, 10), (1, 4), (2, 6), (5, 8), (7, 10), (2, 4), (3, 6), (3, 5), (6, 8), (7, 9),
+         (3, 4), (5, 6), (7, 8), (9, 10), (6, 7), (8, 9)],
+    12: [(4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7), (2, 9), (3, 4), (0, 1), (2, 3),
+         (4, 5), (6, 8), (7, 9), (10, 11), (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9),
+         (1, 2), (4, 6), (5, 7), (8, 10), (9, 11), (1, 4), (2, 6), (5, 8), (7, 10), (2, 4),
+         (3, 6), (3, 5), (6, 8), (7, 9), (3, 4), (5, 6), (7, 8), (9, 10), (6, 7), (8, 9)],
+    13: [(1, 12), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7), (2, 9), (3, 4), (11, 12),
+         (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (0, 2), (1, 3), (4, 10), (5, 11),
+         (6, 7), (8, 9), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (1, 4), (2, 6),
+         (5, 8), (7, 10), (2, 4), (3, 6), (9, 12), (3, 5), (6, 8), (7, 9), (10, 12), (3, 4),
+         (5, 6), (7, 8), (9, 10), (11, 12), (6, 7), (8, 9)],
+    14: [(0, 13), (1, 12), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7), (2, 9), (3, 4),
+         (6, 13), (11, 12), (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (0, 2),
+         (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10),
+         (9, 11), (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (2, 4), (3, 6), (9, 12), (11, 13),
+         (3, 5), (6, 8), (7, 9), (10, 12), (3, 4), (5, 6), (7, 8), (9, 10), (11, 12), (6, 7),
+         (8, 9)],
+    15: [(0, 13), (1, 12), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7), (2, 9),
+         (3, 4), (6, 13), (8, 14), (11, 12), (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11),
+         (12, 13), (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (1, 2), (3, 12),
+         (4, 6), (5, 7), (8, 10), (9, 11), (13, 14), (1, 4), (2, 6), (5, 8), (7, 10), (9, 13),
+         (11, 14), (2, 4), (3, 6), (9, 12), (11, 13), (3, 5), (6, 8), (7, 9), (10, 12), (3, 4),
+         (5, 6), (7, 8), (9, 10), (11, 12), (6, 7), (8, 9)],
+    16: [(0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7),
+         (2, 9), (3, 4), (6, 13), (8, 14), (10, 15), (11, 12), (0, 1), (2, 3), (4, 5), (6, 8),
+         (7, 9), (10, 11), (12, 13), (14, 15), (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9),
+         (12, 14), (13, 15), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14), (1, 4),
+         (2, 6), (5, 8), (7, 10), (9, 13), (11, 14), (2, 4), (3, 6), (9, 12), (11, 13), (3, 5),
+         (6, 8), (7, 9), (10, 12), (3, 4), (5, 6), (7, 8), (9, 10), (11, 12), (6, 7), (8, 9)]
+}
+
+NETWORK_MAX_SIZE = max(SORTING_NETWORKS)
+DEFAULT_CUTOFF = 16
+
+def _compile_network(n: int, pairs: List[Tuple[int, int]]) -> Callable[[Any, int], None]:
+    names = [f"x{i}" for i in range(n)]
+    lines = [f"def network_sort_{n}(arr, low):"]
+    lines.append(f"    {', '.join(names)}, = arr[low:low + {n}]")
+    for i, j in pairs:
+        lines.append(f"    if x{j} < x{i}: x{i}, x{j} = x{j}, x{i}")
+    for i in range(n):
+        lines.append(f"    arr[low + {i}] = x{i}")
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile('\n'.join(lines), f"<sorting network {n}>", 'exec'), namespace)
+    return namespace[f"network_sort_{n}"]
+
+NETWORK_KERNELS: Dict[int, Callable[[Any, int], None]] = {
+    n: _compile_network(n, pairs) for n, pairs in SORTING_NETWORKS.items()
+}
+
+def network_sort(arr: Any, low: int = 0, high: Optional[int] = None) -> None:
+    if high is None:
+        high = len(arr) - 1
+    
+    n = high - low + 1
+    if n > 1:
+        NETWORK_KERNELS[n](arr, low)
+
+def insertion_sort(arr: Any, low: int = 0, high: Optional[int] = None) -> None:
+    if high is None:
+        high = len(arr) - 1
+    
+    for i in range(low + 1, high + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > value:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+def binary_insertion_sort(arr: Any, low: int = 0, high: Optional[int] = None) -> None:
+    if high is None:
+        high = len(arr) - 1
+    
+    for i in range(low + 1, high + 1):
+        value = arr[i]
+        if arr[i - 1] <= value:
+            continue
+        
+        position = bisect_right(arr, value, low, i - 1)
+        arr[position + 1:i + 1] = arr[position:i]
+        arr[position] = value
+
+def small_sort(arr: Any, low: int = 0, high: Optional[int] = None) -> None:
+    if high is None:
+        high = len(arr) - 1
+    
+    n = high - low + 1
+    if n > NETWORK_MAX_SIZE:
+        binary_insertion_sort(arr, low, high)
+    elif n > 1:
+        NETWORK_KERNELS[n](arr, low)
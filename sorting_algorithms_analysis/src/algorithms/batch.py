@@ -0,0 +1,72 @@
+
+from typing import List, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .base_cases import NETWORK_MAX_SIZE
+from .sorting_algorithms import SortingAlgorithm, QuickSort
+
+SEGMENTED_MIN_ARRAYS = 64
+
+_default_algorithm = QuickSort()
+
+def flatten_batch(batch: List[List[int]]) -> Tuple[Any, Any]:
+    lengths = np.fromiter((len(arr) for arr in batch), dtype=np.int64, count=len(batch))
+    offsets = np.zeros(len(batch) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    
+    if offsets[-1] == 0:
+        return np.zeros(0, dtype=np.int64), offsets
+    
+    values = np.concatenate([np.asarray(arr) for arr in batch if len(arr)])
+    if values.dtype.kind not in 'iu' or not np.can_cast(values.dtype, np.int64):
+        raise TypeError(f"Segmented sort only handles int64-compatible values, got {values.dtype}")
+    return values.astype(np.int64, copy=False), offsets
+
+def segmented_sort_flat(values: Any, offsets: Any) -> Any:
+    lengths = np.diff(offsets)
+    segment_ids = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    if len(values) == 0:
+        return values.copy()
+    
+    
+    low = int(values.min())
+    span = int(values.max()) - low + 1
+    if span * len(lengths) < 2 ** 62:
+        keys = segment_ids * span + (values - low)
+        keys.sort(kind='stable')
+        return keys % span + low
+    
+    return values[np.lexsort((values, segment_ids))]
+
+def segmented_sort(batch: List[List[int]]) -> List[List[int]]:
+    if np is None:
+        raise ImportError("segmented_sort requires numpy")
+    
+    values, offsets = flatten_batch(batch)
+    sorted_values = segmented_sort_flat(values, offsets).tolist()
+    bounds = offsets.tolist()
+    return [sorted_values[bounds[i]:bounds[i + 1]] for i in range(len(batch))]
+
+def sort_many(batch: List[List[int]], algorithm: SortingAlgorithm = None, method: str = 'auto') -> List[List[int]]:
+    if method == 'auto':
+        method = 'base_case'
+        if np is not None and len(batch) >= SEGMENTED_MIN_ARRAYS:
+            if sum(len(arr) for arr in batch) > NETWORK_MAX_SIZE * len(batch):
+                try:
+                    return segmented_sort(batch)
+                except TypeError:
+                    pass
+    
+    if method == 'segmented':
+        return segmented_sort(batch)
+    if method == 'base_case':
+        return (algorithm or _default_algorithm).sort_many(batch)
+    if method == 'per_call':
+        sort = (algorithm or _default_algorithm).sort
+        return [sort(arr) for arr in batch]
+    
+    raise ValueError(f"Unknown batch sort method: {method}")
@@ -0,0 +1,52 @@
+
+from typing import List, Any
+
+def apply_permutation(perm: List[int], *columns: Any) -> None:
+    n = len(perm)
+    for column in columns:
+        if len(column) != n:
+            raise ValueError("Every column must have the same length as the permutation")
+    if n == 0 or not columns:
+        return
+    if min(perm) < 0 or max(perm) >= n:
+        raise ValueError(f"Permutation indices must lie in [0, {n})")
+    
+    
+    try:
+        for start in range(n):
+            if perm[start] < 0:
+                continue
+            
+            current = start
+            while True:
+                source = perm[current]
+                if source < 0:
+                    raise ValueError("Permutation contains duplicate indices")
+                perm[current] = ~source
+                if source == start:
+                    break
+                current = source
+        
+        for start in range(n):
+            if perm[start] >= 0:
+                continue
+            
+            for column in columns:
+                value = column[start]
+                current = start
+                source = ~perm[current]
+                while source != start:
+                    column[current] = column[source]
+                    current = source
+                    source = ~perm[current]
+                column[current] = value
+            
+            current = start
+            while perm[current] < 0:
+                perm[current] = ~perm[current]
+                current = perm[current]
+    finally:
+        
+        for index in range(n):
+            if perm[index] < 0:
+                perm[index] = ~perm[index]
@@ -0,0 +1,75 @@
+
+from typing import Dict, List, Any
+from .sorting_algorithms import SortingAlgorithm, QuickSort, MergeSort, HeapSort, MultiwayMergeSort
+from .string_sorts import MultikeyQuickSort, BurstSort
+from .accelerated import COMPILED_AVAILABLE, ACCELERATED_CLASSES, CompiledAlgorithm
+from .sort_cache import CachedAlgorithm
+from ..utils.config import Config
+
+ALGORITHM_FACTORIES = {
+    'Quick Sort': QuickSort,
+    'Merge Sort': MergeSort,
+    'Heap Sort': HeapSort
+}
+
+OPTIONAL_FACTORIES = {
+    'Multiway Merge Sort': MultiwayMergeSort
+}
+
+STRING_ALGORITHM_FACTORIES = {
+    'Multikey Quick Sort': MultikeyQuickSort,
+    'Burst Sort': BurstSort
+}
+
+def tuned_parameters(name: str, cutoffs: Dict[str, int] = None) -> Dict[str, Any]:
+    if cutoffs is None:
+        cutoffs = Config.BASE_CASE_CUTOFFS
+    
+    parameters: Dict[str, Any] = {}
+    if name == 'Multiway Merge Sort':
+        parameters['fan_in'] = Config.MERGE_FAN_IN
+        name = 'Merge Sort'
+    if name in cutoffs:
+        parameters['cutoff'] = cutoffs[name]
+    if name == 'Heap Sort':
+        parameters['arity'] = Config.HEAP_ARITY
+    
+    return parameters
+
+def algorithm_parameters(algorithm: SortingAlgorithm) -> Dict[str, Any]:
+    while hasattr(algorithm, 'algorithm'):
+        algorithm = algorithm.algorithm
+    algorithm = getattr(algorithm, 'fallback', algorithm)
+    return {name: getattr(algorithm, name) for name in ('cutoff', 'arity', 'fan_in', 'burst_threshold')
+            if hasattr(algorithm, name)}
+
+def create_algorithms(names: List[str] = None, include_compiled: bool = False,
+                      cutoffs: Dict[str, int] = None, include_cached: bool = False) -> Dict[str, SortingAlgorithm]:
+    if names is None:
+        names = list(ALGORITHM_FACTORIES)
+    
+    factories = {**ALGORITHM_FACTORIES, **OPTIONAL_FACTORIES, **STRING_ALGORITHM_FACTORIES}
+    unknown = [name for name in names if name not in factories]
+    if unknown:
+        raise ValueError(f"Unknown algorithm(s): {', '.join(unknown)}")
+    
+    parameters = {name: tuned_parameters(name, cutoffs) for name in names}
+    algorithms = {name: factories[name](**parameters[name]) for name in names}
+    
+    if include_cached:
+        for name in names:
+            algorithm = CachedAlgorithm(factories[name](**parameters[name]), Config.SORT_CACHE_MAX_BYTES)
+            algorithms[algorithm.name] = algorithm
+    
+    if include_compiled:
+        if not COMPILED_AVAILABLE:
+            print("⚠️  Compiled algorithms not built (run build_accelerated.py); using pure Python only")
+            return algorithms
+        
+        for name in names:
+            class_name = factories[name].__name__
+            if class_name in ACCELERATED_CLASSES:
+                algorithm = CompiledAlgorithm(class_name, **parameters[name])
+                algorithms[algorithm.name] = algorithm
+    
+    return algorithms
@@ -0,0 +1,70 @@
+
+import math
+from typing import List
+from .sorting_algorithms import QuickSort, HeapSort
+
+_quick_sort = QuickSort()
+_heap_sort = HeapSort()
+
+def nth_element(arr: List[int], k: int) -> int:
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError(f"k={k} is out of range for {n} elements")
+    
+    low = 0
+    high = n - 1
+    depth_limit = 2 * int(math.log2(n)) if n > 1 else 0
+    
+    while low < high:
+        if depth_limit == 0:
+            
+            window = arr[low:high + 1]
+            _heap_sort._heap_sort(window)
+            arr[low:high + 1] = window
+            break
+        depth_limit -= 1
+        
+        pivot_index = _quick_sort._partition(arr, low, high)
+        if pivot_index == k:
+            break
+        elif pivot_index < k:
+            low = pivot_index + 1
+        else:
+            high = pivot_index - 1
+    
+    return arr[k]
+
+def quickselect(arr: List[int], k: int) -> int:
+    return nth_element(list(arr), k)
+
+def top_k(arr: List[int], k: int) -> List[int]:
+    if k <= 0:
+        return []
+    if k >= len(arr):
+        return _heap_sort.sort(list(arr))
+    
+    
+    heap = list(arr[:k])
+    _heap_sort._build_heap(heap, k)
+    
+    for i in range(k, len(arr)):
+        value = arr[i]
+        if value < heap[0]:
+            heap[0] = value
+            _heap_sort._heapify(heap, k, 0)
+    
+    
+    _heap_sort._drain_heap(heap, k)
+    return heap
+
+def partial_sort(arr: List[int], k: int) -> List[int]:
+    result = list(arr)
+    if k <= 0:
+        return result
+    if k >= len(result):
+        return _quick_sort.sort(result)
+    
+    
+    nth_element(result, k - 1)
+    _quick_sort._quick_sort(result, 0, k - 1)
+    return result
@@ -0,0 +1,219 @@
+
+import hashlib
+import operator
+import os
+import pickle
+import sys
+from array import array
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, List, Any, Optional
+from .sorting_algorithms import SortingAlgorithm
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+KEY_TYPECODE = 'q'
+
+def is_sorted_fast(arr: Any) -> bool:
+    return all(map(operator.le, arr, islice(arr, 1, None)))
+
+def _pack_ints(values: Any) -> Optional[array]:
+    if not all(type(value) is int for value in values):
+        return None
+    try:
+        return array(KEY_TYPECODE, values)
+    except OverflowError:
+        return None
+
+def content_key(arr: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(arr, memoryview):
+        digest.update(f"buffer:{arr.format}:{len(arr)}:".encode())
+        digest.update(arr.cast('B') if arr.c_contiguous else arr.tobytes())
+        return digest.hexdigest()
+    
+    
+    packed = _pack_ints(arr)
+    if packed is None:
+        digest.update(f"list:{len(arr)}:".encode())
+        digest.update(pickle.dumps(list(arr), protocol=pickle.HIGHEST_PROTOCOL))
+    else:
+        digest.update(f"ints:{len(arr)}:".encode())
+        digest.update(packed)
+    return digest.hexdigest()
+
+def _compact(result: List[Any]) -> Any:
+    packed = _pack_ints(result)
+    return packed if packed is not None else tuple(result)
+
+def _footprint(value: Any) -> int:
+    if isinstance(value, (array, bytes)):
+        return sys.getsizeof(value)
+    return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+
+class SortCache:
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir: str = None, disk_max_bytes: int = None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.entries: OrderedDict = OrderedDict()
+        self.current_bytes = 0
+        self.counts = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'sorted_inputs': 0, 'evictions': 0, 'disk_writes': 0}
+        
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+    
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.counts['hits'] += 1
+            return entry[0]
+        
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            try:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                value = None
+            if value is not None:
+                os.utime(path)
+                self.counts['disk_hits'] += 1
+                self._remember(key, value)
+                return value
+        
+        self.counts['misses'] += 1
+        return None
+    
+    def put(self, key: str, value: Any) -> None:
+        self._remember(key, value)
+        if self.disk_dir is not None:
+            self._write_disk(key, value)
+    
+    def _remember(self, key: str, value: Any) -> None:
+        size = _footprint(value)
+        if size > self.max_bytes:
+            return
+        
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous[1]
+        self.entries[key] = (value, size)
+        self.current_bytes += size
+        
+        
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.counts['evictions'] += 1
+    
+    def _write_disk(self, key: str, value: Any) -> None:
+        path = self._disk_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self.counts['disk_writes'] += 1
+        
+        if self.disk_max_bytes is not None:
+            self._trim_disk()
+    
+    def _trim_disk(self) -> None:
+        files = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith('.pkl'):
+                stat = os.stat(os.path.join(self.disk_dir, name))
+                files.append((stat.st_mtime, stat.st_size, name))
+        
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            os.remove(os.path.join(self.disk_dir, name))
+            total -= size
+    
+    def clear(self) -> None:
+        self.entries.clear()
+        self.current_bytes = 0
+    
+    def stats(self, since: Dict[str, int] = None) -> Dict[str, Any]:
+        counts = self.counts
+        if since is not None:
+            counts = {name: value - since.get(name, 0) for name, value in counts.items()}
+        lookups = counts['hits'] + counts['disk_hits'] + counts['misses']
+        return dict(counts, entries=len(self.entries), bytes=self.current_bytes, max_bytes=self.max_bytes,
+                    hit_rate=(counts['hits'] + counts['disk_hits']) / lookups if lookups else None)
+
+class CachedAlgorithm(SortingAlgorithm):
+    
+    def __init__(self, algorithm: SortingAlgorithm, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir: str = None,
+                 disk_max_bytes: int = None, cache: SortCache = None):
+        self.algorithm = algorithm
+        self.supports_buffers = algorithm.supports_buffers
+        self.cache = cache if cache is not None else SortCache(max_bytes, disk_dir, disk_max_bytes)
+    
+    def sort(self, arr: List[Any]) -> List[Any]:
+        if is_sorted_fast(arr):
+            self.cache.counts['sorted_inputs'] += 1
+            return list(arr)
+        
+        key = content_key(arr)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached.tolist() if isinstance(cached, array) else list(cached)
+        
+        result = self.algorithm.sort(arr)
+        self.cache.put(key, _compact(result))
+        return result
+    
+    def sort_buffer(self, buf: Any, out: Any = None) -> Any:
+        view = self.check_buffers(buf, out)
+        target = view if out is None else memoryview(out)
+        if is_sorted_fast(view):
+            self.cache.counts['sorted_inputs'] += 1
+            if out is not None:
+                target[:] = view
+            return buf if out is None else out
+        
+        key = content_key(view)
+        cached = self.cache.get(key)
+        if cached is not None and target.nbytes == len(cached):
+            if target.c_contiguous:
+                target.cast('B')[:] = cached
+            else:
+                target[:] = memoryview(cached).cast(target.format.lstrip('@'))
+            return buf if out is None else out
+        
+        result = self.algorithm.sort_buffer(buf, out)
+        self.cache.put(key, memoryview(result).tobytes())
+        return result
+    
+    def cache_counts(self) -> Dict[str, int]:
+        return dict(self.cache.counts)
+    
+    def cache_stats(self, since: Dict[str, int] = None) -> Dict[str, Any]:
+        return self.cache.stats(since)
+    
+    @property
+    def name(self) -> str:
+        return f"{self.algorithm.name} (cached)"
+    
+    @property
+    def time_complexity_best(self) -> str:
+        return "O(n)"
+    
+    @property
+    def time_complexity_average(self) -> str:
+        return self.algorithm.time_complexity_average
+    
+    @property
+    def time_complexity_worst(self) -> str:
+        return self.algorithm.time_complexity_worst
+    
+    @property
+    def space_complexity(self) -> str:
+        return f"{self.algorithm.space_complexity} + cache"
@@ -0,0 +1,69 @@
+
+import bisect
+from typing import List, Iterable, Iterator
+from .sorting_algorithms import SortingAlgorithm, MergeSort
+
+class IncrementalSortedList:
+    
+    def __init__(self, values: Iterable[int] = None, algorithm: SortingAlgorithm = None):
+        self.algorithm = algorithm if algorithm is not None else MergeSort()
+        self._merger = MergeSort()
+        self._items = self.algorithm.sort(list(values)) if values is not None else []
+    
+    def insert_batch(self, values: Iterable[int]) -> None:
+        batch = self.algorithm.sort(list(values))
+        if not batch:
+            return
+        
+        
+        if not self._items or self._items[-1] <= batch[0]:
+            self._items.extend(batch)
+        else:
+            self._items = self._merger._merge(self._items, batch)
+    
+    def insert(self, value: int) -> None:
+        bisect.insort_right(self._items, value)
+    
+    def rank(self, value: int) -> int:
+        return bisect.bisect_left(self._items, value)
+    
+    def count(self, value: int) -> int:
+        return bisect.bisect_right(self._items, value) - bisect.bisect_left(self._items, value)
+    
+    def range(self, low: int, high: int) -> List[int]:
+        return self._items[bisect.bisect_left(self._items, low):bisect.bisect_right(self._items, high)]
+    
+    def remove(self, value: int) -> None:
+        index = bisect.bisect_left(self._items, value)
+        if index == len(self._items) or self._items[index] != value:
+            raise ValueError(f"{value} not in IncrementalSortedList")
+        del self._items[index]
+    
+    def discard(self, value: int) -> bool:
+        try:
+            self.remove(value)
+        except ValueError:
+            return False
+        return True
+    
+    def pop(self, index: int = -1) -> int:
+        return self._items.pop(index)
+    
+    def to_list(self) -> List[int]:
+        return list(self._items)
+    
+    def __getitem__(self, index):
+        return self._items[index]
+    
+    def __contains__(self, value: int) -> bool:
+        index = bisect.bisect_left(self._items, value)
+        return index < len(self._items) and self._items[index] == value
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._items)
+    
+    def __repr__(self) -> str:
+        return f"IncrementalSortedList({self._items!r})"
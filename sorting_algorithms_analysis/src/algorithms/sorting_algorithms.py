@@ -1,13 +1,107 @@
 
-from typing import List
+import heapq
+import random
+from typing import List, Any
 from abc import ABC, abstractmethod
+from .base_cases import NETWORK_KERNELS, NETWORK_MAX_SIZE, DEFAULT_CUTOFF
+from .base_cases import binary_insertion_sort, small_sort
+
+
+NATIVE_BUFFER_FORMATS = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'n', 'N', 'f', 'd')
+
+def allocate_buffer_like(buf: Any) -> Any:
+    view = memoryview(buf)
+    raw: Any = memoryview(bytearray(view.nbytes))
+    return raw.cast(view.format)
+
+def _sort_initial_runs(arr: Any, n: int, cutoff: int) -> int:
+    if cutoff <= 1:
+        return 1
+    
+    for low in range(0, n, cutoff):
+        small_sort(arr, low, min(low + cutoff, n) - 1)
+    return cutoff
 
 class SortingAlgorithm(ABC):
     
+    supports_buffers: bool = True
+    cutoff: int = DEFAULT_CUTOFF
+    
     @abstractmethod
     def sort(self, arr: List[int]) -> List[int]:
         pass
     
+    def check_buffers(self, buf: Any, out: Any = None) -> memoryview:
+        if not self.supports_buffers:
+            raise ValueError(f"{self.name} does not support buffer input")
+        
+        view = memoryview(buf)
+        if view.ndim != 1:
+            raise ValueError(f"{self.name} only sorts one-dimensional buffers")
+        if view.format.lstrip('@') not in NATIVE_BUFFER_FORMATS:
+            raise ValueError(f"{self.name} cannot sort buffers of format {view.format!r}; "
+                             f"convert to a native-endian integer or float type first")
+        
+        if out is not None:
+            target = memoryview(out)
+            if target.ndim != 1 or target.format != view.format or len(target) != len(view):
+                raise ValueError("Output buffer must match the input length and format")
+            if target.readonly:
+                raise ValueError("Output buffer is read-only")
+        elif view.readonly:
+            raise ValueError("Cannot sort a read-only buffer in place")
+        return view
+    
+    def sort_buffer(self, buf: Any, out: Any = None) -> Any:
+        view = self.check_buffers(buf, out)
+        if out is not None:
+            target = memoryview(out)
+            target[:] = view
+            view = target
+        
+        if len(view) > 1:
+            self._sort_buffer(view)
+        
+        return buf if out is None else out
+    
+    def sort_many(self, batch: List[List[int]]) -> List[List[int]]:
+        kernels = NETWORK_KERNELS
+        cutoff = self.cutoff
+        results: List[List[int]] = []
+        append = results.append
+        
+        for arr in batch:
+            n = len(arr)
+            if n > cutoff:
+                append(self.sort(arr))
+                continue
+            
+            arr_copy = list(arr)
+            if n > NETWORK_MAX_SIZE:
+                binary_insertion_sort(arr_copy, 0, n - 1)
+            elif n > 1:
+                kernels[n](arr_copy, 0)
+            append(arr_copy)
+        
+        return results
+    
+    def argsort(self, keys: List[Any]) -> List[int]:
+        n = len(keys)
+        if n == 0:
+            return []
+        
+        
+        if all(isinstance(key, int) for key in keys):
+            packed = self.sort([key * n + index for index, key in enumerate(keys)])
+            return [value % n for value in packed]
+        
+        decorated: Any = [(key, index) for index, key in enumerate(keys)]
+        ordered: Any = self.sort(decorated)
+        return [pair[1] for pair in ordered]
+    
+    def _sort_buffer(self, view: Any) -> None:
+        raise ValueError(f"{self.name} does not support buffer input")
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -35,6 +129,9 @@ class SortingAlgorithm(ABC):
 
 class QuickSort(SortingAlgorithm):
     
+    def __init__(self, cutoff: int = DEFAULT_CUTOFF):
+        self.cutoff = cutoff
+    
     def sort(self, arr: List[int]) -> List[int]:
         if len(arr) <= 1:
             return arr.copy()
@@ -44,14 +141,21 @@ class QuickSort(SortingAlgorithm):
         self._quick_sort(arr_copy, 0, len(arr_copy) - 1)
         return arr_copy
     
+    def _sort_buffer(self, view: Any) -> None:
+        self._quick_sort(view, 0, len(view) - 1)
+    
     def _quick_sort(self, arr: List[int], low: int, high: int) -> None:
         
         stack = [(low, high)]
+        cutoff = self.cutoff
         
         while stack:
             low, high = stack.pop()
             
-            if low < high:
+            if high - low < cutoff:
+                if low < high:
+                    small_sort(arr, low, high)
+            elif low < high:
                 
                 pivot_index = self._partition(arr, low, high)
                 
@@ -67,8 +171,6 @@ class QuickSort(SortingAlgorithm):
                     stack.append((pivot_index + 1, high))
     
     def _partition(self, arr: List[int], low: int, high: int) -> int:
-        import random
-        
         
         random_index = random.randint(low, high)
         arr[random_index], arr[high] = arr[high], arr[random_index]
@@ -111,6 +213,9 @@ class QuickSort(SortingAlgorithm):
 
 class MergeSort(SortingAlgorithm):
     
+    def __init__(self, cutoff: int = DEFAULT_CUTOFF):
+        self.cutoff = cutoff
+    
     def sort(self, arr: List[int]) -> List[int]:
         if len(arr) <= 1:
             return arr.copy()
@@ -119,10 +224,54 @@ class MergeSort(SortingAlgorithm):
         arr_copy = arr.copy()
         return self._merge_sort(arr_copy)
     
+    def _sort_buffer(self, view: Any) -> None:
+        n = len(view)
+        src = view
+        dst = allocate_buffer_like(view)
+        
+        width = _sort_initial_runs(view, n, self.cutoff)
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+                self._merge_into(src, dst, low, mid, high)
+            src, dst = dst, src
+            width *= 2
+        
+        
+        if src is not view:
+            view[:] = src
+    
+    def _merge_into(self, src: memoryview, dst: memoryview, low: int, mid: int, high: int) -> None:
+        i = low
+        j = mid
+        k = low
+        
+        while i < mid and j < high:
+            left_value = src[i]
+            right_value = src[j]
+            if left_value <= right_value:
+                dst[k] = left_value
+                i += 1
+            else:
+                dst[k] = right_value
+                j += 1
+            k += 1
+        
+        
+        if i < mid:
+            dst[k:high] = src[i:mid]
+        elif j < high:
+            dst[k:high] = src[j:high]
+    
     def _merge_sort(self, arr: List[int]) -> List[int]:
         if len(arr) <= 1:
             return arr
         
+        if len(arr) <= self.cutoff:
+            small_sort(arr, 0, len(arr) - 1)
+            return arr
+        
         
         mid = len(arr) // 2
         left = self._merge_sort(arr[:mid])
@@ -132,16 +281,21 @@ class MergeSort(SortingAlgorithm):
         return self._merge(left, right)
     
     def _merge(self, left: List[int], right: List[int]) -> List[int]:
-        result = []
+        result: List[int] = []
+        append = result.append
         i = j = 0
+        left_len = len(left)
+        right_len = len(right)
         
         
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                result.append(left[i])
+        while i < left_len and j < right_len:
+            left_value = left[i]
+            right_value = right[j]
+            if left_value <= right_value:
+                append(left_value)
                 i += 1
             else:
-                result.append(right[j])
+                append(right_value)
                 j += 1
         
         
@@ -170,31 +324,143 @@ class MergeSort(SortingAlgorithm):
     def space_complexity(self) -> str:
         return "O(n)"
 
-class HeapSort(SortingAlgorithm):
+class MultiwayMergeSort(SortingAlgorithm):
+    
+    def __init__(self, fan_in: int = 4, cutoff: int = DEFAULT_CUTOFF):
+        if fan_in < 2:
+            raise ValueError("Merge fan-in must be at least 2")
+        self.fan_in = fan_in
+        self.cutoff = cutoff
+        self.last_passes = 0
     
     def sort(self, arr: List[int]) -> List[int]:
         if len(arr) <= 1:
+            self.last_passes = 0
             return arr.copy()
         
         
         arr_copy = arr.copy()
-        self._heap_sort(arr_copy)
+        self._multiway_sort(arr_copy, arr.copy())
         return arr_copy
     
-    def _heap_sort(self, arr: List[int]) -> None:
+    def _sort_buffer(self, view: Any) -> None:
+        self._multiway_sort(view, allocate_buffer_like(view))
+    
+    def _multiway_sort(self, arr: Any, scratch: Any) -> None:
         n = len(arr)
+        src = arr
+        dst = scratch
+        passes = 0
+        
+        width = _sort_initial_runs(arr, n, self.cutoff)
+        while width < n:
+            span = width * self.fan_in
+            for low in range(0, n, span):
+                high = min(low + span, n)
+                runs = [(start, min(start + width, high)) for start in range(low, high, width)]
+                self._kway_merge(src, dst, low, runs)
+            src, dst = dst, src
+            width = span
+            passes += 1
+        
+        
+        if src is not arr:
+            arr[:] = src
+        self.last_passes = passes
+    
+    def _kway_merge(self, src: Any, dst: Any, k: int, runs: List[tuple]) -> None:
+        positions = [start for start, _ in runs]
+        ends = [end for _, end in runs]
+        
+        
+        heap = [(src[start], r) for r, start in enumerate(positions)]
+        heapq.heapify(heap)
+        heapreplace = heapq.heapreplace
+        heappop = heapq.heappop
+        
+        while len(heap) > 1:
+            value, r = heap[0]
+            dst[k] = value
+            k += 1
+            
+            pos = positions[r] + 1
+            if pos < ends[r]:
+                positions[r] = pos
+                heapreplace(heap, (src[pos], r))
+            else:
+                heappop(heap)
+        
         
+        _, r = heap[0]
+        dst[k:k + ends[r] - positions[r]] = src[positions[r]:ends[r]]
+    
+    @property
+    def name(self) -> str:
+        return f"{self.fan_in}-way Merge Sort"
+    
+    @property
+    def time_complexity_best(self) -> str:
+        return "O(n log n)"
+    
+    @property
+    def time_complexity_average(self) -> str:
+        return "O(n log n)"
+    
+    @property
+    def time_complexity_worst(self) -> str:
+        return "O(n log n)"
+    
+    @property
+    def space_complexity(self) -> str:
+        return "O(n)"
+
+class HeapSort(SortingAlgorithm):
+    
+    def __init__(self, cutoff: int = DEFAULT_CUTOFF, arity: int = 2):
+        if arity < 2:
+            raise ValueError("Heap arity must be at least 2")
+        self.cutoff = cutoff
+        self.arity = arity
+    
+    def sort(self, arr: List[int]) -> List[int]:
+        if len(arr) <= 1:
+            return arr.copy()
         
-        for i in range(n // 2 - 1, -1, -1):
-            self._heapify(arr, n, i)
         
+        arr_copy = arr.copy()
+        self._heap_sort(arr_copy)
+        return arr_copy
+    
+    def _sort_buffer(self, view: Any) -> None:
+        self._heap_sort(view)
+    
+    def _heap_sort(self, arr: List[int]) -> None:
+        n = len(arr)
+        if n <= self.cutoff:
+            small_sort(arr, 0, n - 1)
+            return
         
-        for i in range(n - 1, 0, -1):
+        self._build_heap(arr, n)
+        self._drain_heap(arr, n)
+    
+    def _build_heap(self, arr: List[int], n: int) -> None:
+        heapify = self._heapify if self.arity == 2 else self._heapify_wide
+        for i in range((n - 2) // self.arity, -1, -1):
+            heapify(arr, n, i)
+    
+    def _drain_heap(self, arr: List[int], n: int) -> None:
+        heapify = self._heapify if self.arity == 2 else self._heapify_wide
+        stop = max(self.cutoff, 1)
+        for i in range(n - 1, stop - 1, -1):
             
             arr[0], arr[i] = arr[i], arr[0]
             
             
-            self._heapify(arr, i, 0)
+            heapify(arr, i, 0)
+        
+        
+        if stop > 1:
+            small_sort(arr, 0, min(stop, n) - 1)
     
     def _heapify(self, arr: List[int], n: int, i: int) -> None:
         largest = i  
@@ -216,6 +482,31 @@ class HeapSort(SortingAlgorithm):
             
             self._heapify(arr, n, largest)
     
+    def _heapify_wide(self, arr: List[int], n: int, i: int) -> None:
+        arity = self.arity
+        value = arr[i]
+        
+        while True:
+            first = arity * i + 1
+            if first >= n:
+                break
+            
+            
+            largest = first
+            largest_value = arr[first]
+            for child in range(first + 1, min(first + arity, n)):
+                child_value = arr[child]
+                if child_value > largest_value:
+                    largest = child
+                    largest_value = child_value
+            
+            if largest_value <= value:
+                break
+            arr[i] = largest_value
+            i = largest
+        
+        arr[i] = value
+    
     @property
     def name(self) -> str:
         return "Heap Sort"
@@ -0,0 +1,252 @@
+
+from os.path import commonprefix
+from typing import List, Any, Dict, Optional
+from .base_cases import DEFAULT_CUTOFF, small_sort
+from .sorting_algorithms import SortingAlgorithm
+
+DEFAULT_BURST_THRESHOLD = 64
+
+def _argsort_strings(sort, keys: List[str]) -> List[int]:
+    positions: Dict[str, List[int]] = {}
+    for index, key in enumerate(keys):
+        if key in positions:
+            positions[key].append(index)
+        else:
+            positions[key] = [index]
+    
+    
+    result: List[int] = []
+    for key in sort(list(positions)):
+        result.extend(positions[key])
+    return result
+
+class MultikeyQuickSort(SortingAlgorithm):
+    
+    supports_buffers = False
+    
+    def __init__(self, cutoff: int = DEFAULT_CUTOFF):
+        self.cutoff = cutoff
+    
+    def sort(self, arr: List[str]) -> List[str]:
+        if len(arr) <= 1:
+            return arr.copy()
+        
+        
+        arr_copy = arr.copy()
+        self._multikey_sort(arr_copy, 0, len(arr_copy) - 1, 0)
+        return arr_copy
+    
+    def argsort(self, keys: List[str]) -> List[int]:
+        return _argsort_strings(self.sort, keys)
+    
+    def _multikey_sort(self, arr: List[str], low: int, high: int, depth: int) -> None:
+        
+        stack = [(low, high, depth)]
+        cutoff = self.cutoff
+        
+        while stack:
+            low, high, depth = stack.pop()
+            
+            if high - low < cutoff:
+                
+                if low < high:
+                    small_sort(arr, low, high)
+                continue
+            if low >= high:
+                continue
+            
+            
+            lt, gt = self._partition(arr, low, high, depth)
+            if len(arr[lt]) <= depth:
+                stack.append((low, lt - 1, depth))
+                stack.append((gt + 1, high, depth))
+                continue
+            
+            if lt == low and gt == high:
+                
+                segment = arr[low:high + 1]
+                stack.append((low, high, len(commonprefix([min(segment), max(segment)]))))
+                continue
+            
+            stack.append((low, lt - 1, depth))
+            stack.append((gt + 1, high, depth))
+            stack.append((lt, gt, depth + 1))
+    
+    def _partition(self, arr: List[str], low: int, high: int, depth: int) -> tuple:
+        
+        pivot_string = arr[(low + high) // 2]
+        pivot = ord(pivot_string[depth]) if depth < len(pivot_string) else -1
+        
+        lt = i = low
+        gt = high
+        while i <= gt:
+            value = arr[i]
+            char = ord(value[depth]) if depth < len(value) else -1
+            if char < pivot:
+                arr[lt], arr[i] = value, arr[lt]
+                lt += 1
+                i += 1
+            elif char > pivot:
+                arr[gt], arr[i] = value, arr[gt]
+                gt -= 1
+            else:
+                i += 1
+        
+        return lt, gt
+    
+    @property
+    def name(self) -> str:
+        return "Multikey Quick Sort"
+    
+    @property
+    def time_complexity_best(self) -> str:
+        return "O(n log n + D)"
+    
+    @property
+    def time_complexity_average(self) -> str:
+        return "O(n log n + D)"
+    
+    @property
+    def time_complexity_worst(self) -> str:
+        return "O(n² + D)"
+    
+    @property
+    def space_complexity(self) -> str:
+        return "O(log n)"
+
+class _TrieNode:
+    
+    __slots__ = ('depth', 'ended', 'children', 'limits')
+    
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.ended: List[str] = []
+        self.children: Dict[str, Any] = {}
+        self.limits: Dict[str, int] = {}
+
+class BurstSort(SortingAlgorithm):
+    
+    supports_buffers = False
+    
+    def __init__(self, burst_threshold: int = DEFAULT_BURST_THRESHOLD, cutoff: int = DEFAULT_CUTOFF):
+        if burst_threshold < 1:
+            raise ValueError("Burst threshold must be positive")
+        self.burst_threshold = burst_threshold
+        self.bucket_sorter = MultikeyQuickSort(cutoff)
+    
+    def sort(self, arr: List[str]) -> List[str]:
+        if len(arr) <= 1:
+            return arr.copy()
+        
+        
+        root = _TrieNode(0)
+        for value in arr:
+            self._insert(root, value)
+        
+        result: List[str] = []
+        self._collect(root, result)
+        return result
+    
+    def argsort(self, keys: List[str]) -> List[int]:
+        return _argsort_strings(self.sort, keys)
+    
+    def _insert(self, node: _TrieNode, value: str) -> None:
+        depth = 0
+        length = len(value)
+        
+        while True:
+            if depth == length:
+                node.ended.append(value)
+                return
+            
+            char = value[depth]
+            child = node.children.get(char)
+            if child is None:
+                node.children[char] = [value]
+                return
+            
+            if isinstance(child, list):
+                child.append(value)
+                if len(child) > node.limits.get(char, self.burst_threshold):
+                    self._burst(node, char)
+                return
+            
+            node = child
+            depth += 1
+    
+    def _split(self, bucket: List[str], depth: int) -> Optional[_TrieNode]:
+        node = _TrieNode(depth)
+        children = node.children
+        for value in bucket:
+            if depth == len(value):
+                node.ended.append(value)
+                continue
+            
+            char = value[depth]
+            if char in children:
+                children[char].append(value)
+            else:
+                children[char] = [value]
+        
+        
+        if not node.ended and len(children) == 1:
+            return None
+        return node
+    
+    def _burst(self, parent: _TrieNode, char: str) -> None:
+        pending = [(parent, char)]
+        
+        while pending:
+            parent, char = pending.pop()
+            bucket = parent.children[char]
+            node = self._split(bucket, parent.depth + 1)
+            
+            
+            if node is None:
+                parent.limits[char] = 2 * len(bucket)
+                continue
+            
+            parent.children[char] = node
+            for child_char, child in node.children.items():
+                if len(child) > self.burst_threshold:
+                    pending.append((node, child_char))
+    
+    def _collect(self, root: _TrieNode, result: List[str]) -> None:
+        bucket_sort = self.bucket_sorter._multikey_sort
+        stack: List[tuple] = [(root, 0)]
+        
+        while stack:
+            entry, depth = stack.pop()
+            
+            if isinstance(entry, _TrieNode):
+                result.extend(entry.ended)
+                
+                
+                children = entry.children
+                for char in sorted(children, reverse=True):
+                    stack.append((children[char], entry.depth + 1))
+                continue
+            
+            start = len(result)
+            result.extend(entry)
+            bucket_sort(result, start, len(result) - 1, depth)
+    
+    @property
+    def name(self) -> str:
+        return "Burst Sort"
+    
+    @property
+    def time_complexity_best(self) -> str:
+        return "O(n + D)"
+    
+    @property
+    def time_complexity_average(self) -> str:
+        return "O(n + D)"
+    
+    @property
+    def time_complexity_worst(self) -> str:
+        return "O(n·b + D)"
+    
+    @property
+    def space_complexity(self) -> str:
+        return "O(n)"
@@ -0,0 +1,115 @@
+
+import math
+import sys
+from array import array
+from typing import Dict, List, Any
+from ..data_generation.dataset_pipeline import DatasetPipeline
+from ..utils.config import Config
+from ..utils.environment import cache_sizes
+
+def element_footprint(compact: bool = False) -> int:
+    if compact:
+        return array(Config.COMPACT_TYPECODE).itemsize
+    
+    
+    return 8 + sys.getsizeof(2 ** 30)
+
+def detect_caches() -> Dict[str, Any]:
+    caches = cache_sizes()
+    if caches:
+        return {'source': 'sysfs', 'sizes': caches}
+    return {'source': 'default', 'sizes': dict(Config.DEFAULT_CACHE_SIZES)}
+
+def cache_boundaries(caches: Dict[str, int], bytes_per_element: int) -> Dict[str, int]:
+    return {name: max(1, capacity // bytes_per_element) for name, capacity in caches.items()}
+
+def size_ladder(boundaries: Dict[str, int], min_size: int = None, max_size: int = None,
+                points_per_boundary: int = None, span: float = None, background_factor: float = None) -> List[int]:
+    if min_size is None:
+        min_size = Config.CACHE_SWEEP_MIN_SIZE
+    if max_size is None:
+        max_size = Config.CACHE_SWEEP_MAX_SIZE
+    if points_per_boundary is None:
+        points_per_boundary = Config.CACHE_SWEEP_POINTS_PER_BOUNDARY
+    if span is None:
+        span = Config.CACHE_SWEEP_SPAN
+    if background_factor is None:
+        background_factor = Config.CACHE_SWEEP_BACKGROUND_FACTOR
+    
+    sizes = {max_size}
+    size = float(min_size)
+    while size < max_size:
+        sizes.add(int(size))
+        size *= background_factor
+    
+    
+    for center in boundaries.values():
+        for step in range(points_per_boundary):
+            exponent = 2 * step / max(points_per_boundary - 1, 1) - 1
+            size = int(round(center * span ** exponent))
+            if min_size <= size <= max_size:
+                sizes.add(size)
+    
+    return sorted(sizes)
+
+def normalized_cost(mean_time: float, size: int) -> float:
+    return mean_time / (size * math.log2(max(size, 2))) * 1e9
+
+def boundary_slowdowns(results: Dict[str, Any], boundaries: Dict[str, int], span: float = None) -> Dict[str, Any]:
+    if span is None:
+        span = Config.CACHE_SWEEP_SPAN
+    
+    slowdowns: Dict[str, Any] = {}
+    for algo_name, type_data in results['results'].items():
+        slowdowns[algo_name] = {}
+        for data_type, size_data in type_data.items():
+            costs = {int(size): normalized_cost(performance['statistics']['mean'], int(size))
+                     for size, performance in size_data.items()}
+            
+            cell = {}
+            for name, center in boundaries.items():
+                below = [cost for size, cost in costs.items() if center / span <= size < center]
+                above = [cost for size, cost in costs.items() if center < size <= center * span]
+                if below and above:
+                    cell[name] = (sum(above) / len(above)) / (sum(below) / len(below))
+            slowdowns[algo_name][data_type] = cell
+    
+    return slowdowns
+
+def run_cache_sweep(analyzer, algorithms: Dict[str, Any], data_types: List[str] = None, compact: bool = False,
+                    max_size: int = None) -> Dict[str, Any]:
+    if data_types is None:
+        data_types = Config.CACHE_SWEEP_DATA_TYPES
+    if max_size is None:
+        max_size = Config.CACHE_SWEEP_MAX_SIZE
+    
+    caches = detect_caches()
+    bytes_per_element = element_footprint(compact)
+    boundaries = cache_boundaries(caches['sizes'], bytes_per_element)
+    sizes = size_ladder(boundaries, max_size=max_size)
+    
+    print(f"🧱 Cache hierarchy ({caches['source']}), {bytes_per_element} bytes per element:")
+    for name, capacity in caches['sizes'].items():
+        note = '' if boundaries[name] <= max_size else f" (beyond --max-size {max_size:,}, not swept)"
+        print(f"   {name:<4} {capacity // 1024:>8,} KiB ≈ {boundaries[name]:>12,} elements{note}")
+    print(f"📏 {len(sizes)} sizes from {sizes[0]:,} to {sizes[-1]:,}")
+    
+    pipeline = DatasetPipeline(sizes, compact=compact, data_types=data_types)
+    results = analyzer.analyze_algorithms(algorithms, pipeline, adaptive=True)
+    
+    slowdowns = boundary_slowdowns(results, boundaries)
+    results['metadata']['cache_sweep'] = {
+        'cache_source': caches['source'],
+        'cache_sizes': caches['sizes'],
+        'bytes_per_element': bytes_per_element,
+        'boundaries': boundaries,
+        'slowdowns': slowdowns
+    }
+    
+    print("\n🧱 Slowdown in ns/(n·log n) across each cache boundary:")
+    for algo_name, type_data in slowdowns.items():
+        for data_type, cell in type_data.items():
+            crossings = '  '.join(f"{name}={ratio:.2f}x" for name, ratio in cell.items()) or 'no boundary in range'
+            print(f"   {algo_name:<20} {data_type:<14} {crossings}")
+    
+    return results
@@ -0,0 +1,136 @@
+
+import json
+import math
+import os
+import platform
+import time
+from typing import Dict, List, Any
+from ..algorithms.registry import ALGORITHM_FACTORIES
+from ..algorithms.sorting_algorithms import QuickSort, HeapSort, MultiwayMergeSort
+from ..utils.config import Config
+from ..utils.environment import collect_environment
+from ..utils.helpers import generate_random_array, format_time
+
+def _best_time(sort, arrays: List[List[int]], num_trials: int) -> float:
+    best = float('inf')
+    for trial in range(num_trials):
+        start_time = time.perf_counter()
+        for arr in arrays:
+            sort(arr)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+def _sweep(label: str, factory, candidates: List[Any], arrays: List[List[int]], num_trials: int) -> Dict[str, Any]:
+    timings = {candidate: _best_time(factory(candidate).sort, arrays, num_trials) for candidate in candidates}
+    best = min(timings, key=timings.get)
+    
+    baseline = timings[candidates[0]]
+    print(f"   {label:<28} best={str(best):<5} {format_time(timings[best])} "
+          f"({baseline / timings[best]:.2f}x vs {candidates[0]})")
+    return {'best': best, 'timings': {str(candidate): timing for candidate, timing in timings.items()}}
+
+def calibrate_cutoffs(arrays: List[List[int]], candidates: List[int] = None,
+                      num_trials: int = None) -> Dict[str, Dict[str, Any]]:
+    if candidates is None:
+        candidates = Config.CUTOFF_CANDIDATES
+    if num_trials is None:
+        num_trials = Config.CALIBRATION_TRIALS
+    
+    return {algo_name: _sweep(f"{algo_name} cutoff", factory, candidates, arrays, num_trials)
+            for algo_name, factory in ALGORITHM_FACTORIES.items()}
+
+def calibrate_heap_arity(arrays: List[List[int]], cutoff: int, candidates: List[int] = None,
+                         num_trials: int = None) -> Dict[str, Any]:
+    if candidates is None:
+        candidates = Config.HEAP_ARITY_CANDIDATES
+    if num_trials is None:
+        num_trials = Config.CALIBRATION_TRIALS
+    
+    return _sweep("Heap Sort arity", lambda arity: HeapSort(cutoff, arity), candidates, arrays, num_trials)
+
+def calibrate_merge_fan_in(arrays: List[List[int]], cutoff: int, candidates: List[int] = None,
+                           num_trials: int = None) -> Dict[str, Any]:
+    if candidates is None:
+        candidates = Config.MERGE_FAN_IN_CANDIDATES
+    if num_trials is None:
+        num_trials = Config.CALIBRATION_TRIALS
+    
+    return _sweep("Multiway Merge Sort fan-in", lambda fan_in: MultiwayMergeSort(fan_in, cutoff),
+                  candidates, arrays, num_trials)
+
+def calibrate_num_trials(size: int = None, samples: int = None) -> Dict[str, Any]:
+    if size is None:
+        size = max(Config.CALIBRATION_SIZES)
+    if samples is None:
+        samples = Config.CALIBRATION_NOISE_SAMPLES
+    
+    
+    sort = QuickSort().sort
+    data = generate_random_array(size)
+    times = []
+    for sample in range(samples):
+        start_time = time.perf_counter()
+        sort(data)
+        times.append(time.perf_counter() - start_time)
+    
+    mean_time = sum(times) / len(times)
+    std_dev = math.sqrt(sum((t - mean_time) ** 2 for t in times) / (len(times) - 1))
+    cv = std_dev / mean_time
+    
+    
+    needed = math.ceil((1.96 * cv / Config.TARGET_RELATIVE_ERROR) ** 2)
+    num_trials = min(max(needed, Config.MIN_TRIALS), Config.MAX_TRIALS)
+    
+    print(f"   {'Timing noise':<28} cv={cv:.3f} -> num_trials={num_trials}")
+    return {'best': num_trials, 'coefficient_of_variation': cv, 'samples': samples}
+
+def run_calibration(sizes: List[int] = None, num_trials: int = None) -> Dict[str, Any]:
+    if sizes is None:
+        sizes = Config.CALIBRATION_SIZES
+    if num_trials is None:
+        num_trials = Config.CALIBRATION_TRIALS
+    
+    arrays = [generate_random_array(size) for size in sizes]
+    print(f"🎛️  Calibrating on {platform.node()} with sizes {sizes}:")
+    
+    cutoffs = calibrate_cutoffs(arrays, num_trials=num_trials)
+    heap_arity = calibrate_heap_arity(arrays, cutoffs['Heap Sort']['best'], num_trials=num_trials)
+    merge_fan_in = calibrate_merge_fan_in(arrays, cutoffs['Merge Sort']['best'], num_trials=num_trials)
+    trials = calibrate_num_trials(max(sizes))
+    
+    return {
+        'version': Config.TUNING_PROFILE_VERSION,
+        'hostname': platform.node(),
+        'python_version': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'parameters': {
+            'cutoffs': {algo_name: sweep['best'] for algo_name, sweep in cutoffs.items()},
+            'heap_arity': heap_arity['best'],
+            'merge_fan_in': merge_fan_in['best'],
+            'num_trials': trials['best']
+        },
+        'sweeps': {
+            'cutoffs': cutoffs,
+            'heap_arity': heap_arity,
+            'merge_fan_in': merge_fan_in,
+            'num_trials': trials
+        },
+        'settings': {'sizes': list(sizes), 'num_trials': num_trials},
+        'environment': collect_environment()
+    }
+
+def save_profile(profile: Dict[str, Any], filepath: str = None) -> str:
+    if filepath is None:
+        filepath = Config.tuning_profile_path(profile['hostname'])
+    
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'w') as f:
+        json.dump(profile, f, indent=2)
+    return filepath
+
+def calibrate_and_apply(sizes: List[int] = None, num_trials: int = None) -> Dict[str, Any]:
+    profile = run_calibration(sizes, num_trials)
+    filepath = save_profile(profile)
+    Config.load_tuning_profile(filepath)
+    print(f"   Tuning profile saved to {filepath}")
+    return profile
@@ -0,0 +1,284 @@
+
+import multiprocessing
+import os
+import secrets
+import socket
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Listener, Client
+from typing import Dict, List, Any, Tuple
+from ..algorithms.registry import ALGORITHM_FACTORIES, create_algorithms
+from ..data_generation.data_generator import DataGenerator, cell_seed
+from ..utils.config import Config
+from ..utils.environment import collect_environment, compare_environments
+from .performance_analyzer import PerformanceAnalyzer
+
+Cell = Tuple[str, str, int]
+
+class BenchmarkCoordinator:
+    
+    def __init__(self, algorithm_names: List[str] = None, data_types: List[str] = None,
+                 data_sizes: List[int] = None, seed: int = None, num_trials: int = None,
+                 address: Tuple[str, int] = None, authkey: bytes = None):
+        self.config = Config()
+        self.algorithm_names = algorithm_names or list(ALGORITHM_FACTORIES)
+        self.data_types = data_types or self.config.DATA_TYPES
+        self.data_sizes = data_sizes or self.config.DATA_SIZES
+        self.seed = seed if seed is not None else self.config.DISTRIBUTED_SEED
+        self.num_trials = num_trials or self.config.NUM_TRIALS
+        self.tuning = dict(self.config.tuning_parameters(), num_trials=self.num_trials)
+        self.address = address or (self.config.DISTRIBUTED_HOST, self.config.DISTRIBUTED_PORT)
+        self.authkey = authkey or secrets.token_hex(self.config.DISTRIBUTED_AUTHKEY_BYTES).encode()
+        
+        self.pending = deque(self._cells())
+        self.total_cells = len(self.pending)
+        self.in_flight: Dict[Cell, str] = {}
+        self.completed: Dict[Cell, Dict[str, Any]] = {}
+        self.worker_environments: Dict[str, Dict[str, Any]] = {}
+        self.worker_cells: Dict[str, int] = {}
+        
+        self.listener = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._started_at = None
+    
+    def _cells(self) -> List[Cell]:
+        return [(algo_name, data_type, size)
+                for data_type in self.data_types
+                for size in self.data_sizes
+                for algo_name in self.algorithm_names]
+    
+    def start(self) -> Tuple[str, int]:
+        self.listener = Listener(self.address, authkey=self.authkey)
+        self.address = self.listener.address
+        self._started_at = time.perf_counter()
+        
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        print(f"🛰️  Coordinator listening on {self.address[0]}:{self.address[1]} "
+              f"({self.total_cells} cells, seed {self.seed})")
+        return self.address
+    
+    def _accept_loop(self) -> None:
+        while not self._done.is_set():
+            try:
+                conn = self.listener.accept()
+            except Exception:
+                if self._done.is_set():
+                    return
+                continue
+            
+            threading.Thread(target=self._serve_worker, args=(conn,), daemon=True).start()
+    
+    def _serve_worker(self, conn) -> None:
+        worker_id = None
+        cell = None
+        
+        try:
+            while True:
+                message = conn.recv()
+                
+                if message['type'] == 'hello':
+                    worker_id = message['worker_id']
+                    with self._lock:
+                        self.worker_environments[worker_id] = message['environment']
+                        self.worker_cells.setdefault(worker_id, 0)
+                    print(f"   ➕ Worker {worker_id} connected")
+                elif message['type'] == 'result':
+                    self._complete(tuple(message['cell']), message['performance'], worker_id)
+                    cell = None
+                
+                cell = self._next_cell(worker_id)
+                if cell is None:
+                    if self._done.is_set():
+                        conn.send({'type': 'done'})
+                        return
+                    conn.send({'type': 'wait', 'interval': self.config.DISTRIBUTED_POLL_INTERVAL})
+                    continue
+                
+                conn.send({
+                    'type': 'cell',
+                    'cell': cell,
+                    'seed': cell_seed(self.seed, cell[1], cell[2]),
+                    'num_trials': self.num_trials,
+                    'tuning': self.tuning
+                })
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+            if cell is not None:
+                self._requeue(cell, worker_id)
+    
+    def _next_cell(self, worker_id: str):
+        with self._lock:
+            if not self.pending:
+                return None
+            
+            cell = self.pending.popleft()
+            self.in_flight[cell] = worker_id
+            return cell
+    
+    def _complete(self, cell: Cell, performance: Dict[str, Any], worker_id: str) -> None:
+        with self._lock:
+            self.in_flight.pop(cell, None)
+            if cell in self.completed:
+                return
+            
+            self.completed[cell] = performance
+            self.worker_cells[worker_id] = self.worker_cells.get(worker_id, 0) + 1
+            progress = len(self.completed) / self.total_cells * 100
+            
+            if len(self.completed) == self.total_cells:
+                self._done.set()
+        
+        algo_name, data_type, size = cell
+        print(f"   [{progress:5.1f}%] {algo_name} / {data_type} / {size:,} from {worker_id}")
+    
+    def _requeue(self, cell: Cell, worker_id: str) -> None:
+        with self._lock:
+            if cell in self.completed or self.in_flight.get(cell) != worker_id:
+                return
+            
+            del self.in_flight[cell]
+            self.pending.appendleft(cell)
+        print(f"   ↩️  Worker {worker_id} dropped; requeued {cell}")
+    
+    def wait(self, timeout: float = None) -> Dict[str, Any]:
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Only {len(self.completed)} of {self.total_cells} cells completed")
+        
+        
+        time.sleep(self.config.DISTRIBUTED_POLL_INTERVAL * 2)
+        self.listener.close()
+        return self.build_results()
+    
+    def run(self, timeout: float = None) -> Dict[str, Any]:
+        if self.listener is None:
+            self.start()
+        return self.wait(timeout)
+    
+    def build_results(self) -> Dict[str, Any]:
+        results = {
+            'algorithms': list(self.algorithm_names),
+            'data_types': list(self.data_types),
+            'data_sizes': sorted(self.data_sizes),
+            'results': {}
+        }
+        
+        for algo_name in self.algorithm_names:
+            results['results'][algo_name] = {}
+            for data_type in self.data_types:
+                results['results'][algo_name][data_type] = {}
+                for size in results['data_sizes']:
+                    results['results'][algo_name][data_type][size] = self.completed[(algo_name, data_type, size)]
+        
+        
+        warnings = []
+        environments = list(self.worker_environments.items())
+        for worker_id, environment in environments[1:]:
+            for mismatch in compare_environments(environments[0][1], environment):
+                warnings.append(f"worker {worker_id} differs from {environments[0][0]}: {mismatch}")
+        
+        results['metadata'] = {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'num_trials_per_test': self.num_trials,
+            'total_tests_run': self.total_cells,
+            'data_representation': 'list',
+            'environment': collect_environment(),
+            'comparability_warnings': warnings,
+            'seed': self.seed,
+            'tuning': self.tuning,
+            'wall_time': time.perf_counter() - self._started_at,
+            'workers': {
+                worker_id: {'cells': self.worker_cells.get(worker_id, 0), 'environment': environment}
+                for worker_id, environment in self.worker_environments.items()
+            }
+        }
+        
+        return results
+
+class BenchmarkWorker:
+    
+    def __init__(self, address: Tuple[str, int] = None, authkey: bytes = None, worker_id: str = None):
+        self.config = Config()
+        if not authkey:
+            raise ValueError("Workers need the coordinator's authkey")
+        self.address = address or (self.config.DISTRIBUTED_HOST, self.config.DISTRIBUTED_PORT)
+        self.authkey = authkey
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.analyzer = PerformanceAnalyzer()
+        self.algorithms = {}
+        self.tuning = None
+    
+    def _algorithm(self, algo_name: str):
+        if algo_name not in self.algorithms:
+            self.algorithms.update(create_algorithms([algo_name]))
+        return self.algorithms[algo_name]
+    
+    def run(self) -> int:
+        conn = Client(self.address, authkey=self.authkey)
+        cells_done = 0
+        dataset_key = None
+        data = None
+        
+        try:
+            conn.send({'type': 'hello', 'worker_id': self.worker_id, 'environment': collect_environment()})
+            message = conn.recv()
+            
+            while message['type'] != 'done':
+                if message['type'] == 'wait':
+                    time.sleep(message['interval'])
+                    conn.send({'type': 'request'})
+                    message = conn.recv()
+                    continue
+                
+                algo_name, data_type, size = message['cell']
+                if message['tuning'] != self.tuning:
+                    Config.apply_tuning_parameters(message['tuning'])
+                    self.tuning = message['tuning']
+                    self.algorithms = {}
+                if dataset_key != (data_type, size, message['seed']):
+                    
+                    data = DataGenerator(message['seed']).generate_dataset(data_type, size)
+                    dataset_key = (data_type, size, message['seed'])
+                
+                performance = self.analyzer.measure_algorithm_performance(
+                    self._algorithm(algo_name), data, message['num_trials'])
+                cells_done += 1
+                
+                conn.send({'type': 'result', 'cell': message['cell'], 'performance': performance})
+                message = conn.recv()
+        finally:
+            conn.close()
+        
+        return cells_done
+
+def _run_worker(address: Tuple[str, int], authkey: bytes, worker_id: str) -> None:
+    BenchmarkWorker(address, authkey, worker_id).run()
+
+def run_local_cluster(num_workers: int = None, timeout: float = None, **coordinator_options) -> Dict[str, Any]:
+    if num_workers is None:
+        num_workers = Config.DISTRIBUTED_LOCAL_WORKERS
+    
+    coordinator_options.setdefault('address', ('127.0.0.1', 0))
+    coordinator = BenchmarkCoordinator(**coordinator_options)
+    address = coordinator.start()
+    
+    context = multiprocessing.get_context('spawn')
+    workers = [
+        context.Process(target=_run_worker, args=(address, coordinator.authkey, f"local-{i + 1}"), daemon=True)
+        for i in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    
+    try:
+        results = coordinator.wait(timeout)
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+    
+    return results
@@ -0,0 +1,157 @@
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Any, Optional
+from ..utils.config import Config
+
+PROBE_SCRIPT = (
+    "import platform, sys; "
+    "free = not getattr(sys, '_is_gil_enabled', lambda: True)(); "
+    "jit = getattr(getattr(sys, '_jit', None), 'is_enabled', lambda: False)(); "
+    "print(platform.python_implementation(), platform.python_version(), "
+    "'free-threaded' if free else '', 'jit' if jit else '')"
+)
+
+def probe_interpreter(path: str, timeout: float = 30) -> Optional[str]:
+    try:
+        completed = subprocess.run([path, '-c', PROBE_SCRIPT], capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    
+    if completed.returncode != 0:
+        return None
+    
+    words = completed.stdout.split()
+    if len(words) < 2:
+        return None
+    
+    label = f"{words[0]} {words[1]}"
+    if len(words) > 2:
+        label += f" ({', '.join(words[2:])})"
+    return label
+
+def discover_interpreters(candidates: List[str] = None) -> Dict[str, str]:
+    if candidates is None:
+        candidates = Config.INTERPRETERS
+    
+    interpreters = {}
+    seen_paths = set()
+    
+    for candidate in candidates:
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path is None or not os.path.exists(path):
+            print(f"   ⏭️  {candidate}: not installed, skipping")
+            continue
+        
+        real_path = os.path.realpath(path)
+        if real_path in seen_paths:
+            continue
+        seen_paths.add(real_path)
+        
+        label = probe_interpreter(path)
+        if label is None:
+            print(f"   ⏭️  {candidate}: could not be started, skipping")
+            continue
+        
+        if label in interpreters:
+            label = f"{label} [{candidate}]"
+        interpreters[label] = path
+    
+    return interpreters
+
+class InterpreterComparison:
+    
+    def __init__(self, interpreters: List[str] = None, seed: int = None, data_sizes: List[int] = None,
+                 num_trials: int = None, algorithm_names: List[str] = None, timeout: float = None):
+        self.config = Config()
+        self.candidates = interpreters or self.config.INTERPRETERS
+        self.seed = seed if seed is not None else self.config.DISTRIBUTED_SEED
+        self.data_sizes = data_sizes or self.config.DATA_SIZES
+        self.num_trials = num_trials or self.config.NUM_TRIALS
+        self.tuning = dict(self.config.tuning_parameters(), num_trials=self.num_trials)
+        self.algorithm_names = algorithm_names
+        self.timeout = timeout or self.config.INTERPRETER_RUN_TIMEOUT
+    
+    def _command(self, path: str, output: str) -> List[str]:
+        command = [path, '-m', 'src.analysis.matrix_runner', '--output', output,
+                   '--seed', str(self.seed), '--trials', str(self.num_trials), '--tuning', json.dumps(self.tuning),
+                   '--sizes'] + [str(size) for size in self.data_sizes]
+        if self.algorithm_names:
+            command += ['--algorithms'] + list(self.algorithm_names)
+        return command
+    
+    def run_interpreter(self, label: str, path: str) -> Optional[Dict[str, Any]]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'results.json')
+            try:
+                completed = subprocess.run(self._command(path, output), cwd=self.config.BASE_DIR,
+                                           capture_output=True, text=True, timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                print(f"   ⏭️  {label}: timed out after {self.timeout:.0f}s, skipping")
+                return None
+            
+            if completed.returncode != 0 or not os.path.exists(output):
+                error = completed.stderr.strip().splitlines()
+                print(f"   ⏭️  {label}: benchmark failed ({error[-1] if error else 'no output'}), skipping")
+                return None
+            
+            with open(output, 'r') as f:
+                return json.load(f)
+    
+    def run(self) -> Dict[str, Any]:
+        print("🐍 Discovering interpreters...")
+        interpreters = discover_interpreters(self.candidates)
+        
+        comparison = {
+            'interpreters': [],
+            'interpreter_paths': {},
+            'algorithms': [],
+            'data_types': [],
+            'data_sizes': sorted(self.data_sizes),
+            'results': {},
+            'interpreter_metadata': {},
+            'metadata': {'seed': self.seed, 'tuning': self.tuning}
+        }
+        
+        for label, path in interpreters.items():
+            print(f"\n⚡ Running matrix under {label} ({path})...")
+            started = time.perf_counter()
+            results = self.run_interpreter(label, path)
+            if results is None:
+                continue
+            
+            comparison['interpreters'].append(label)
+            comparison['interpreter_paths'][label] = path
+            comparison['algorithms'] = results['algorithms']
+            comparison['data_types'] = results['data_types']
+            comparison['results'][label] = results['results']
+            comparison['interpreter_metadata'][label] = results['metadata']
+            print(f"   ✅ {label} finished in {time.perf_counter() - started:.1f}s")
+        
+        comparison['metadata']['timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        return comparison
+
+def interpreter_results(comparison: Dict[str, Any], label: str) -> Dict[str, Any]:
+    return {
+        'algorithms': comparison['algorithms'],
+        'data_types': comparison['data_types'],
+        'data_sizes': comparison['data_sizes'],
+        'results': comparison['results'][label],
+        'metadata': comparison['interpreter_metadata'][label]
+    }
+
+def save_comparison(comparison: Dict[str, Any], filename: str = None) -> str:
+    if filename is None:
+        filename = f"interpreter_comparison_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    
+    Config.ensure_directories()
+    filepath = os.path.join(Config.PERFORMANCE_DATA_DIR, filename)
+    with open(filepath, 'w') as f:
+        json.dump(comparison, f, indent=2)
+    
+    print(f"Interpreter comparison saved to: {filepath}")
+    return filepath
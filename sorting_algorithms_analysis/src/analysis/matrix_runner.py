@@ -0,0 +1,42 @@
+
+import argparse
+import json
+import os
+import sys
+
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.algorithms.registry import create_algorithms
+from src.data_generation.dataset_pipeline import DatasetPipeline
+from src.analysis.performance_analyzer import PerformanceAnalyzer
+from src.utils.config import Config
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run one benchmark matrix and write it as JSON")
+    parser.add_argument('--output', required=True)
+    parser.add_argument('--seed', type=int, default=Config.DISTRIBUTED_SEED)
+    parser.add_argument('--sizes', type=int, nargs='+', default=None)
+    parser.add_argument('--trials', type=int, default=None)
+    parser.add_argument('--tuning', default=None,
+                        help="JSON tuning parameters to use instead of this interpreter's own profile")
+    parser.add_argument('--algorithms', nargs='+', default=None)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    if args.tuning is not None:
+        Config.apply_tuning_parameters(json.loads(args.tuning))
+    if args.trials is not None:
+        Config.NUM_TRIALS = args.trials
+    
+    datasets = DatasetPipeline(args.sizes, seed=args.seed)
+    results = PerformanceAnalyzer().analyze_algorithms(create_algorithms(args.algorithms), datasets)
+    results['metadata']['seed'] = args.seed
+    
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+
+import bisect
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional, Tuple
+from ..utils.config import Config
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+INF_BUCKET = 'le="+Inf"'
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def current_rss() -> Optional[int]:
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+class Metric:
+    
+    kind = 'unknown'
+    
+    def __init__(self, name: str, documentation: str, labels: List[str] = None):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels or ())
+        self._values: Dict[Tuple[str, ...], Any] = {}
+    
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.label_names)
+    
+    def header(self) -> List[str]:
+        return [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {_escape(self.documentation)}"]
+
+class Counter(Metric):
+    
+    kind = 'counter'
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+    
+    def samples(self) -> List[str]:
+        return [f"{self.name}_total{_format_labels(self.label_names, key)} {_format_value(value)}"
+                for key, value in self._values.items()]
+
+class Gauge(Metric):
+    
+    kind = 'gauge'
+    
+    def __init__(self, name: str, documentation: str, labels: List[str] = None, callback=None):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+    
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+    
+    def samples(self) -> List[str]:
+        values = self._values
+        if self.callback is not None:
+            value = self.callback()
+            values = {(): value} if value is not None else {}
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+                for key, value in values.items()]
+
+class Histogram(Metric):
+    
+    kind = 'histogram'
+    
+    def __init__(self, name: str, documentation: str, labels: List[str] = None, buckets: List[float] = None):
+        super().__init__(name, documentation, labels)
+        self.buckets = sorted(buckets if buckets is not None else Config.METRICS_LATENCY_BUCKETS)
+    
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+        
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            state[0][index] += 1
+        state[1] += 1
+        state[2] += value
+    
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (counts, count, total) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, key, f'le="{_format_value(float(bound))}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, INF_BUCKET)} {count}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}")
+        return lines
+
+class Summary(Metric):
+    
+    kind = 'summary'
+    
+    def __init__(self, name: str, documentation: str, labels: List[str] = None,
+                 quantiles: List[float] = None, window: int = None):
+        super().__init__(name, documentation, labels)
+        self.quantiles = quantiles if quantiles is not None else Config.METRICS_QUANTILES
+        self.window = window if window is not None else Config.METRICS_WINDOW
+    
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [deque(maxlen=self.window), 0, 0.0]
+        
+        state[0].append(value)
+        state[1] += 1
+        state[2] += value
+    
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (recent, count, total) in self._values.items():
+            
+            ordered = sorted(recent)
+            for quantile in self.quantiles:
+                value = ordered[min(int(quantile * len(ordered)), len(ordered) - 1)]
+                labels = _format_labels(self.label_names, key, f'quantile="{quantile}"')
+                lines.append(f"{self.name}{labels} {_format_value(value)}")
+            
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}")
+        return lines
+
+class MetricsRegistry:
+    
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.lock = threading.Lock()
+    
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+    
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for metric in self.metrics.values():
+                lines.extend(metric.header())
+                lines.extend(metric.samples())
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+class BenchmarkMetrics:
+    
+    def __init__(self, registry: MetricsRegistry = None, namespace: str = None):
+        self.registry = registry or MetricsRegistry()
+        prefix = f"{namespace or Config.METRICS_NAMESPACE}_"
+        register = self.registry.register
+        
+        self.sorts = register(Counter(prefix + 'sorts', 'Completed sort calls', ['algorithm', 'size']))
+        self.elements = register(Counter(prefix + 'sorted_elements', 'Elements sorted', ['algorithm']))
+        self.flagged = register(Counter(prefix + 'flagged_trials', 'Trials flagged for interference', ['algorithm']))
+        self.throughput = register(Gauge(prefix + 'elements_per_second', 'Throughput of the latest sort',
+                                         ['algorithm', 'size']))
+        self.duration = register(Histogram(prefix + 'sort_duration_seconds', 'Sort wall time',
+                                           ['algorithm', 'size']))
+        self.latency = register(Summary(prefix + 'sort_latency_seconds', 'Sort wall time over recent calls',
+                                        ['algorithm', 'size']))
+        self.progress = register(Gauge(prefix + 'progress_ratio', 'Fraction of benchmark cells completed'))
+        self.cells = register(Counter(prefix + 'cells', 'Benchmark cells completed', ['data_type']))
+        self.rss = register(Gauge('process_resident_memory_bytes', 'Resident set size', callback=current_rss))
+        self.started = register(Gauge('process_start_time_seconds', 'Start time since the epoch'))
+        self.started.set(time.time())
+    
+    def observe_sort(self, algorithm: str, size: int, seconds: float, flagged: bool = False) -> None:
+        with self.registry.lock:
+            self.sorts.inc(algorithm=algorithm, size=size)
+            self.elements.inc(size, algorithm=algorithm)
+            self.duration.observe(seconds, algorithm=algorithm, size=size)
+            self.latency.observe(seconds, algorithm=algorithm, size=size)
+            if seconds > 0:
+                self.throughput.set(size / seconds, algorithm=algorithm, size=size)
+            if flagged:
+                self.flagged.inc(algorithm=algorithm)
+    
+    def observe_cell(self, data_type: str, completed: int, total: int) -> None:
+        with self.registry.lock:
+            self.cells.inc(data_type=data_type)
+            self.progress.set(completed / total if total else 1.0)
+    
+    def render(self) -> str:
+        return self.registry.render()
+
+class MetricsServer:
+    
+    def __init__(self, metrics: BenchmarkMetrics, host: str = None, port: int = None):
+        self.metrics = metrics
+        render = metrics.render
+        
+        class Handler(BaseHTTPRequestHandler):
+            
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                
+                body = render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer((host or Config.METRICS_HOST,
+                                           Config.METRICS_PORT if port is None else port), Handler)
+        self.server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server.server_address[:2]
+    
+    def start(self) -> 'MetricsServer':
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+class MetricsFileWriter:
+    
+    def __init__(self, metrics: BenchmarkMetrics, path: str = None, interval: float = None):
+        self.metrics = metrics
+        self.path = path or Config.METRICS_FILE
+        self.interval = interval or Config.METRICS_INTERVAL
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def write(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        
+        
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(self.metrics.render())
+        os.replace(temp_path, self.path)
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+    
+    def start(self) -> 'MetricsFileWriter':
+        self.write()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.write()
@@ -1,40 +1,89 @@
 
 import json
+import math
+import random
 import time
 import os
 from typing import Dict, List, Any
 from ..utils.config import Config
+from ..algorithms.registry import algorithm_parameters
+from ..algorithms.sorting_algorithms import allocate_buffer_like
 from ..utils.helpers import time_function, is_sorted, calculate_statistics
+from ..utils.environment import (PerfCounters, TrialMonitor, collect_environment, comparability_warnings,
+                                 compare_environments, interference_flags)
 
 class PerformanceAnalyzer:
     
-    def __init__(self):
+    def __init__(self, metrics=None):
         self.config = Config()
         self.config.ensure_directories()
+        self.metrics = metrics
+        
+        self.perf_counters = None
+        if self.config.CAPTURE_HARDWARE_COUNTERS:
+            counters = PerfCounters()
+            if counters.available:
+                self.perf_counters = counters
+        
+        self.trial_monitor = None
+        if self.config.CAPTURE_TRIAL_METRICS:
+            monitor = TrialMonitor()
+            if monitor.available:
+                self.trial_monitor = monitor
     
-    def measure_algorithm_performance(self, algorithm, data: List[int], num_trials: int = None) -> Dict[str, Any]:
+    def measure_algorithm_performance(self, algorithm, data: List[int], num_trials: int = None,
+                                      adaptive: bool = False) -> Dict[str, Any]:
         if num_trials is None:
-            num_trials = self.config.NUM_TRIALS
+            num_trials = self.config.MIN_TRIALS if adaptive else self.config.NUM_TRIALS
         
         execution_times = []
+        trial_metrics = []
+        monitor = self.trial_monitor
+        counters = self.perf_counters
+        live_metrics = self.metrics
+        if counters is not None:
+            counters.reset()
+        cache_counts = algorithm.cache_counts() if hasattr(algorithm, 'cache_stats') else None
         
-        for trial in range(num_trials):
+        
+        out = None if isinstance(data, list) else allocate_buffer_like(data)
+        started = time.perf_counter()
+        
+        while len(execution_times) < num_trials or (adaptive and self._needs_more_trials(execution_times, started)):
+            
+            if out is None:
+                data_copy = data.copy()
             
-            data_copy = data.copy()
+            if monitor is not None:
+                monitor.start()
+            if counters is not None:
+                counters.start()
             
+            if out is None:
+                sorted_data, exec_time = time_function(algorithm.sort, data_copy)
+            else:
+                sorted_data, exec_time = time_function(algorithm.sort_buffer, data, out)
             
-            sorted_data, exec_time = time_function(algorithm.sort, data_copy)
+            if counters is not None:
+                counters.stop()
+            if monitor is not None:
+                metrics = monitor.stop()
+                metrics['flags'] = self._interference_flags(metrics, exec_time)
+                trial_metrics.append(metrics)
             
             
             if not is_sorted(sorted_data):
                 raise ValueError(f"{algorithm.name} failed to sort data correctly!")
             
             execution_times.append(exec_time)
+            if live_metrics is not None:
+                live_metrics.observe_sort(algorithm.name, len(data), exec_time,
+                                     bool(trial_metrics and trial_metrics[-1]['flags']))
         
         
         stats = calculate_statistics(execution_times)
         
-        return {
+        performance = {
             'algorithm': algorithm.name,
             'data_size': len(data),
             'execution_times': execution_times,
@@ -46,44 +95,511 @@ class PerformanceAnalyzer:
             },
             'space_complexity': algorithm.space_complexity
         }
+        
+        if counters is not None:
+            performance['hardware_counters'] = self._summarize_counters(counters.read(), len(data), len(execution_times))
+        
+        if cache_counts is not None:
+            performance['cache'] = algorithm.cache_stats(cache_counts)
+        
+        if monitor is not None:
+            performance['trial_metrics'] = trial_metrics
+            performance['interference'] = self._summarize_interference(trial_metrics, execution_times)
+        
+        return performance
+    
+    def _needs_more_trials(self, execution_times: List[float], started: float) -> bool:
+        count = len(execution_times)
+        if count >= self.config.MAX_TRIALS or time.perf_counter() - started >= self.config.ADAPTIVE_TIME_BUDGET:
+            return False
+        if count < 2:
+            return True
+        
+        
+        mean_time = sum(execution_times) / count
+        std_dev = math.sqrt(sum((t - mean_time) ** 2 for t in execution_times) / (count - 1))
+        return 1.96 * std_dev / math.sqrt(count) > self.config.TARGET_RELATIVE_ERROR * mean_time
     
-    def analyze_algorithms(self, algorithms: Dict[str, Any], datasets: Dict[str, Dict[int, List[int]]]) -> Dict[str, Any]:
+    def _interference_flags(self, metrics: Dict[str, Any], wall_time: float) -> List[str]:
+        return interference_flags(metrics, wall_time,
+                                  min_cpu_ratio=self.config.INTERFERENCE_MIN_CPU_RATIO,
+                                  max_gc_fraction=self.config.INTERFERENCE_MAX_GC_FRACTION,
+                                  max_switch_rate=self.config.INTERFERENCE_MAX_SWITCH_RATE,
+                                  min_wall_time=self.config.INTERFERENCE_MIN_WALL_TIME)
+    
+    def _summarize_interference(self, trial_metrics: List[Dict[str, Any]], execution_times: List[float]) -> Dict[str, Any]:
+        flagged = [trial for trial, metrics in enumerate(trial_metrics) if metrics['flags']]
+        clean_times = [exec_time for trial, exec_time in enumerate(execution_times) if trial not in flagged]
+        involuntary = [metrics['involuntary_switches'] for metrics in trial_metrics
+                       if metrics['involuntary_switches'] is not None]
+        
+        return {
+            'flagged_trials': flagged,
+            'flags': sorted({flag for metrics in trial_metrics for flag in metrics['flags']}),
+            'cpu_time_mean': sum(metrics['cpu_time'] for metrics in trial_metrics) / len(trial_metrics),
+            'gc_collections_total': sum(metrics['gc_collections'] for metrics in trial_metrics),
+            'gc_pause_total': sum(metrics['gc_pause'] for metrics in trial_metrics),
+            'involuntary_switches_total': sum(involuntary) if involuntary else None,
+            'clean_statistics': calculate_statistics(clean_times)
+        }
+    
+    def _summarize_counters(self, totals: Dict[str, int], size: int, num_trials: int) -> Dict[str, Any]:
+        summary = {name: value / num_trials for name, value in totals.items()}
+        elements = max(size, 1)
+        
+        summary['cycles_per_element'] = summary['cycles'] / elements
+        summary['instructions_per_cycle'] = summary['instructions'] / summary['cycles'] if summary['cycles'] else None
+        summary['cache_misses_per_element'] = summary['cache_misses'] / elements
+        return summary
+    
+    def analyze_algorithms(self, algorithms: Dict[str, Any], datasets: Any,
+                           profiler=None, adaptive: bool = False) -> Dict[str, Any]:
+        if isinstance(datasets, dict):
+            data_types = list(datasets.keys())
+            data_sizes = sorted({size for size_data in datasets.values() for size in size_data})
+            total_datasets = sum(len(size_data) for size_data in datasets.values())
+            datasets = ((data_type, size, data) for data_type, size_data in datasets.items()
+                        for size, data in size_data.items())
+        else:
+            data_types = list(datasets.data_types)
+            data_sizes = sorted(datasets.data_sizes)
+            total_datasets = len(datasets)
+        
+        cached_names = [algo_name for algo_name, algorithm in algorithms.items() if hasattr(algorithm, 'cache_stats')]
         results = {
-            'algorithms': list(algorithms.keys()),
-            'data_types': list(datasets.keys()),
-            'data_sizes': self.config.DATA_SIZES,
-            'results': {}
+            'algorithms': [algo_name for algo_name in algorithms if algo_name not in cached_names],
+            'data_types': data_types,
+            'data_sizes': data_sizes,
+            'results': {algo_name: {data_type: {} for data_type in data_types}
+                        for algo_name in algorithms if algo_name not in cached_names}
         }
         
-        total_tests = len(algorithms) * len(datasets) * len(self.config.DATA_SIZES)
+        cache_counts = {algo_name: algorithms[algo_name].cache_counts() for algo_name in cached_names}
+        if cached_names:
+            results['cached_algorithms'] = cached_names
+            results['cached_results'] = {algo_name: {data_type: {} for data_type in data_types}
+                                         for algo_name in cached_names}
+        
+        environment = collect_environment()
+        warnings = comparability_warnings(environment, self.config.MAX_LOAD_PER_CORE)
+        for warning in warnings:
+            print(f"⚠️  {warning}")
+        
+        total_tests = len(algorithms) * total_datasets
+        compact = False
         current_test = 0
+        flagged_trials = 0
         
-        for algo_name, algorithm in algorithms.items():
-            print(f"\n🔍 Testing {algo_name}...")
-            results['results'][algo_name] = {}
+        
+        for data_type, size, data in datasets:
+            print(f"\n📦 {data_type} data, size {size:,}")
+            compact = compact or not isinstance(data, list)
             
-            for data_type, size_data in datasets.items():
-                results['results'][algo_name][data_type] = {}
+            for algo_name, algorithm in algorithms.items():
+                current_test += 1
+                progress = (current_test / total_tests) * 100
+                
+                print(f"   [{progress:5.1f}%] {algo_name}")
+                
+                
+                performance = self.measure_algorithm_performance(algorithm, data, adaptive=adaptive)
+                section = 'cached_results' if algo_name in cache_counts else 'results'
+                results[section][algo_name][data_type][size] = performance
                 
-                for size, data in size_data.items():
-                    current_test += 1
-                    progress = (current_test / total_tests) * 100
-                    
-                    print(f"   [{progress:5.1f}%] {data_type} data, size {size:,}")
-                    
-                    
-                    performance = self.measure_algorithm_performance(algorithm, data)
-                    results['results'][algo_name][data_type][size] = performance
+                interference = performance.get('interference')
+                if interference and interference['flagged_trials']:
+                    flagged_trials += len(interference['flagged_trials'])
+                    print(f"   ⚠️  {len(interference['flagged_trials'])}/{len(performance['execution_times'])} "
+                          f"trials flagged for interference ({', '.join(interference['flags'])})")
+                
+                if profiler is not None and profiler.wants(algo_name, data_type, size):
+                    profiler.profile_cell(algorithm, data, algo_name, data_type, size)
+                if self.metrics is not None:
+                    self.metrics.observe_cell(data_type, current_test, total_tests)
+                
+                cache = performance.get('cache')
+                if cache is not None:
+                    print(f"   💾 cache: {cache['hits']} hits, {cache['disk_hits']} disk hits, "
+                          f"{cache['misses']} misses, {cache['sorted_inputs']} already sorted, "
+                          f"{cache['bytes'] / 1024 ** 2:.1f} MiB held")
+            
+            
+            del data
         
         
         results['metadata'] = {
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
             'num_trials_per_test': self.config.NUM_TRIALS,
-            'total_tests_run': total_tests
+            'adaptive_trials': adaptive,
+            'total_tests_run': total_tests,
+            'data_representation': 'compact' if compact else 'list',
+            'environment': environment,
+            'comparability_warnings': warnings,
+            'flagged_trials': flagged_trials,
+            'tuning': self.config.tuning_parameters(),
+            'algorithm_parameters': {algo_name: algorithm_parameters(algorithm)
+                                     for algo_name, algorithm in algorithms.items()}
         }
         
+        if cache_counts:
+            results['metadata']['cache_stats'] = {algo_name: algorithms[algo_name].cache_stats(counts)
+                                                  for algo_name, counts in cache_counts.items()}
+        
+        if profiler is not None:
+            results['profiles'] = profiler.profiles
+            profiler.print_report()
+        
         return results
     
+    def analyze_merge_fan_in(self, data: List[int], fan_ins: List[int] = None, num_trials: int = None) -> Dict[int, Any]:
+        from ..algorithms.sorting_algorithms import MultiwayMergeSort
+        from ..utils.helpers import format_time
+        
+        if fan_ins is None:
+            fan_ins = self.config.MERGE_FAN_INS
+        
+        sweep = {}
+        
+        print(f"\n🔀 Merge fan-in sweep on {len(data):,} elements:")
+        for fan_in in fan_ins:
+            algorithm = MultiwayMergeSort(fan_in)
+            performance = self.measure_algorithm_performance(algorithm, data, num_trials)
+            performance['fan_in'] = fan_in
+            performance['passes'] = algorithm.last_passes
+            sweep[fan_in] = performance
+            
+            print(f"   k={fan_in:<3} passes={algorithm.last_passes:<3} "
+                  f"mean={format_time(performance['statistics']['mean'])}")
+        
+        return sweep
+    
+    def _time_trials(self, func, data: List[int], num_trials: int) -> Dict[str, Any]:
+        execution_times = []
+        for trial in range(num_trials):
+            _, exec_time = time_function(func, data.copy())
+            execution_times.append(exec_time)
+        
+        return {'execution_times': execution_times, 'statistics': calculate_statistics(execution_times)}
+    
+    def analyze_selection(self, data: List[int], ratios: List[float] = None, num_trials: int = None) -> Dict[str, Any]:
+        from ..algorithms.sorting_algorithms import QuickSort, HeapSort
+        from ..algorithms.selection import nth_element, top_k, partial_sort
+        from ..utils.helpers import format_time
+        
+        if ratios is None:
+            ratios = self.config.SELECTION_K_RATIOS
+        if num_trials is None:
+            num_trials = self.config.NUM_TRIALS
+        
+        n = len(data)
+        baselines = {
+            'Quick Sort': self._time_trials(QuickSort().sort, data, num_trials),
+            'Heap Sort': self._time_trials(HeapSort().sort, data, num_trials)
+        }
+        full_sort_time = min(baseline['statistics']['mean'] for baseline in baselines.values())
+        
+        sweep = {'data_size': n, 'full_sort': baselines, 'ratios': {}}
+        
+        print(f"\n🎯 Selection vs full sort on {n:,} elements (best full sort {format_time(full_sort_time)}):")
+        for ratio in ratios:
+            k = max(1, int(n * ratio))
+            operations = {
+                'nth_element': lambda arr: nth_element(arr, k - 1),
+                'top_k': lambda arr: top_k(arr, k),
+                'partial_sort': lambda arr: partial_sort(arr, k)
+            }
+            
+            cell = {'k': k}
+            for op_name, op in operations.items():
+                timing = self._time_trials(op, data, num_trials)
+                timing['speedup_vs_full_sort'] = full_sort_time / timing['statistics']['mean']
+                cell[op_name] = timing
+            sweep['ratios'][ratio] = cell
+            
+            print(f"   k/n={ratio:<6} k={k:<8,} " + "  ".join(
+                f"{op_name}={format_time(cell[op_name]['statistics']['mean'])} "
+                f"({cell[op_name]['speedup_vs_full_sort']:.1f}x)" for op_name in operations))
+        
+        return sweep
+    
+    def analyze_incremental_inserts(self, algorithm, total_size: int = None, batch_sizes: List[int] = None) -> Dict[int, Any]:
+        from ..algorithms.sorted_container import IncrementalSortedList
+        from ..utils.helpers import generate_random_array, format_time
+        
+        if total_size is None:
+            total_size = self.config.INCREMENTAL_TOTAL_SIZE
+        if batch_sizes is None:
+            batch_sizes = self.config.INCREMENTAL_BATCH_SIZES
+        
+        stream = generate_random_array(total_size)
+        sweep = {}
+        
+        print(f"\n📥 Incremental inserts vs full re-sort ({algorithm.name}, {total_size:,} elements):")
+        for batch_size in batch_sizes:
+            batches = [stream[i:i + batch_size] for i in range(0, total_size, batch_size)]
+            
+            container = IncrementalSortedList(algorithm=algorithm)
+            incremental_times = []
+            for batch in batches:
+                _, exec_time = time_function(container.insert_batch, batch)
+                incremental_times.append(exec_time)
+            
+            accumulated = []
+            resort_times = []
+            for batch in batches:
+                accumulated.extend(batch)
+                accumulated, exec_time = time_function(algorithm.sort, accumulated)
+                resort_times.append(exec_time)
+            
+            if not is_sorted(container) or container.to_list() != accumulated:
+                raise ValueError(f"Incremental container diverged from {algorithm.name} at batch size {batch_size}")
+            
+            incremental_total = sum(incremental_times)
+            resort_total = sum(resort_times)
+            sweep[batch_size] = {
+                'batches': len(batches),
+                'incremental': calculate_statistics(incremental_times),
+                'full_resort': calculate_statistics(resort_times),
+                'incremental_total': incremental_total,
+                'full_resort_total': resort_total,
+                'speedup': resort_total / incremental_total
+            }
+            
+            print(f"   batch={batch_size:<7,} incremental={format_time(incremental_total)} "
+                  f"re-sort={format_time(resort_total)} ({resort_total / incremental_total:.1f}x)")
+        
+        return sweep
+    
+    def analyze_batch_sorting(self, algorithm, array_sizes: List[int] = None, total_elements: int = None,
+                              num_trials: int = None) -> Dict[int, Any]:
+        from ..algorithms.batch import sort_many, np
+        from ..utils.helpers import generate_random_array, format_time
+        
+        if array_sizes is None:
+            array_sizes = self.config.BATCH_ARRAY_SIZES
+        if total_elements is None:
+            total_elements = self.config.BATCH_TOTAL_ELEMENTS
+        if num_trials is None:
+            num_trials = self.config.NUM_TRIALS
+        
+        methods = ['per_call', 'base_case'] + (['segmented'] if np is not None else [])
+        sweep = {}
+        
+        print(f"\n📦 Batch sorting of many small arrays ({algorithm.name}, {total_elements:,} elements per batch):")
+        for size in array_sizes:
+            batch = [generate_random_array(size) for _ in range(max(1, total_elements // size))]
+            expected = [sorted(arr) for arr in batch]
+            
+            cell = {'num_arrays': len(batch)}
+            for method in methods:
+                execution_times = []
+                for trial in range(num_trials):
+                    sorted_batch, exec_time = time_function(sort_many, batch, algorithm, method)
+                    execution_times.append(exec_time)
+                
+                if sorted_batch != expected:
+                    raise ValueError(f"{method} batch sort produced wrong output for arrays of size {size}")
+                
+                statistics = calculate_statistics(execution_times)
+                cell[method] = {
+                    'execution_times': execution_times,
+                    'statistics': statistics,
+                    'ns_per_element': statistics['mean'] / (len(batch) * size) * 1e9
+                }
+            
+            per_call_mean = cell['per_call']['statistics']['mean']
+            for method in methods:
+                cell[method]['speedup_vs_per_call'] = per_call_mean / cell[method]['statistics']['mean']
+            sweep[size] = cell
+            
+            print(f"   n={size:<6,} arrays={len(batch):<8,} " + "  ".join(
+                f"{method}={format_time(cell[method]['statistics']['mean'])} "
+                f"({cell[method]['speedup_vs_per_call']:.1f}x)" for method in methods))
+        
+        return sweep
+    
+    def analyze_indirect_sorting(self, algorithm, size: int = None, widths: List[int] = None,
+                                 num_trials: int = None) -> Dict[int, Any]:
+        from ..algorithms.permutation import apply_permutation
+        from ..utils.helpers import generate_random_array, format_time
+        
+        if size is None:
+            size = self.config.RECORD_SORT_SIZE
+        if widths is None:
+            widths = self.config.RECORD_WIDTHS
+        if num_trials is None:
+            num_trials = self.config.NUM_TRIALS
+        
+        def sort_columnar(columns):
+            return [list(column) for column in zip(*algorithm.sort(list(zip(*columns))))]
+        
+        keys = generate_random_array(size)
+        sweep = {}
+        
+        print(f"\n🗂️  Indirect vs direct record sorting ({algorithm.name}, {size:,} records):")
+        for width in widths:
+            columns = [keys] + [generate_random_array(size) for _ in range(width - 1)]
+            rows = list(zip(*columns))
+            expected = sorted(rows, key=lambda row: row[0])
+            expected_rows = sorted(rows)
+            
+            direct_times, columnar_times, argsort_times, apply_times = [], [], [], []
+            for trial in range(num_trials):
+                direct_result, exec_time = time_function(algorithm.sort, rows)
+                direct_times.append(exec_time)
+                
+                columnar_result, exec_time = time_function(sort_columnar, columns)
+                columnar_times.append(exec_time)
+                
+                working = [column.copy() for column in columns]
+                perm, exec_time = time_function(algorithm.argsort, keys)
+                argsort_times.append(exec_time)
+                
+                _, exec_time = time_function(apply_permutation, perm, *working)
+                apply_times.append(exec_time)
+            
+            if direct_result != expected_rows:
+                raise ValueError(f"Direct row sort produced wrong records for width {width}")
+            if list(zip(*columnar_result)) != expected_rows:
+                raise ValueError(f"Zip+sort+unzip produced wrong records for width {width}")
+            if list(zip(*working)) != expected:
+                raise ValueError(f"Indirect sort produced wrong records for width {width}")
+            
+            indirect_times = [a + b for a, b in zip(argsort_times, apply_times)]
+            direct = calculate_statistics(direct_times)
+            columnar = calculate_statistics(columnar_times)
+            indirect = calculate_statistics(indirect_times)
+            sweep[width] = {
+                'direct': {'execution_times': direct_times, 'statistics': direct},
+                'direct_columnar': {'execution_times': columnar_times, 'statistics': columnar},
+                'argsort': {'execution_times': argsort_times, 'statistics': calculate_statistics(argsort_times)},
+                'apply_permutation': {'execution_times': apply_times, 'statistics': calculate_statistics(apply_times)},
+                'indirect': {'execution_times': indirect_times, 'statistics': indirect},
+                'speedup_vs_direct': direct['mean'] / indirect['mean'],
+                'speedup_vs_direct_columnar': columnar['mean'] / indirect['mean']
+            }
+            
+            print(f"   width={width:<4} rows={format_time(direct['mean'])} "
+                  f"zip+sort+unzip={format_time(columnar['mean'])} "
+                  f"argsort+apply={format_time(indirect['mean'])} "
+                  f"({sweep[width]['speedup_vs_direct']:.2f}x vs rows, "
+                  f"{sweep[width]['speedup_vs_direct_columnar']:.2f}x vs zip)")
+        
+        return sweep
+    
+    def analyze_cached_sorting(self, algorithm, pool_size: int = None, requests: int = None,
+                               size: int = None, max_bytes: int = None, disk_dir: str = None) -> Dict[str, Any]:
+        from ..algorithms.sort_cache import CachedAlgorithm
+        from ..utils.helpers import generate_random_array, format_time
+        
+        if pool_size is None:
+            pool_size = self.config.SORT_CACHE_POOL_SIZE
+        if requests is None:
+            requests = self.config.SORT_CACHE_REQUESTS
+        if size is None:
+            size = self.config.SORT_CACHE_ARRAY_SIZE
+        if max_bytes is None:
+            max_bytes = self.config.SORT_CACHE_MAX_BYTES
+        
+        
+        pool = [generate_random_array(size) for _ in range(pool_size)]
+        rng = random.Random(self.config.DISTRIBUTED_SEED)
+        weights = [1 / (rank + 1) for rank in range(pool_size)]
+        stream = rng.choices(range(pool_size), weights=weights, k=requests)
+        cached = CachedAlgorithm(algorithm, max_bytes, disk_dir, self.config.SORT_CACHE_DISK_MAX_BYTES)
+        
+        print(f"\n💾 Cached vs uncached sorting ({algorithm.name}, {requests} requests over "
+              f"{pool_size} arrays of {size:,}):")
+        timings = {}
+        for label, sorter in (('uncached', algorithm), ('cached', cached)):
+            execution_times = []
+            for index in stream:
+                sorted_data, exec_time = time_function(sorter.sort, pool[index])
+                execution_times.append(exec_time)
+                if not is_sorted(sorted_data):
+                    raise ValueError(f"{sorter.name} failed to sort data correctly!")
+            timings[label] = {'total': sum(execution_times), 'statistics': calculate_statistics(execution_times)}
+        
+        stats = cached.cache_stats()
+        speedup = timings['uncached']['total'] / timings['cached']['total']
+        print(f"   uncached={format_time(timings['uncached']['total'])} "
+              f"cached={format_time(timings['cached']['total'])} ({speedup:.1f}x)")
+        print(f"   hits={stats['hits']} disk_hits={stats['disk_hits']} misses={stats['misses']} "
+              f"hit_rate={stats['hit_rate']:.1%} evictions={stats['evictions']}")
+        
+        return {'pool_size': pool_size, 'requests': requests, 'data_size': size,
+                'timings': timings, 'speedup': speedup, 'cache': stats}
+    
+    def print_compiled_speedups(self, results) -> Dict[str, float]:
+        import numpy as np
+        from .results_cube import ResultsCube
+        
+        cube = ResultsCube.from_results(results)
+        speedups = {}
+        
+        print("\n🚀 COMPILED VS INTERPRETED (geometric mean speedup):")
+        print("-" * 50)
+        
+        for a, algo_name in enumerate(cube.algorithms):
+            compiled_name = f"{algo_name} (compiled)"
+            if compiled_name not in cube.algorithms:
+                continue
+            
+            c = cube.algorithms.index(compiled_name)
+            ratios = cube.mean[a] / cube.mean[c]
+            speedups[algo_name] = float(np.exp(np.nanmean(np.log(ratios))))
+            per_size = np.exp(np.nanmean(np.log(ratios), axis=0))
+            
+            sizes = ", ".join(f"{size:,}: {ratio:.2f}x" for size, ratio in zip(cube.data_sizes, per_size))
+            print(f"  {algo_name:12} {speedups[algo_name]:.2f}x  ({sizes})")
+        
+        if not speedups:
+            print("  No compiled algorithms in these results")
+        
+        return speedups
+    
+    def print_cached_speedups(self, results) -> Dict[str, float]:
+        speedups = {}
+        cached_results = results.get('cached_results', {})
+        
+        print("\n💾 CACHED VS UNCACHED (geometric mean speedup, repeated trials are cache hits):")
+        print("-" * 50)
+        
+        for algo_name in results['algorithms']:
+            cached_name = f"{algo_name} (cached)"
+            if cached_name not in cached_results:
+                continue
+            
+            log_ratios = []
+            for data_type, size_data in cached_results[cached_name].items():
+                for size, performance in size_data.items():
+                    uncached = results['results'][algo_name][data_type][size]['statistics']['mean']
+                    log_ratios.append(math.log(uncached / performance['statistics']['mean']))
+            if not log_ratios:
+                continue
+            
+            speedups[algo_name] = math.exp(sum(log_ratios) / len(log_ratios))
+            stats = results['metadata']['cache_stats'][cached_name]
+            hit_rate = f"{stats['hit_rate']:.1%}" if stats['hit_rate'] is not None else "n/a"
+            print(f"  {algo_name:12} {speedups[algo_name]:.2f}x  (hit rate {hit_rate}, "
+                  f"{stats['sorted_inputs']} already sorted)")
+        
+        if not speedups:
+            print("  No cached algorithms in these results")
+        
+        return speedups
+    
+    def check_comparability(self, first: Dict[str, Any], second: Dict[str, Any]) -> List[str]:
+        first_env = first['metadata'].get('environment', {})
+        second_env = second['metadata'].get('environment', {})
+        
+        problems = compare_environments(first_env, second_env)
+        for label, results in (('first', first), ('second', second)):
+            for warning in results['metadata'].get('comparability_warnings', []):
+                problems.append(f"{label} run: {warning}")
+        
+        return problems
+    
     def save_results(self, results: Dict[str, Any], filename: str = None) -> str:
         if filename is None:
             timestamp = time.strftime('%Y%m%d_%H%M%S')
@@ -97,45 +613,64 @@ class PerformanceAnalyzer:
         print(f"Results saved to: {filepath}")
         return filepath
     
+    def save_results_columnar(self, results: Dict[str, Any], basename: str = None) -> str:
+        from .results_store import save_columnar_results
+        
+        if basename is None:
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            basename = f"performance_results_{timestamp}"
+        
+        csv_path = save_columnar_results(results, basename, self.config.PERFORMANCE_DATA_DIR)
+        
+        print(f"Columnar results saved to: {csv_path}")
+        return csv_path
+    
     def load_results(self, filepath: str) -> Dict[str, Any]:
         with open(filepath, 'r') as f:
             return json.load(f)
     
-    def print_summary(self, results: Dict[str, Any]) -> None:
+    def load_results_frame(self, filepath: str):
+        from .results_store import load_columnar_results, results_to_frame
+        
+        if filepath.endswith('.csv'):
+            return load_columnar_results(filepath)
+        return results_to_frame(self.load_results(filepath))
+    
+    def print_summary(self, results) -> None:
+        from .results_cube import ResultsCube
+        from ..utils.helpers import format_time
+        
+        cube = ResultsCube.from_results(results)
+        metadata = cube.metadata
+        
         print("\n" + "=" * 60)
         print("📊 PERFORMANCE ANALYSIS SUMMARY")
         print("=" * 60)
         
-        algorithms = results['algorithms']
-        data_types = results['data_types']
-        data_sizes = results['data_sizes']
+        print(f"Algorithms tested: {', '.join(cube.algorithms)}")
+        print(f"Data types: {', '.join(cube.data_types)}")
+        print(f"Data sizes: {', '.join(map(str, cube.data_sizes))}")
+        print(f"Total tests: {metadata['total_tests_run']}")
+        if metadata.get('adaptive_trials'):
+            print(f"Trials per test: adaptive ({self.config.MIN_TRIALS}-{self.config.MAX_TRIALS})")
+        else:
+            print(f"Trials per test: {metadata['num_trials_per_test']}")
+        if metadata.get('flagged_trials'):
+            print(f"Trials flagged for interference: {metadata['flagged_trials']}")
         
-        print(f"Algorithms tested: {', '.join(algorithms)}")
-        print(f"Data types: {', '.join(data_types)}")
-        print(f"Data sizes: {', '.join(map(str, data_sizes))}")
-        print(f"Total tests: {results['metadata']['total_tests_run']}")
-        print(f"Trials per test: {results['metadata']['num_trials_per_test']}")
-        
-        print(f"\nAnalysis completed: {results['metadata']['timestamp']}")
+        print(f"\nAnalysis completed: {metadata['timestamp']}")
         
         
         print("\n🏆 BEST PERFORMING ALGORITHMS:")
         print("-" * 40)
         
-        for data_type in data_types:
+        best = cube.best()
+        best_times = cube.best_times()
+        
+        for t, data_type in enumerate(cube.data_types):
             print(f"\n{data_type.upper()} DATA:")
             
-            for size in data_sizes:
-                best_algo = None
-                best_time = float('inf')
-                
-                for algo_name in algorithms:
-                    mean_time = results['results'][algo_name][data_type][size]['statistics']['mean']
-                    if mean_time < best_time:
-                        best_time = mean_time
-                        best_algo = algo_name
-                
-                from ..utils.helpers import format_time
-                print(f"  Size {size:,}: {best_algo} ({format_time(best_time)})")
+            for s, size in enumerate(cube.data_sizes):
+                print(f"  Size {size:,}: {cube.algorithms[best[t, s]]} ({format_time(best_times[t, s])})")
         
         print("\n" + "=" * 60)
@@ -0,0 +1,169 @@
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
+from ..utils.config import Config
+from ..algorithms.sorting_algorithms import allocate_buffer_like
+
+class StackSampler:
+    
+    def __init__(self, interval: float = None):
+        if interval is None:
+            interval = Config.PROFILE_SAMPLE_INTERVAL
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+        self._target = None
+        self._root_code = None
+        self._previous_switch_interval = None
+    
+    def start(self, root_code) -> None:
+        self._target = threading.get_ident()
+        self._root_code = root_code
+        self._stop.clear()
+        self._previous_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval)
+        
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._previous_switch_interval)
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            
+            stack = []
+            while frame is not None and frame.f_code is not self._root_code:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            
+            if stack and frame is not None:
+                self.stacks[';'.join(reversed(stack))] += 1
+    
+    def collapsed_lines(self) -> List[str]:
+        return [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+
+class CellProfiler:
+    
+    def __init__(self, selectors: List[str] = None, top_n: int = None, output_dir: str = None):
+        if top_n is None:
+            top_n = Config.PROFILE_TOP_N
+        if output_dir is None:
+            output_dir = Config.PROFILING_DIR
+        
+        self.selectors = [self.parse_selector(selector) for selector in (selectors or ['*'])]
+        self.top_n = top_n
+        self.output_dir = output_dir
+        self.profiles = []
+        self._stats_by_algorithm = {}
+    
+    @staticmethod
+    def parse_selector(selector: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        parts = (selector.split(':') + ['*', '*'])[:3]
+        algo_name, data_type, size = [None if part in ('', '*') else part for part in parts]
+        return algo_name, data_type, None if size is None else int(size)
+    
+    def wants(self, algo_name: str, data_type: str, size: int) -> bool:
+        for selected_algo, selected_type, selected_size in self.selectors:
+            if selected_algo not in (None, algo_name):
+                continue
+            if selected_type not in (None, data_type):
+                continue
+            if selected_size not in (None, size):
+                continue
+            return True
+        return False
+    
+    def _prepare_run(self, algorithm, data):
+        if isinstance(data, list):
+            data_copy = data.copy()
+            return lambda: algorithm.sort(data_copy)
+        
+        out = allocate_buffer_like(data)
+        return lambda: algorithm.sort_buffer(data, out)
+    
+    def _run_sampled(self, run) -> None:
+        run()
+    
+    def profile_cell(self, algorithm, data, algo_name: str, data_type: str, size: int) -> Dict[str, Any]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        slug = f"{algo_name.lower().replace(' ', '_')}_{data_type}_{size}"
+        pstats_path = os.path.join(self.output_dir, f"{slug}.pstats")
+        collapsed_path = os.path.join(self.output_dir, f"{slug}.collapsed")
+        
+        
+        profile = cProfile.Profile()
+        run = self._prepare_run(algorithm, data)
+        profile.runcall(run)
+        profile.dump_stats(pstats_path)
+        
+        
+        sampler = StackSampler()
+        run = self._prepare_run(algorithm, data)
+        sampler.start(self._run_sampled.__code__)
+        try:
+            self._run_sampled(run)
+        finally:
+            sampler.stop()
+        
+        with open(collapsed_path, 'w') as f:
+            f.write('\n'.join(sampler.collapsed_lines()) + '\n')
+        
+        
+        stats = pstats.Stats(pstats_path)
+        if algo_name in self._stats_by_algorithm:
+            self._stats_by_algorithm[algo_name].add(pstats_path)
+        else:
+            self._stats_by_algorithm[algo_name] = stats
+        
+        entry = {
+            'algorithm': algo_name,
+            'data_type': data_type,
+            'data_size': size,
+            'pstats_path': pstats_path,
+            'collapsed_path': collapsed_path,
+            'samples': sum(sampler.stacks.values()),
+            'hot_functions': self.hot_functions(stats)
+        }
+        self.profiles.append(entry)
+        return entry
+    
+    def hot_functions(self, stats: pstats.Stats) -> List[Dict[str, Any]]:
+        rows = []
+        for (filename, line, func_name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({
+                'function': f"{os.path.basename(filename)}:{line}({func_name})",
+                'calls': ncalls,
+                'self_time': tottime,
+                'cumulative_time': cumtime
+            })
+        
+        rows.sort(key=lambda row: row['self_time'], reverse=True)
+        return rows[:self.top_n]
+    
+    def print_report(self) -> None:
+        from ..utils.helpers import format_time
+        
+        if not self._stats_by_algorithm:
+            return
+        
+        print(f"\n🔥 TOP {self.top_n} HOT FUNCTIONS PER ALGORITHM:")
+        print("-" * 60)
+        
+        for algo_name, stats in self._stats_by_algorithm.items():
+            print(f"\n{algo_name}:")
+            for rank, row in enumerate(self.hot_functions(stats), 1):
+                print(f"  {rank:2}. {row['function']:45} {format_time(row['self_time']):>10} "
+                      f"self, {row['calls']:,} calls")
+        
+        print(f"\nProfiles saved to: {self.output_dir}")
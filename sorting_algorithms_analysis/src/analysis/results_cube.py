@@ -0,0 +1,102 @@
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Union
+from .results_store import as_frame, load_columnar_results, load_timings, results_to_timings
+
+class ResultsCube:
+    
+    def __init__(self, times: np.ndarray, algorithms: List[str], data_types: List[str],
+                 data_sizes: List[int], metadata: Dict[str, Any] = None):
+        self.times = times
+        self.algorithms = list(algorithms)
+        self.data_types = list(data_types)
+        self.data_sizes = [int(size) for size in data_sizes]
+        self.metadata = metadata or {}
+        
+        self.mean = np.nanmean(times, axis=-1)
+        self.std_dev = np.nanstd(times, axis=-1)
+        self.min = np.nanmin(times, axis=-1)
+        self.max = np.nanmax(times, axis=-1)
+    
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, timings: np.ndarray = None) -> 'ResultsCube':
+        algorithms = frame.attrs.get('algorithms') or list(pd.unique(frame['algorithm']))
+        data_types = frame.attrs.get('data_types') or list(pd.unique(frame['data_type']))
+        data_sizes = frame.attrs.get('data_sizes') or sorted(pd.unique(frame['data_size']))
+        
+        if timings is None:
+            timings = frame['mean'].to_numpy()[:, np.newaxis]
+        
+        
+        algo_idx = cls._axis_codes(frame['algorithm'], algorithms)
+        type_idx = cls._axis_codes(frame['data_type'], data_types)
+        size_idx = cls._axis_codes(frame['data_size'], data_sizes)
+        
+        times = np.full((len(algorithms), len(data_types), len(data_sizes), timings.shape[1]), np.nan)
+        times[algo_idx, type_idx, size_idx] = timings
+        
+        return cls(times, algorithms, data_types, data_sizes, frame.attrs.get('metadata'))
+    
+    @staticmethod
+    def _axis_codes(column: pd.Series, categories: List[Any]) -> np.ndarray:
+        codes = pd.Categorical(column, categories=categories).codes
+        unknown = codes < 0
+        if unknown.any():
+            label = column[unknown].tolist()[0]
+            raise ValueError(f"{column.name} {label!r} is not one of the cube's labels {list(categories)}")
+        return codes
+    
+    @classmethod
+    def from_results(cls, results: Union[Dict[str, Any], pd.DataFrame]) -> 'ResultsCube':
+        if isinstance(results, pd.DataFrame):
+            return cls.from_frame(results)
+        return cls.from_frame(as_frame(results), results_to_timings(results))
+    
+    @classmethod
+    def load(cls, csv_path: str) -> 'ResultsCube':
+        return cls.from_frame(load_columnar_results(csv_path), load_timings(csv_path))
+    
+    def cell_mean(self, algorithm: str, data_type: str, size: int) -> float:
+        return self.mean[self.algorithms.index(algorithm), self.data_types.index(data_type),
+                         self.data_sizes.index(int(size))]
+    
+    def percentiles(self, q: Union[float, List[float]]) -> np.ndarray:
+        return np.nanpercentile(self.times, q, axis=-1)
+    
+    def rankings(self) -> np.ndarray:
+        return np.argsort(self.mean, axis=0, kind='stable')
+    
+    def ranks(self) -> np.ndarray:
+        return np.argsort(self.rankings(), axis=0) + 1
+    
+    def best(self) -> np.ndarray:
+        return self.rankings()[0]
+    
+    def best_times(self) -> np.ndarray:
+        return np.min(self.mean, axis=0)
+    
+    def speedup_over_second(self) -> np.ndarray:
+        if len(self.algorithms) < 2:
+            return np.full(self.mean.shape[1:], np.nan)
+        
+        ordered = np.sort(self.mean, axis=0)
+        return (ordered[1] - ordered[0]) / ordered[0]
+    
+    def speedup_ratios(self) -> np.ndarray:
+        return self.mean / self.best_times()[np.newaxis]
+    
+    def win_matrix(self) -> np.ndarray:
+        return np.sum(self.mean[:, np.newaxis] < self.mean[np.newaxis, :], axis=(2, 3))
+    
+    def summary_frame(self) -> pd.DataFrame:
+        index = pd.MultiIndex.from_product([self.algorithms, self.data_types, self.data_sizes],
+                                           names=['algorithm', 'data_type', 'data_size'])
+        return pd.DataFrame({
+            'mean': self.mean.ravel(),
+            'std_dev': self.std_dev.ravel(),
+            'min': self.min.ravel(),
+            'max': self.max.ravel(),
+            'rank': self.ranks().ravel(),
+            'slowdown_vs_best': self.speedup_ratios().ravel()
+        }, index=index)
@@ -0,0 +1,119 @@
+
+import glob
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Union
+from ..utils.config import Config
+
+CELL_COLUMNS = ['algorithm', 'data_type', 'data_size', 'mean', 'std_dev', 'min', 'max', 'count',
+                'cpu_time_mean', 'gc_pause_total', 'flagged_trials']
+TIMINGS_SUFFIX = '_timings.npy'
+META_SUFFIX = '_meta.json'
+
+def _base_path(csv_path: str) -> str:
+    return csv_path[:-len('.csv')] if csv_path.endswith('.csv') else csv_path
+
+def results_to_frame(results: Dict[str, Any]) -> pd.DataFrame:
+    rows = []
+    complexities = {}
+    
+    for algo_name, type_data in results['results'].items():
+        for data_type, size_data in type_data.items():
+            for size, performance in size_data.items():
+                stats = performance['statistics']
+                interference = performance.get('interference')
+                if interference:
+                    accounting = (interference['cpu_time_mean'], interference['gc_pause_total'],
+                                  len(interference['flagged_trials']))
+                else:
+                    accounting = (np.nan, np.nan, np.nan)
+                rows.append((algo_name, data_type, int(size), stats['mean'], stats['std_dev'],
+                             stats['min'], stats['max'], stats['count']) + accounting)
+                
+                if algo_name not in complexities:
+                    complexities[algo_name] = dict(performance['time_complexities'],
+                                                   space=performance['space_complexity'])
+    
+    frame = pd.DataFrame(rows, columns=CELL_COLUMNS)
+    frame.attrs.update({
+        'algorithms': list(results['algorithms']),
+        'data_types': list(results['data_types']),
+        'data_sizes': [int(size) for size in results['data_sizes']],
+        'metadata': results.get('metadata', {}),
+        'complexities': complexities
+    })
+    return frame
+
+def results_to_timings(results: Dict[str, Any]) -> np.ndarray:
+    trials = []
+    for type_data in results['results'].values():
+        for size_data in type_data.values():
+            for performance in size_data.values():
+                trials.append(performance['execution_times'])
+    
+    width = max((len(times) for times in trials), default=0)
+    timings = np.full((len(trials), width), np.nan)
+    for row, times in enumerate(trials):
+        timings[row, :len(times)] = times
+    
+    return timings
+
+def as_frame(results: Union[Dict[str, Any], pd.DataFrame]) -> pd.DataFrame:
+    if isinstance(results, pd.DataFrame):
+        return results
+    return results_to_frame(results)
+
+def save_columnar_results(results: Dict[str, Any], basename: str, directory: str = None) -> str:
+    if directory is None:
+        directory = Config.PERFORMANCE_DATA_DIR
+    
+    base = os.path.join(directory, basename)
+    frame = results_to_frame(results)
+    
+    frame.to_csv(base + '.csv', index=False)
+    np.save(base + TIMINGS_SUFFIX, results_to_timings(results))
+    with open(base + META_SUFFIX, 'w') as f:
+        json.dump(frame.attrs, f, indent=2)
+    
+    return base + '.csv'
+
+def load_columnar_results(csv_path: str) -> pd.DataFrame:
+    frame = pd.read_csv(csv_path, float_precision='round_trip')
+    
+    meta_path = _base_path(csv_path) + META_SUFFIX
+    if os.path.exists(meta_path):
+        with open(meta_path, 'r') as f:
+            frame.attrs.update(json.load(f))
+    else:
+        frame.attrs.update({
+            'algorithms': list(pd.unique(frame['algorithm'])),
+            'data_types': list(pd.unique(frame['data_type'])),
+            'data_sizes': sorted(int(size) for size in pd.unique(frame['data_size'])),
+            'metadata': {},
+            'complexities': {}
+        })
+    
+    return frame
+
+def load_timings(csv_path: str) -> np.ndarray:
+    return np.load(_base_path(csv_path) + TIMINGS_SUFFIX)
+
+def find_columnar_results(directory: str = None) -> List[str]:
+    if directory is None:
+        directory = Config.PERFORMANCE_DATA_DIR
+    
+    return sorted(glob.glob(os.path.join(directory, 'performance_results_*.csv')))
+
+def load_results_history(directory: str = None) -> pd.DataFrame:
+    frames = []
+    for csv_path in find_columnar_results(directory):
+        frame = pd.read_csv(csv_path, float_precision='round_trip')
+        frame.insert(0, 'run', os.path.basename(_base_path(csv_path)))
+        frames.append(frame)
+    
+    if not frames:
+        return pd.DataFrame(columns=['run'] + CELL_COLUMNS)
+    
+    return pd.concat(frames, ignore_index=True)
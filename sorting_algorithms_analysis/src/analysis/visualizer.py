@@ -6,6 +6,8 @@ import os
 from typing import Dict, List, Any
 from ..utils.config import Config
 from ..utils.helpers import format_time
+from .results_store import as_frame
+from .results_cube import ResultsCube
 
 class Visualizer:
     
@@ -25,17 +27,17 @@ class Visualizer:
     def create_runtime_comparison_plot(self, results: Dict[str, Any], data_type: str) -> str:
         fig, ax = plt.subplots(figsize=self.config.FIGURE_SIZE)
         
-        algorithms = results['algorithms']
-        data_sizes = results['data_sizes']
+        frame = as_frame(results)
+        algorithms = frame.attrs['algorithms']
+        data_sizes = frame.attrs['data_sizes']
+        
+        subset = frame[frame['data_type'] == data_type]
+        mean_table = subset.pivot(index='data_size', columns='algorithm', values='mean').reindex(data_sizes)
+        std_table = subset.pivot(index='data_size', columns='algorithm', values='std_dev').reindex(data_sizes)
         
         for algo_name in algorithms:
-            mean_times = []
-            std_times = []
-            
-            for size in data_sizes:
-                stats = results['results'][algo_name][data_type][size]['statistics']
-                mean_times.append(stats['mean'])
-                std_times.append(stats['std_dev'])
+            mean_times = mean_table[algo_name].to_numpy()
+            std_times = std_table[algo_name].to_numpy()
             
             
             ax.errorbar(data_sizes, mean_times, yerr=std_times, 
@@ -67,9 +69,10 @@ class Visualizer:
         return filepath
     
     def create_algorithm_comparison_heatmap(self, results: Dict[str, Any]) -> str:
-        algorithms = results['algorithms']
-        data_types = results['data_types']
-        data_sizes = results['data_sizes']
+        cube = ResultsCube.from_results(results)
+        algorithms = cube.algorithms
+        data_types = cube.data_types
+        data_sizes = cube.data_sizes
         
         
         fig, axes = plt.subplots(1, len(data_sizes), figsize=(16, 5))
@@ -78,13 +81,8 @@ class Visualizer:
         
         for i, size in enumerate(data_sizes):
             
-            matrix = []
-            for algo_name in algorithms:
-                row = []
-                for data_type in data_types:
-                    mean_time = results['results'][algo_name][data_type][size]['statistics']['mean']
-                    row.append(mean_time)
-                matrix.append(row)
+            matrix = cube.mean[:, :, i]
+            threshold = np.max(matrix) / 2
             
             
             im = axes[i].imshow(matrix, cmap='YlOrRd', aspect='auto')
@@ -105,7 +103,7 @@ class Visualizer:
                 for k in range(len(data_types)):
                     text = f'{matrix[j][k]:.4f}s'
                     axes[i].text(k, j, text, ha='center', va='center', 
-                               fontsize=8, color='black' if matrix[j][k] < np.max(matrix)/2 else 'white')
+                               fontsize=8, color='black' if matrix[j][k] < threshold else 'white')
         
         plt.suptitle('Algorithm Performance Heatmap (Execution Time in Seconds)', 
                     fontsize=14, fontweight='bold', y=1.02)
@@ -120,9 +118,10 @@ class Visualizer:
         return filepath
     
     def create_scalability_plot(self, results: Dict[str, Any]) -> str:
-        algorithms = results['algorithms']
-        data_types = results['data_types']
-        data_sizes = results['data_sizes']
+        frame = as_frame(results)
+        algorithms = frame.attrs['algorithms']
+        data_types = frame.attrs['data_types']
+        data_sizes = frame.attrs['data_sizes']
         
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         axes = axes.flatten()
@@ -130,11 +129,11 @@ class Visualizer:
         for i, data_type in enumerate(data_types):
             ax = axes[i]
             
+            subset = frame[frame['data_type'] == data_type]
+            time_table = subset.pivot(index='data_size', columns='algorithm', values='mean').reindex(data_sizes)
+            
             for algo_name in algorithms:
-                times = []
-                for size in data_sizes:
-                    mean_time = results['results'][algo_name][data_type][size]['statistics']['mean']
-                    times.append(mean_time)
+                times = time_table[algo_name].to_numpy()
                 
                 ax.plot(data_sizes, times, marker='o', linewidth=2, markersize=6, label=algo_name)
             
@@ -162,15 +161,9 @@ class Visualizer:
         return filepath
     
     def create_complexity_comparison_plot(self, results: Dict[str, Any]) -> str:
-        algorithms = results['algorithms']
-        
-        
-        complexities = {}
-        for algo_name in algorithms:
-            
-            first_result = list(results['results'][algo_name].values())[0]
-            first_size_result = list(first_result.values())[0]
-            complexities[algo_name] = first_size_result['time_complexities']
+        frame = as_frame(results)
+        algorithms = frame.attrs['algorithms']
+        complexities = frame.attrs['complexities']
         
         
         fig, ax = plt.subplots(figsize=(12, 6))
@@ -183,7 +176,7 @@ class Visualizer:
                 complexities[algo_name]['best'],
                 complexities[algo_name]['average'],
                 complexities[algo_name]['worst'],
-                first_size_result['space_complexity']  
+                complexities[algo_name]['space']
             ]
             table_data.append(row)
         
@@ -220,11 +213,93 @@ class Visualizer:
         
         return filepath
     
+    def create_interpreter_speedup_plot(self, comparison: Dict[str, Any], baseline: str = None) -> str:
+        from .interpreter_comparison import interpreter_results
+        
+        interpreters = comparison['interpreters']
+        if baseline is None:
+            baseline = interpreters[0]
+        
+        cubes = {label: ResultsCube.from_results(interpreter_results(comparison, label)) for label in interpreters}
+        algorithms = cubes[baseline].algorithms
+        
+        fig, ax = plt.subplots(figsize=self.config.FIGURE_SIZE)
+        width = 0.8 / len(interpreters)
+        positions = np.arange(len(algorithms))
+        
+        for i, label in enumerate(interpreters):
+            
+            ratios = cubes[baseline].mean / cubes[label].mean
+            speedups = np.exp(np.nanmean(np.log(ratios), axis=(1, 2)))
+            
+            bars = ax.bar(positions + i * width, speedups, width, label=label)
+            for bar, speedup in zip(bars, speedups):
+                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height(), f'{speedup:.2f}x',
+                        ha='center', va='bottom', fontsize=8)
+        
+        ax.axhline(1.0, color='gray', linestyle='--', linewidth=1)
+        ax.set_xticks(positions + width * (len(interpreters) - 1) / 2)
+        ax.set_xticklabels(algorithms, fontsize=11)
+        ax.set_ylabel(f'Speedup vs {baseline} (geometric mean)', fontsize=12)
+        ax.set_title('Interpreter Speedup per Algorithm', fontsize=14, fontweight='bold')
+        ax.grid(True, axis='y', alpha=0.3)
+        ax.legend(fontsize=10)
+        
+        plt.tight_layout()
+        
+        
+        filename = 'interpreter_speedup.png'
+        filepath = os.path.join(self.config.GRAPHS_DIR, filename)
+        plt.savefig(filepath, dpi=self.config.DPI, bbox_inches='tight')
+        plt.close()
+        
+        return filepath
+    
+    def create_cache_sweep_plot(self, results: Dict[str, Any], data_type: str) -> str:
+        from .cache_sweep import normalized_cost
+        
+        cube = ResultsCube.from_results(results)
+        sweep = cube.metadata['cache_sweep']
+        data_sizes = np.array(cube.data_sizes)
+        t = cube.data_types.index(data_type)
+        
+        fig, ax = plt.subplots(figsize=self.config.FIGURE_SIZE)
+        
+        for a, algo_name in enumerate(cube.algorithms):
+            costs = [normalized_cost(mean_time, size) for mean_time, size in zip(cube.mean[a, t], data_sizes)]
+            ax.plot(data_sizes, costs, marker='o', linewidth=2, markersize=4, label=algo_name)
+        
+        
+        for name, boundary in sweep['boundaries'].items():
+            if data_sizes[0] <= boundary <= data_sizes[-1]:
+                ax.axvline(boundary, color='gray', linestyle='--', linewidth=1)
+                ax.text(boundary, 0.98, f" {name} ({sweep['cache_sizes'][name] // 1024:,} KiB)",
+                        transform=ax.get_xaxis_transform(), rotation=90, va='top', fontsize=9, color='gray')
+        
+        ax.set_xlabel('Data Size (elements)', fontsize=12)
+        ax.set_ylabel('Time per element·log₂ n (ns)', fontsize=12)
+        ax.set_title(f'Cache Hierarchy Sweep ({sweep["bytes_per_element"]} bytes/element)\n'
+                     f'{data_type.replace("_", " ").title()} Data', fontsize=14, fontweight='bold')
+        ax.set_xscale('log')
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=10)
+        
+        plt.tight_layout()
+        
+        
+        filename = f'cache_sweep_{data_type}.png'
+        filepath = os.path.join(self.config.GRAPHS_DIR, filename)
+        plt.savefig(filepath, dpi=self.config.DPI, bbox_inches='tight')
+        plt.close()
+        
+        return filepath
+    
     def create_all_plots(self, results: Dict[str, Any]) -> List[str]:
         created_plots = []
+        results = as_frame(results)
         
         print("  Creating runtime comparison plots...")
-        for data_type in results['data_types']:
+        for data_type in results.attrs['data_types']:
             plot_path = self.create_runtime_comparison_plot(results, data_type)
             created_plots.append(plot_path)
             print(f"    ✅ {os.path.basename(plot_path)}")
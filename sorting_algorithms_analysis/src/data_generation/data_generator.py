@@ -1,16 +1,23 @@
 
 import random
 import math
-from typing import List, Dict
+import zlib
+from array import array
+from typing import List, Dict, Sequence, Iterator, Tuple, Any
 from ..utils.config import Config
 
+def cell_seed(seed: int, data_type: str, size: int) -> int:
+    return zlib.crc32(f"{seed}:{data_type}:{size}".encode())
+
 class DataGenerator:
     
-    def __init__(self):
+    def __init__(self, seed: int = None):
         self.config = Config()
+        self.random = random.Random(seed)
     
     def generate_random_data(self, size: int) -> List[int]:
-        return [random.randint(0, size * 10) for _ in range(size)]
+        randint = self.random.randint
+        return [randint(0, size * 10) for _ in range(size)]
     
     def generate_sorted_data(self, size: int) -> List[int]:
         return list(range(size))
@@ -21,24 +28,57 @@ class DataGenerator:
     def generate_nearly_sorted_data(self, size: int) -> List[int]:
         
         data = list(range(size))
+        self._apply_random_swaps(data)
+        
+        return data
+    
+    def _random_string(self, length: int) -> str:
+        alphabet = self.config.STRING_ALPHABET
+        return ''.join(self.random.choices(alphabet, k=length))
+    
+    def generate_random_string_data(self, size: int) -> List[str]:
+        low, high = self.config.STRING_LENGTH_RANGE
+        randint = self.random.randint
+        return [self._random_string(randint(low, high)) for _ in range(size)]
+    
+    def generate_shared_prefix_data(self, size: int) -> List[str]:
+        
+        prefixes = [self._random_string(self.config.SHARED_PREFIX_LENGTH)
+                    for _ in range(self.config.SHARED_PREFIX_COUNT)]
+        choice = self.random.choice
+        randint = self.random.randint
+        return [choice(prefixes) + self._random_string(randint(2, 8)) for _ in range(size)]
+    
+    def generate_url_like_data(self, size: int) -> List[str]:
+        hosts = [f"{self._random_string(6)}.example.{tld}" for tld in ('com', 'org', 'net') for _ in range(3)]
+        segments = ['api', 'v1', 'v2', 'users', 'orders', 'items', 'search', 'static', 'assets', 'logs']
+        choice = self.random.choice
+        randint = self.random.randint
+        
+        return [f"https://{choice(hosts)}/" + '/'.join(choice(segments) for _ in range(randint(1, 4)))
+                + f"?id={randint(0, size * 10)}" for _ in range(size)]
+    
+    def _apply_random_swaps(self, data: Sequence[int]) -> None:
+        size = len(data)
         
         
         num_swaps = int(size * self.config.NEARLY_SORTED_DISORDER_PERCENTAGE)
         
         
         for _ in range(num_swaps):
-            i = random.randint(0, size - 1)
-            j = random.randint(0, size - 1)
+            i = self.random.randint(0, size - 1)
+            j = self.random.randint(0, size - 1)
             data[i], data[j] = data[j], data[i]
-        
-        return data
     
-    def generate_dataset(self, data_type: str, size: int) -> List[int]:
+    def generate_dataset(self, data_type: str, size: int) -> List[Any]:
         generators = {
             'random': self.generate_random_data,
             'sorted': self.generate_sorted_data,
             'reversed': self.generate_reversed_data,
-            'nearly_sorted': self.generate_nearly_sorted_data
+            'nearly_sorted': self.generate_nearly_sorted_data,
+            'random_strings': self.generate_random_string_data,
+            'shared_prefix': self.generate_shared_prefix_data,
+            'url_like': self.generate_url_like_data
         }
         
         if data_type not in generators:
@@ -46,14 +86,59 @@ class DataGenerator:
         
         return generators[data_type](size)
     
-    def generate_all_datasets(self) -> Dict[str, Dict[int, List[int]]]:
+    def generate_compact_dataset(self, data_type: str, size: int) -> array:
+        typecode = self.config.COMPACT_TYPECODE
+        
+        if data_type == 'random':
+            randint = self.random.randint
+            return array(typecode, (randint(0, size * 10) for _ in range(size)))
+        if data_type == 'sorted':
+            return array(typecode, range(size))
+        if data_type == 'reversed':
+            return array(typecode, range(size, 0, -1))
+        if data_type == 'nearly_sorted':
+            data = array(typecode, range(size))
+            self._apply_random_swaps(data)
+            return data
+        
+        raise ValueError(f"Unknown data type: {data_type}")
+    
+    def iter_datasets(self, sizes: List[int] = None, seed: int = None, compact: bool = False,
+                      from_disk: bool = False, data_types: List[str] = None) -> Iterator[Tuple[str, int, Any]]:
+        if data_types is None:
+            data_types = self.config.DATA_TYPES
+        if sizes is None:
+            sizes = self.config.COMPACT_DATA_SIZES if compact else self.config.DATA_SIZES
+        
+        for data_type in data_types:
+            for size in sizes:
+                data = self.load_dataset(data_type, size) if from_disk else None
+                if data is None:
+                    generator = self if seed is None else DataGenerator(cell_seed(seed, data_type, size))
+                    if compact:
+                        data = generator.generate_compact_dataset(data_type, size)
+                    else:
+                        data = generator.generate_dataset(data_type, size)
+                elif compact:
+                    data = array(self.config.COMPACT_TYPECODE, data)
+                
+                yield data_type, size, data
+    
+    def generate_all_compact_datasets(self, sizes: List[int] = None) -> Dict[str, Dict[int, array]]:
         datasets = {}
         
-        for data_type in self.config.DATA_TYPES:
-            datasets[data_type] = {}
-            for size in self.config.DATA_SIZES:
-                print(f"  Generating {data_type} data of size {size:,}")
-                datasets[data_type][size] = self.generate_dataset(data_type, size)
+        for data_type, size, data in self.iter_datasets(sizes, compact=True):
+            print(f"  Generating compact {data_type} data of size {size:,}")
+            datasets.setdefault(data_type, {})[size] = data
+        
+        return datasets
+    
+    def generate_all_datasets(self, sizes: List[int] = None, seed: int = None) -> Dict[str, Dict[int, List[int]]]:
+        datasets = {}
+        
+        for data_type, size, data in self.iter_datasets(sizes, seed):
+            print(f"  Generating {data_type} data of size {size:,}")
+            datasets.setdefault(data_type, {})[size] = data
         
         return datasets
     
@@ -74,6 +159,17 @@ class DataGenerator:
                 
                 print(f"Saved {data_type} data (size {size}) to {filename}")
     
+    def load_dataset(self, data_type: str, size: int) -> List[int]:
+        import json
+        import os
+        
+        filepath = os.path.join(self.config.DATA_DIR, f"{data_type}_{size}.json")
+        if not os.path.exists(filepath):
+            return None
+        
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    
     def load_datasets(self) -> Dict[str, Dict[int, List[int]]]:
         import json
         import os
@@ -0,0 +1,139 @@
+
+import multiprocessing
+import queue
+import threading
+import traceback
+from array import array
+from typing import List, Any, Iterator, Tuple
+from ..utils.config import Config
+from .data_generator import DataGenerator
+
+_DONE = 'done'
+_ERROR = 'error'
+_DATASET = 'dataset'
+_BUFFER = 'buffer'
+CHUNK_BYTES = 1 << 20
+
+class _PipeChannel:
+    
+    def __init__(self, context):
+        self.reader, self.writer = context.Pipe(duplex=False)
+    
+    def put(self, message: tuple) -> None:
+        kind, payload = message
+        if kind == _DATASET and isinstance(payload[2], array):
+            
+            data_type, size, data = payload
+            self.writer.send((_BUFFER, (data_type, size, data.typecode, len(data))))
+            view = memoryview(data).cast('B')
+            for offset in range(0, len(view), CHUNK_BYTES):
+                self.writer.send_bytes(view, offset, min(CHUNK_BYTES, len(view) - offset))
+            return
+        self.writer.send(message)
+    
+    def get(self) -> tuple:
+        try:
+            kind, payload = self.reader.recv()
+            if kind != _BUFFER:
+                return kind, payload
+            
+            data_type, size, typecode, length = payload
+            data = array(typecode, [0]) * length
+            for offset in range(0, length * data.itemsize, CHUNK_BYTES):
+                self.reader.recv_bytes_into(data, offset)
+            return _DATASET, (data_type, size, data)
+        except EOFError:
+            return _ERROR, "Dataset producer process exited unexpectedly"
+    
+    def close_writer(self) -> None:
+        self.writer.close()
+
+def _produce(options: dict, output, slots, stop) -> None:
+    try:
+        generator = DataGenerator(options.pop('generator_seed'))
+        datasets = generator.iter_datasets(**options)
+        
+        while True:
+            
+            slots.acquire()
+            if stop.is_set():
+                return
+            
+            item = next(datasets, None)
+            if item is None:
+                break
+            output.put((_DATASET, item))
+            item = None
+        
+        output.put((_DONE, None))
+    except BaseException:
+        output.put((_ERROR, traceback.format_exc()))
+
+class DatasetPipeline:
+    
+    def __init__(self, sizes: List[int] = None, seed: int = None, compact: bool = False,
+                 from_disk: bool = False, data_types: List[str] = None, mode: str = None,
+                 max_live: int = None, generator_seed: int = None):
+        self.config = Config()
+        self.compact = compact
+        self.data_types = list(data_types or self.config.DATA_TYPES)
+        self.data_sizes = list(sizes or (self.config.COMPACT_DATA_SIZES if compact else self.config.DATA_SIZES))
+        self.mode = mode or self.config.PREFETCH_MODE
+        self.max_live = max_live or self.config.MAX_LIVE_DATASETS
+        
+        if self.mode not in ('process', 'thread'):
+            raise ValueError(f"Unknown prefetch mode: {self.mode}")
+        if self.max_live < 2:
+            raise ValueError("The pipeline needs room for at least two live datasets")
+        
+        self.options = {
+            'sizes': self.data_sizes,
+            'seed': seed,
+            'compact': compact,
+            'from_disk': from_disk,
+            'data_types': self.data_types,
+            'generator_seed': generator_seed
+        }
+    
+    def __len__(self) -> int:
+        return len(self.data_types) * len(self.data_sizes)
+    
+    def _start(self):
+        if self.mode == 'process':
+            context = multiprocessing.get_context('spawn')
+            output, slots, stop = _PipeChannel(context), context.BoundedSemaphore(self.max_live), context.Event()
+            worker = context.Process(target=_produce, args=(dict(self.options), output, slots, stop), daemon=True)
+            worker.start()
+            output.close_writer()
+        else:
+            output, slots, stop = queue.Queue(), threading.BoundedSemaphore(self.max_live), threading.Event()
+            worker = threading.Thread(target=_produce, args=(dict(self.options), output, slots, stop), daemon=True)
+            worker.start()
+        
+        return worker, output, slots, stop
+    
+    def __iter__(self) -> Iterator[Tuple[str, int, Any]]:
+        worker, output, slots, stop = self._start()
+        
+        try:
+            while True:
+                kind, payload = output.get()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise RuntimeError(f"Dataset generation failed:\n{payload}")
+                
+                
+                yield payload
+                payload = None
+                slots.release()
+        finally:
+            stop.set()
+            try:
+                slots.release()
+            except ValueError:
+                pass
+            
+            worker.join(timeout=1)
+            if self.mode == 'process' and worker.is_alive():
+                worker.terminate()
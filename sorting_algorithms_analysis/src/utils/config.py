@@ -1,5 +1,7 @@
 
+import json
 import os
+import platform
 
 class Config:
       
@@ -9,16 +11,126 @@ class Config:
     GRAPHS_DIR = os.path.join(RESULTS_DIR, 'graphs')
     PERFORMANCE_DATA_DIR = os.path.join(RESULTS_DIR, 'performance_data')
     REPORTS_DIR = os.path.join(BASE_DIR, 'reports')
+    PROFILING_DIR = os.path.join(RESULTS_DIR, 'profiling')
+    CALIBRATION_DIR = os.path.join(DATA_DIR, 'calibration')
+    MICROBENCH_DIR = os.path.join(DATA_DIR, 'microbenchmarks')
     
     
     DATA_SIZES = [1000, 10000, 100000]  
     DATA_TYPES = ['random', 'sorted', 'reversed', 'nearly_sorted']
+    STRING_DATA_TYPES = ['random_strings', 'shared_prefix', 'url_like']
+    
+    
+    COMPACT_DATA_SIZES = [1000000, 10000000]
+    COMPACT_TYPECODE = 'q'
     
     
     NUM_TRIALS = 5  
     
     
+    PREFETCH_MODE = 'process'
+    MAX_LIVE_DATASETS = 2
+    
+    
     NEARLY_SORTED_DISORDER_PERCENTAGE = 0.1  
+    STRING_ALPHABET = 'abcdefghijklmnopqrstuvwxyz0123456789'
+    STRING_LENGTH_RANGE = (8, 24)
+    SHARED_PREFIX_LENGTH = 48
+    SHARED_PREFIX_COUNT = 4
+    
+    
+    CAPTURE_HARDWARE_COUNTERS = True
+    MAX_LOAD_PER_CORE = 0.5
+    CAPTURE_TRIAL_METRICS = True
+    INTERFERENCE_MIN_CPU_RATIO = 0.9
+    INTERFERENCE_MAX_GC_FRACTION = 0.05
+    INTERFERENCE_MAX_SWITCH_RATE = 20.0
+    INTERFERENCE_MIN_WALL_TIME = 0.001
+    
+    
+    MERGE_FAN_INS = [2, 4, 8, 16]
+    MERGE_FAN_IN_SWEEP_SIZE = 100000
+    SELECTION_K_RATIOS = [0.001, 0.01, 0.1, 0.5]
+    SELECTION_SWEEP_SIZE = 100000
+    INCREMENTAL_TOTAL_SIZE = 20000
+    INCREMENTAL_BATCH_SIZES = [100, 1000, 10000]
+    BATCH_ARRAY_SIZES = [4, 10, 100, 1000]
+    BATCH_TOTAL_ELEMENTS = 200000
+    RECORD_WIDTHS = [1, 4, 16, 64]
+    RECORD_SORT_SIZE = 20000
+    
+    
+    CACHE_SWEEP_DATA_TYPES = ['random']
+    CACHE_SWEEP_MIN_SIZE = 256
+    CACHE_SWEEP_MAX_SIZE = 1000000
+    CACHE_SWEEP_POINTS_PER_BOUNDARY = 7
+    CACHE_SWEEP_SPAN = 4.0
+    CACHE_SWEEP_BACKGROUND_FACTOR = 2.0
+    DEFAULT_CACHE_SIZES = {'L1d': 32 * 1024, 'L2': 1024 * 1024, 'L3': 32 * 1024 * 1024}
+    
+    
+    SORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    SORT_CACHE_DIR = os.path.join(DATA_DIR, 'sort_cache')
+    SORT_CACHE_DISK_MAX_BYTES = 1024 * 1024 * 1024
+    SORT_CACHE_POOL_SIZE = 16
+    SORT_CACHE_REQUESTS = 200
+    SORT_CACHE_ARRAY_SIZE = 10000
+    
+    
+    BASE_CASE_CUTOFFS = {}
+    HEAP_ARITY = 2
+    MERGE_FAN_IN = 4
+    
+    
+    TUNING_PROFILE_VERSION = 1
+    TUNING_PROFILE = None
+    CUTOFF_CANDIDATES = [0, 4, 8, 12, 16, 24, 32, 48, 64]
+    HEAP_ARITY_CANDIDATES = [2, 3, 4, 8]
+    MERGE_FAN_IN_CANDIDATES = [2, 4, 8, 16]
+    CALIBRATION_SIZES = [256, 4096]
+    CALIBRATION_TRIALS = 3
+    CALIBRATION_NOISE_SAMPLES = 30
+    TARGET_RELATIVE_ERROR = 0.02
+    MIN_TRIALS = 3
+    MAX_TRIALS = 20
+    ADAPTIVE_TIME_BUDGET = 10.0
+    
+    
+    MICROBENCH_SIZES = [1024, 16384]
+    MICROBENCH_SEED = 1234
+    MICROBENCH_MIN_TIME = 0.2
+    MICROBENCH_REPEATS = 7
+    MICROBENCH_TOLERANCE = 0.10
+    MICROBENCH_NOISE_SIGMAS = 3.0
+    MICROBENCH_CONFIRM_RUNS = 2
+    
+    
+    DISTRIBUTED_HOST = '127.0.0.1'
+    DISTRIBUTED_PORT = 6543
+    DISTRIBUTED_AUTHKEY_ENV = 'SORTING_ANALYSIS_AUTHKEY'
+    DISTRIBUTED_AUTHKEY_BYTES = 16
+    DISTRIBUTED_SEED = 42
+    DISTRIBUTED_POLL_INTERVAL = 0.2
+    DISTRIBUTED_LOCAL_WORKERS = 2
+    
+    
+    INTERPRETERS = ['python3', 'python3.11', 'python3.12', 'python3.13', 'python3.13t',
+                    'python3.14', 'python3.14t', 'pypy3']
+    INTERPRETER_RUN_TIMEOUT = 3600
+    
+    
+    METRICS_NAMESPACE = 'sorting'
+    METRICS_HOST = '127.0.0.1'
+    METRICS_PORT = 9464
+    METRICS_FILE = os.path.join(RESULTS_DIR, 'metrics', 'sorting.prom')
+    METRICS_INTERVAL = 5.0
+    METRICS_LATENCY_BUCKETS = [1e-5, 1e-4, 1e-3, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+    METRICS_QUANTILES = [0.5, 0.9, 0.99]
+    METRICS_WINDOW = 256
+    
+    
+    PROFILE_TOP_N = 10
+    PROFILE_SAMPLE_INTERVAL = 0.0005
     
     
     FIGURE_SIZE = (12, 8)
@@ -36,3 +148,50 @@ class Config:
         
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
+    
+    @classmethod
+    def tuning_profile_path(cls, hostname: str = None) -> str:
+        return os.path.join(cls.CALIBRATION_DIR, f"tuning_profile_{hostname or platform.node() or 'localhost'}.json")
+    
+    @classmethod
+    def load_tuning_profile(cls, path: str = None) -> bool:
+        if path is None:
+            path = cls.tuning_profile_path()
+        
+        try:
+            with open(path, 'r') as f:
+                profile = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        
+        if profile.get('version') != cls.TUNING_PROFILE_VERSION:
+            return False
+        if profile.get('python_version') != platform.python_version():
+            return False
+        
+        parameters = dict(profile['parameters'])
+        parameters['num_trials'] = max(parameters.get('num_trials', cls.NUM_TRIALS), cls.NUM_TRIALS)
+        parameters['profile'] = path
+        cls.apply_tuning_parameters(parameters)
+        return True
+    
+    @classmethod
+    def tuning_parameters(cls) -> dict:
+        return {
+            'cutoffs': dict(cls.BASE_CASE_CUTOFFS),
+            'heap_arity': cls.HEAP_ARITY,
+            'merge_fan_in': cls.MERGE_FAN_IN,
+            'num_trials': cls.NUM_TRIALS,
+            'profile': cls.TUNING_PROFILE
+        }
+    
+    @classmethod
+    def apply_tuning_parameters(cls, parameters: dict) -> None:
+        cls.BASE_CASE_CUTOFFS = dict(parameters.get('cutoffs', cls.BASE_CASE_CUTOFFS))
+        cls.HEAP_ARITY = parameters.get('heap_arity', cls.HEAP_ARITY)
+        cls.MERGE_FAN_IN = parameters.get('merge_fan_in', cls.MERGE_FAN_IN)
+        cls.NUM_TRIALS = parameters.get('num_trials', cls.NUM_TRIALS)
+        cls.TUNING_PROFILE = parameters.get('profile', cls.TUNING_PROFILE)
+
+Config.load_tuning_profile()
@@ -0,0 +1,312 @@
+
+import ctypes
+import ctypes.util
+import gc
+import os
+import platform
+import struct
+import sys
+import time
+from typing import Dict, List, Any, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PERF_EVENT_OPEN_SYSCALLS = {
+    'x86_64': 298,
+    'amd64': 298,
+    'aarch64': 241,
+    'arm64': 241,
+    'i386': 336,
+    'i686': 336,
+    'ppc64le': 319,
+    's390x': 331
+}
+
+PERF_TYPE_HARDWARE = 0
+HARDWARE_EVENTS = {
+    'cycles': 0,
+    'instructions': 1,
+    'cache_misses': 3
+}
+
+PERF_EVENT_IOC_ENABLE = 0x2400
+PERF_EVENT_IOC_DISABLE = 0x2401
+PERF_EVENT_IOC_RESET = 0x2403
+
+PERF_FLAG_DISABLED = 1 << 0
+PERF_FLAG_EXCLUDE_KERNEL = 1 << 5
+PERF_FLAG_EXCLUDE_HV = 1 << 6
+
+COMPARABILITY_KEYS = ['python_version', 'python_implementation', 'cpu_model', 'logical_cores', 'cpu_governor']
+
+class _PerfEventAttr(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_uint32),
+        ('size', ctypes.c_uint32),
+        ('config', ctypes.c_uint64),
+        ('sample_period', ctypes.c_uint64),
+        ('sample_type', ctypes.c_uint64),
+        ('read_format', ctypes.c_uint64),
+        ('flags', ctypes.c_uint64),
+        ('wakeup_events', ctypes.c_uint32),
+        ('bp_type', ctypes.c_uint32),
+        ('config1', ctypes.c_uint64)
+    ]
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def cpu_model() -> str:
+    cpuinfo = _read_text('/proc/cpuinfo')
+    if cpuinfo:
+        for line in cpuinfo.splitlines():
+            if line.startswith('model name') or line.startswith('Model'):
+                return line.split(':', 1)[1].strip()
+    
+    return platform.processor() or platform.machine()
+
+def _parse_cache_size(text: str) -> Optional[int]:
+    multipliers = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper()
+    try:
+        if text and text[-1] in multipliers:
+            return int(text[:-1]) * multipliers[text[-1]]
+        return int(text)
+    except ValueError:
+        return None
+
+def cache_sizes(cpu: int = 0) -> Dict[str, int]:
+    caches = {}
+    index = 0
+    while True:
+        directory = f'/sys/devices/system/cpu/cpu{cpu}/cache/index{index}'
+        level = _read_text(os.path.join(directory, 'level'))
+        if level is None:
+            break
+        index += 1
+        
+        cache_type = _read_text(os.path.join(directory, 'type'))
+        size = _parse_cache_size(_read_text(os.path.join(directory, 'size')) or '')
+        if cache_type == 'Instruction' or size is None:
+            continue
+        
+        name = f"L{level}d" if cache_type == 'Data' else f"L{level}"
+        caches[name] = size
+    
+    return dict(sorted(caches.items(), key=lambda item: item[1]))
+
+def collect_environment() -> Dict[str, Any]:
+    environment = {
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'python_build': ' '.join(platform.python_build()),
+        'gil_enabled': getattr(sys, '_is_gil_enabled', lambda: True)(),
+        'platform': platform.platform(),
+        'hostname': platform.node(),
+        'cpu_model': cpu_model(),
+        'logical_cores': os.cpu_count(),
+        'physical_cores': None,
+        'cpu_governor': _read_text('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor'),
+        'cpu_freq_mhz': None,
+        'cpu_freq_max_mhz': None,
+        'load_average': list(os.getloadavg()) if hasattr(os, 'getloadavg') else None,
+        'memory_available_bytes': None,
+        'memory_total_bytes': None,
+        'hardware_counters': PerfCounters().available,
+        'cache_sizes': cache_sizes()
+    }
+    
+    if psutil is not None:
+        environment['physical_cores'] = psutil.cpu_count(logical=False)
+        frequency = psutil.cpu_freq()
+        if frequency is not None:
+            environment['cpu_freq_mhz'] = frequency.current
+            environment['cpu_freq_max_mhz'] = frequency.max or None
+        memory = psutil.virtual_memory()
+        environment['memory_available_bytes'] = memory.available
+        environment['memory_total_bytes'] = memory.total
+    
+    return environment
+
+def comparability_warnings(environment: Dict[str, Any], max_load_per_core: float = 0.5) -> List[str]:
+    warnings = []
+    
+    governor = environment.get('cpu_governor')
+    if governor not in (None, 'performance'):
+        warnings.append(f"CPU frequency governor is '{governor}', not 'performance'")
+    
+    load_average = environment.get('load_average')
+    cores = environment.get('logical_cores') or 1
+    if load_average and load_average[0] > max_load_per_core * cores:
+        warnings.append(f"1-minute load average {load_average[0]:.2f} is high for {cores} cores")
+    
+    current = environment.get('cpu_freq_mhz')
+    maximum = environment.get('cpu_freq_max_mhz')
+    if current and maximum and current < 0.8 * maximum:
+        warnings.append(f"CPU running at {current:.0f} MHz of {maximum:.0f} MHz maximum")
+    
+    available = environment.get('memory_available_bytes')
+    total = environment.get('memory_total_bytes')
+    if available and total and available < 0.1 * total:
+        warnings.append("Less than 10% of memory available; swapping may distort timings")
+    
+    return warnings
+
+def compare_environments(first: Dict[str, Any], second: Dict[str, Any]) -> List[str]:
+    mismatches = []
+    for key in COMPARABILITY_KEYS:
+        if first.get(key) != second.get(key):
+            mismatches.append(f"{key}: {first.get(key)!r} != {second.get(key)!r}")
+    return mismatches
+
+class PerfCounters:
+    
+    def __init__(self, events: Dict[str, int] = None):
+        self.events = events if events is not None else HARDWARE_EVENTS
+        self._fds = {}
+        self._open()
+    
+    @property
+    def available(self) -> bool:
+        return len(self._fds) == len(self.events)
+    
+    def _open(self) -> None:
+        syscall_number = PERF_EVENT_OPEN_SYSCALLS.get(platform.machine().lower())
+        if syscall_number is None or fcntl is None or not sys.platform.startswith('linux'):
+            return
+        
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        except OSError:
+            return
+        
+        for name, config in self.events.items():
+            attr = _PerfEventAttr()
+            attr.type = PERF_TYPE_HARDWARE
+            attr.size = ctypes.sizeof(_PerfEventAttr)
+            attr.config = config
+            attr.flags = PERF_FLAG_DISABLED | PERF_FLAG_EXCLUDE_KERNEL | PERF_FLAG_EXCLUDE_HV
+            
+            fd = libc.syscall(syscall_number, ctypes.byref(attr), 0, -1, -1, 0)
+            if fd < 0:
+                self.close()
+                return
+            self._fds[name] = fd
+    
+    def _ioctl(self, request: int) -> None:
+        for fd in self._fds.values():
+            fcntl.ioctl(fd, request, 0)
+    
+    def reset(self) -> None:
+        self._ioctl(PERF_EVENT_IOC_RESET)
+    
+    def start(self) -> None:
+        self._ioctl(PERF_EVENT_IOC_ENABLE)
+    
+    def stop(self) -> None:
+        self._ioctl(PERF_EVENT_IOC_DISABLE)
+    
+    def read(self) -> Dict[str, Optional[int]]:
+        if not self.available:
+            return {name: None for name in self.events}
+        return {name: struct.unpack('q', os.read(fd, 8))[0] for name, fd in self._fds.items()}
+    
+    def close(self) -> None:
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds = {}
+    
+    def __del__(self):
+        self.close()
+
+class TrialMonitor:
+    
+    def __init__(self):
+        self._process = psutil.Process() if resource is None and psutil is not None else None
+        self._gc_started = None
+        self._gc_pause = 0.0
+        self._gc_collections = [0] * len(gc.get_count())
+        self._switches = None
+        self._cpu_start = 0.0
+    
+    @property
+    def available(self) -> bool:
+        return resource is not None or self._process is not None
+    
+    def _on_gc(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == 'start':
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            self._gc_pause += time.perf_counter() - self._gc_started
+            self._gc_collections[info['generation']] += 1
+            self._gc_started = None
+    
+    def _context_switches(self) -> Optional[tuple]:
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            return usage.ru_nvcsw, usage.ru_nivcsw
+        if self._process is not None:
+            switches = self._process.num_ctx_switches()
+            return switches.voluntary, switches.involuntary
+        return None
+    
+    def start(self) -> None:
+        self._gc_started = None
+        self._gc_pause = 0.0
+        self._gc_collections = [0] * len(self._gc_collections)
+        gc.callbacks.append(self._on_gc)
+        
+        self._switches = self._context_switches()
+        self._cpu_start = time.process_time()
+    
+    def stop(self) -> Dict[str, Any]:
+        cpu_time = time.process_time() - self._cpu_start
+        switches = self._context_switches()
+        gc.callbacks.remove(self._on_gc)
+        
+        metrics = {
+            'cpu_time': cpu_time,
+            'gc_collections': sum(self._gc_collections),
+            'gc_collections_by_generation': list(self._gc_collections),
+            'gc_pause': self._gc_pause,
+            'voluntary_switches': None,
+            'involuntary_switches': None
+        }
+        if switches is not None and self._switches is not None:
+            metrics['voluntary_switches'] = switches[0] - self._switches[0]
+            metrics['involuntary_switches'] = switches[1] - self._switches[1]
+        return metrics
+
+def interference_flags(metrics: Dict[str, Any], wall_time: float, min_cpu_ratio: float = 0.9,
+                       max_gc_fraction: float = 0.05, max_switch_rate: float = 20.0,
+                       min_wall_time: float = 0.001) -> List[str]:
+    flags = []
+    
+    if wall_time >= min_wall_time and metrics['cpu_time'] < min_cpu_ratio * wall_time:
+        flags.append('cpu_starved')
+    
+    if metrics['gc_pause'] > max_gc_fraction * wall_time:
+        flags.append('gc_pauses')
+    
+    involuntary = metrics.get('involuntary_switches')
+    if involuntary is not None and involuntary > max(1.0, max_switch_rate * wall_time):
+        flags.append('context_switches')
+    
+    return flags
@@ -8,12 +8,18 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.utils.config import Config
 from src.utils.helpers import format_time
+from src.analysis.results_store import find_columnar_results
+from src.analysis.results_cube import ResultsCube
 
 def load_latest_results():
     config = Config()
     results_dir = config.PERFORMANCE_DATA_DIR
     
     
+    csv_files = find_columnar_results(results_dir)
+    if csv_files:
+        return ResultsCube.load(csv_files[-1])
+    
     json_files = [f for f in os.listdir(results_dir) if f.endswith('.json')]
     if not json_files:
         print("No results files found!")
@@ -23,44 +29,40 @@ def load_latest_results():
     filepath = os.path.join(results_dir, latest_file)
     
     with open(filepath, 'r') as f:
-        return json.load(f)
+        return ResultsCube.from_results(json.load(f))
 
-def print_performance_summary(results):
+def print_performance_summary(cube):
     print("🔍 DETAILED PERFORMANCE ANALYSIS SUMMARY")
     print("=" * 60)
     
-    algorithms = results['algorithms']
-    data_types = results['data_types']
-    data_sizes = results['data_sizes']
+    algorithms = cube.algorithms
+    data_types = cube.data_types
+    data_sizes = cube.data_sizes
+    metadata = cube.metadata
     
     print(f"📊 Analysis Overview:")
     print(f"   • Algorithms: {', '.join(algorithms)}")
     print(f"   • Data Types: {', '.join(data_types)}")
     print(f"   • Data Sizes: {', '.join([f'{s//1000}K' for s in data_sizes])}")
-    print(f"   • Tests Run: {results['metadata']['total_tests_run']}")
-    print(f"   • Trials per Test: {results['metadata']['num_trials_per_test']}")
-    print(f"   • Analysis Date: {results['metadata']['timestamp']}")
+    print(f"   • Tests Run: {metadata['total_tests_run']}")
+    print(f"   • Trials per Test: {metadata['num_trials_per_test']}")
+    print(f"   • Analysis Date: {metadata['timestamp']}")
     print()
     
     
-    for data_type in data_types:
+    rankings = cube.rankings()
+    
+    for t, data_type in enumerate(data_types):
         print(f"📈 {data_type.upper().replace('_', ' ')} DATA PERFORMANCE:")
         print("-" * 50)
         
-        for size in data_sizes:
+        for s, size in enumerate(data_sizes):
             print(f"\n  📏 Size {size//1000}K elements:")
             
-            
-            perf_data = []
-            for algo_name in algorithms:
-                stats = results['results'][algo_name][data_type][str(size)]['statistics']
-                perf_data.append((algo_name, stats['mean'], stats['std_dev']))
-            
-            
-            perf_data.sort(key=lambda x: x[1])
-            
-            for rank, (algo_name, mean_time, std_dev) in enumerate(perf_data, 1):
-                print(f"     {rank}. {algo_name:12} | {format_time(mean_time):>10} (±{format_time(std_dev)})")
+            for rank, a in enumerate(rankings[:, t, s], 1):
+                mean_time = cube.mean[a, t, s]
+                std_dev = cube.std_dev[a, t, s]
+                print(f"     {rank}. {algorithms[a]:12} | {format_time(mean_time):>10} (±{format_time(std_dev)})")
         
         print()
     
@@ -68,64 +70,38 @@ def print_performance_summary(results):
     print("🏆 CHAMPION ALGORITHMS BY SCENARIO:")
     print("-" * 50)
     
-    for data_type in data_types:
+    best = cube.best()
+    best_times = cube.best_times()
+    speedups = cube.speedup_over_second()
+    
+    for t, data_type in enumerate(data_types):
         print(f"\n  {data_type.replace('_', ' ').title()} Data:")
         
-        for size in data_sizes:
-            best_algo = None
-            best_time = float('inf')
-            
-            for algo_name in algorithms:
-                mean_time = results['results'][algo_name][data_type][str(size)]['statistics']['mean']
-                if mean_time < best_time:
-                    best_time = mean_time
-                    best_algo = algo_name
-            
+        for s, size in enumerate(data_sizes):
             improvement = ""
-            if best_algo:
-                
-                times = []
-                for algo_name in algorithms:
-                    if algo_name != best_algo:
-                        time_val = results['results'][algo_name][data_type][str(size)]['statistics']['mean']
-                        times.append(time_val)
-                
-                if times:
-                    second_best = min(times)
-                    improvement_pct = ((second_best - best_time) / best_time) * 100
-                    improvement = f" (🚀 {improvement_pct:.1f}% faster)"
+            if len(algorithms) > 1:
+                improvement = f" (🚀 {speedups[t, s] * 100:.1f}% faster)"
             
-            print(f"     {size//1000}K: {best_algo} - {format_time(best_time)}{improvement}")
+            print(f"     {size//1000}K: {algorithms[best[t, s]]} - {format_time(best_times[t, s])}{improvement}")
+    
+    
+    print("\n⚔️  HEAD-TO-HEAD WINS (row beats column):")
+    wins = cube.win_matrix()
+    print("     " + " ".join(f"{name:>12}" for name in algorithms))
+    for a, algo_name in enumerate(algorithms):
+        print(f"     {algo_name:12}" + " ".join(f"{wins[a, b]:>12}" for b in range(len(algorithms))))
     
     print("\n" + "=" * 60)
     print("✅ Summary generation completed!")
 
-def generate_csv_export(results):
-    import csv
-    
+def generate_csv_export(cube):
     config = Config()
     csv_path = os.path.join(config.PERFORMANCE_DATA_DIR, "performance_summary.csv")
     
-    with open(csv_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        
-        
-        writer.writerow(['Algorithm', 'Data_Type', 'Data_Size', 'Mean_Time_Sec', 'Std_Dev_Sec', 'Min_Time_Sec', 'Max_Time_Sec'])
-        
-        
-        for algo_name in results['algorithms']:
-            for data_type in results['data_types']:
-                for size in results['data_sizes']:
-                    stats = results['results'][algo_name][data_type][str(size)]['statistics']
-                    writer.writerow([
-                        algo_name,
-                        data_type,
-                        size,
-                        stats['mean'],
-                        stats['std_dev'],
-                        stats['min'],
-                        stats['max']
-                    ])
+    export = cube.summary_frame().reset_index()
+    export = export[['algorithm', 'data_type', 'data_size', 'mean', 'std_dev', 'min', 'max']]
+    export.columns = ['Algorithm', 'Data_Type', 'Data_Size', 'Mean_Time_Sec', 'Std_Dev_Sec', 'Min_Time_Sec', 'Max_Time_Sec']
+    export.to_csv(csv_path, index=False)
     
     print(f"📁 CSV export saved to: {csv_path}")
 
@@ -0,0 +1,271 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.algorithms.base_cases import small_sort
+from src.algorithms.sorting_algorithms import QuickSort, MergeSort, HeapSort
+from src.utils.config import Config
+from src.utils.environment import collect_environment
+
+BASELINE_VERSION = 1
+MAD_TO_SIGMA = 1.4826
+
+def _random_values(size, seed):
+    rng = random.Random(seed)
+    return [rng.randint(1, size * 10) for _ in range(size)]
+
+def partition_kernel(size, seed):
+    data = _random_values(size, seed)
+    algorithm = QuickSort()
+    
+    def prepare():
+        random.seed(seed)
+        return (data.copy(), 0, size - 1)
+    
+    return algorithm._partition, prepare
+
+def merge_kernel(size, seed):
+    data = _random_values(size, seed)
+    left = sorted(data[:size // 2])
+    right = sorted(data[size // 2:])
+    algorithm = MergeSort()
+    
+    def prepare():
+        return (left, right)
+    
+    return algorithm._merge, prepare
+
+def heapify_kernel(size, seed):
+    data = _random_values(size, seed)
+    heapify = HeapSort()._heapify
+    
+    def build(arr):
+        for i in range(size // 2 - 1, -1, -1):
+            heapify(arr, size, i)
+    
+    def prepare():
+        return (data.copy(),)
+    
+    return build, prepare
+
+def small_sort_kernel(size, seed):
+    data = _random_values(size, seed)
+    
+    def sort_chunks(arr):
+        for low in range(0, size - 15, 16):
+            small_sort(arr, low, low + 15)
+    
+    def prepare():
+        return (data.copy(),)
+    
+    return sort_chunks, prepare
+
+KERNELS = {
+    'partition': partition_kernel,
+    'merge': merge_kernel,
+    'heapify': heapify_kernel,
+    'small_sort': small_sort_kernel
+}
+
+def time_loop(kernel, prepare, number):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start_time = time.perf_counter()
+        for _ in range(number):
+            kernel(*prepare())
+        total = time.perf_counter() - start_time
+        
+        
+        start_time = time.perf_counter()
+        for _ in range(number):
+            prepare()
+        overhead = time.perf_counter() - start_time
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return max(total - overhead, 0.0)
+
+def calibrate_loop(kernel, prepare, min_time):
+    number = 1
+    while True:
+        elapsed = time_loop(kernel, prepare, number)
+        if elapsed >= min_time:
+            return number
+        
+        
+        if elapsed <= 0:
+            number *= 10
+        else:
+            number = max(number + 1, int(number * min_time * 1.2 / elapsed))
+
+def median_absolute_deviation(samples):
+    center = statistics.median(samples)
+    return statistics.median(abs(sample - center) for sample in samples)
+
+def run_kernel(name, size, seed, min_time, repeats):
+    kernel, prepare = KERNELS[name](size, seed)
+    number = calibrate_loop(kernel, prepare, min_time)
+    
+    per_element = [time_loop(kernel, prepare, number) / (number * size) * 1e9 for _ in range(repeats)]
+    return {
+        'ns_per_element': min(per_element),
+        'median_ns_per_element': statistics.median(per_element),
+        'mad_ns_per_element': median_absolute_deviation(per_element),
+        'samples': per_element,
+        'number': number,
+        'repeats': repeats
+    }
+
+def change_threshold(result, reference, tolerance, sigmas):
+    spread = MAD_TO_SIGMA * math.hypot(result.get('mad_ns_per_element', 0.0),
+                                       reference.get('mad_ns_per_element', 0.0))
+    return max(tolerance, sigmas * spread / reference['median_ns_per_element'])
+
+def change_ratio(result, reference):
+    return result['median_ns_per_element'] / reference['median_ns_per_element']
+
+def run_suite(kernels, sizes, seed, min_time, repeats):
+    results = {}
+    for name in kernels:
+        results[name] = {}
+        for size in sizes:
+            result = run_kernel(name, size, seed, min_time, repeats)
+            results[name][str(size)] = result
+            print(f"   {name:<12} n={size:<8} {result['median_ns_per_element']:8.2f} ns/element "
+                  f"(±{result['mad_ns_per_element']:.2f} MAD, min {result['ns_per_element']:.2f}, "
+                  f"{result['number']} loops)")
+    
+    return {
+        'version': BASELINE_VERSION,
+        'hostname': platform.node(),
+        'python_version': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'settings': {'seed': seed, 'sizes': list(sizes), 'min_time': min_time, 'repeats': repeats},
+        'results': results,
+        'environment': collect_environment()
+    }
+
+def baseline_path(hostname=None):
+    return os.path.join(Config.MICROBENCH_DIR, f"baseline_{hostname or platform.node() or 'localhost'}.json")
+
+def save_baseline(suite, filepath=None):
+    if filepath is None:
+        filepath = baseline_path(suite['hostname'])
+    
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'w') as f:
+        json.dump(suite, f, indent=2)
+    return filepath
+
+def load_baseline(filepath=None):
+    if filepath is None:
+        filepath = baseline_path()
+    if not os.path.exists(filepath):
+        return None
+    
+    with open(filepath, 'r') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        print(f"⚠️  Ignoring baseline {filepath}: unsupported version {baseline.get('version')}")
+        return None
+    return baseline
+
+def confirm_regression(name, size, suite, reference, tolerance, sigmas):
+    settings = suite['settings']
+    result = suite['results'][name][size]
+    for attempt in range(Config.MICROBENCH_CONFIRM_RUNS):
+        
+        rerun = run_kernel(name, int(size), settings['seed'], settings['min_time'], settings['repeats'])
+        if rerun['median_ns_per_element'] < result['median_ns_per_element']:
+            result = rerun
+            suite['results'][name][size] = rerun
+        if change_ratio(result, reference) <= 1 + change_threshold(result, reference, tolerance, sigmas):
+            break
+    return result
+
+def compare_to_baseline(suite, baseline, tolerance, sigmas=None):
+    if sigmas is None:
+        sigmas = Config.MICROBENCH_NOISE_SIGMAS
+    
+    if baseline['python_version'] != suite['python_version']:
+        print(f"⚠️  Baseline was recorded on Python {baseline['python_version']}, "
+              f"running on {suite['python_version']}")
+    if baseline['settings']['seed'] != suite['settings']['seed']:
+        print(f"⚠️  Baseline used seed {baseline['settings']['seed']}, inputs differ from this run")
+    
+    regressions = []
+    for name, sizes in suite['results'].items():
+        for size, result in sizes.items():
+            reference = baseline['results'].get(name, {}).get(size)
+            if reference is None:
+                print(f"   {name:<12} n={size:<8} no baseline")
+                continue
+            
+            if change_ratio(result, reference) > 1 + change_threshold(result, reference, tolerance, sigmas):
+                result = confirm_regression(name, size, suite, reference, tolerance, sigmas)
+            ratio = change_ratio(result, reference)
+            threshold = change_threshold(result, reference, tolerance, sigmas)
+            if ratio > 1 + threshold:
+                status = '❌ regression'
+                regressions.append((name, size, ratio))
+            elif ratio < 1 - threshold:
+                status = '🚀 improvement'
+            else:
+                status = '✅'
+            print(f"   {name:<12} n={size:<8} {reference['median_ns_per_element']:8.2f} -> "
+                  f"{result['median_ns_per_element']:8.2f} ns/element ({ratio:.2f}x, ±{threshold:.0%}) {status}")
+    
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Microbenchmarks for the sorting kernels')
+    parser.add_argument('--kernels', nargs='+', choices=list(KERNELS), default=list(KERNELS),
+                        help='Kernels to benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=Config.MICROBENCH_SIZES,
+                        help='Input sizes to benchmark')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Save this run as the baseline for this host')
+    parser.add_argument('--baseline', help='Baseline file to compare against (defaults to this host\'s baseline)')
+    parser.add_argument('--tolerance', type=float, default=Config.MICROBENCH_TOLERANCE,
+                        help='Minimum relative change before a kernel is flagged as a regression')
+    parser.add_argument('--sigmas', type=float, default=Config.MICROBENCH_NOISE_SIGMAS,
+                        help='Widen the threshold to this many standard deviations of the measured noise')
+    args = parser.parse_args()
+    
+    print("🔬 Running kernel microbenchmarks...")
+    suite = run_suite(args.kernels, args.sizes, Config.MICROBENCH_SEED,
+                      Config.MICROBENCH_MIN_TIME, Config.MICROBENCH_REPEATS)
+    
+    if args.save_baseline:
+        filepath = save_baseline(suite)
+        print(f"\n💾 Baseline saved to {filepath}")
+        return 0
+    
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print("\nℹ️  No baseline found, run with --save-baseline to record one")
+        return 0
+    
+    print(f"\n📊 Comparing medians against baseline from {baseline['timestamp']} "
+          f"(tolerance {args.tolerance:.0%} or {args.sigmas:g}σ of the noise, whichever is wider):")
+    regressions = compare_to_baseline(suite, baseline, args.tolerance, args.sigmas)
+    if regressions:
+        print(f"\n❌ {len(regressions)} kernel regression(s) detected")
+        return 1
+    
+    print("\n✅ No kernel regressions detected")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,26 @@
 import json
 import os
+import sys
 import glob
 
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.analysis.results_cube import ResultsCube
+
 results_dir = os.path.join(os.path.dirname(__file__), '../results/performance_data')
-json_files = glob.glob(os.path.join(results_dir, 'performance_results_*.json'))
-if not json_files:
-    raise FileNotFoundError('No performance results JSON files found in results/performance_data/')
-results_file = max(json_files, key=os.path.getmtime)
+results_files = glob.glob(os.path.join(results_dir, 'performance_results_*.csv'))
+if not results_files:
+    results_files = glob.glob(os.path.join(results_dir, 'performance_results_*.json'))
+if not results_files:
+    raise FileNotFoundError('No performance results files found in results/performance_data/')
+results_file = max(results_files, key=os.path.getmtime)
 
-with open(results_file, 'r') as f:
-    results = json.load(f)
+if results_file.endswith('.csv'):
+    cube = ResultsCube.load(results_file)
+else:
+    with open(results_file, 'r') as f:
+        cube = ResultsCube.from_results(json.load(f))
 
 def format_time(seconds):
     if seconds < 0.001:
@@ -29,33 +39,28 @@ print("• 4 Data Types: Random, Sorted, Reversed, Nearly Sorted")
 print("• 3 Data Sizes: 1K, 10K, 100K elements")
 print("• 36 total tests (5 trials each)")
 
-print("\n⚡ KEY FINDINGS - 100K ELEMENTS:")
-for data_type in results['data_types']:
+largest = len(cube.data_sizes) - 1
+
+print(f"\n⚡ KEY FINDINGS - {cube.data_sizes[largest]//1000}K ELEMENTS:")
+for t, data_type in enumerate(cube.data_types):
     print(f"\n{data_type.upper()} DATA:")
-    for algo in results['algorithms']:
-        time_val = results['results'][algo][data_type]['100000']['statistics']['mean']
-        print(f"  {algo}: {format_time(time_val)}")
+    for a, algo in enumerate(cube.algorithms):
+        print(f"  {algo}: {format_time(cube.mean[a, t, largest])}")
 
 
 print("\n🏆 BEST PERFORMERS:")
-for data_type in results['data_types']:
-    best_algo = None
-    best_time = float('inf')
-    
-    for algo in results['algorithms']:
-        time_val = results['results'][algo][data_type]['100000']['statistics']['mean']
-        if time_val < best_time:
-            best_time = time_val
-            best_algo = algo
-    
-    print(f"• {data_type.title()}: {best_algo} ({format_time(best_time)})")
+best = cube.best()
+best_times = cube.best_times()
+for t, data_type in enumerate(cube.data_types):
+    print(f"• {data_type.title()}: {cube.algorithms[best[t, largest]]} ({format_time(best_times[t, largest])})")
 
 print("\n📈 SCALABILITY (Random Data):")
-for size in [1000, 10000, 100000]:
-    print(f"\n{size//1000}K Elements:")
-    for algo in results['algorithms']:
-        time_val = results['results'][algo]['random'][str(size)]['statistics']['mean']
-        print(f"  {algo}: {format_time(time_val)}")
+if 'random' in cube.data_types:
+    random_idx = cube.data_types.index('random')
+    for s, size in enumerate(cube.data_sizes):
+        print(f"\n{size//1000}K Elements:")
+        for a, algo in enumerate(cube.algorithms):
+            print(f"  {algo}: {format_time(cube.mean[a, random_idx, s])}")
 
 print("\n🎯 RECOMMENDATIONS:")
 print("• Merge Sort: Most consistent, best for critical applications")
@@ -1,12 +1,42 @@
 
+import ctypes
+import gc
+import json
+import math
+import platform
 import sys
 import os
+import tempfile
+import threading
+from multiprocessing.connection import Client
+from array import array
+import numpy as np
 
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.algorithms.sorting_algorithms import QuickSort, MergeSort, HeapSort
-from src.utils.helpers import is_sorted
+from src.algorithms.sorting_algorithms import QuickSort, MergeSort, HeapSort, MultiwayMergeSort
+from src.algorithms.selection import quickselect, top_k, partial_sort
+from src.algorithms.sorted_container import IncrementalSortedList
+from src.algorithms.batch import sort_many
+from src.algorithms.permutation import apply_permutation
+from src.algorithms.sort_cache import CachedAlgorithm
+from src.algorithms.string_sorts import MultikeyQuickSort, BurstSort
+from src.analysis.results_store import (save_columnar_results, load_columnar_results, load_timings,
+                                        results_to_frame, results_to_timings)
+from src.analysis.results_cube import ResultsCube
+from src.analysis.cache_sweep import cache_boundaries, size_ladder, boundary_slowdowns
+from src.analysis.performance_analyzer import PerformanceAnalyzer
+from src.analysis.metrics import MetricsRegistry, Counter, Histogram
+from src.analysis.interpreter_comparison import InterpreterComparison, discover_interpreters, interpreter_results
+from src.analysis.profiler import CellProfiler
+from src.analysis.distributed import BenchmarkCoordinator, BenchmarkWorker, run_local_cluster
+from src.data_generation.data_generator import DataGenerator
+from src.data_generation.dataset_pipeline import DatasetPipeline
+from src.utils.config import Config
+from src.utils.environment import (PerfCounters, TrialMonitor, collect_environment, comparability_warnings,
+                                   compare_environments, interference_flags)
+from src.utils.helpers import is_sorted, calculate_statistics, generate_random_array
 
 def test_algorithm(algorithm, test_data):
     print(f"Testing {algorithm.name}...")
@@ -29,6 +59,688 @@ def test_algorithm(algorithm, test_data):
     
     return True
 
+def test_algorithm_buffers(algorithm, test_data):
+    print(f"Testing {algorithm.name} on typed buffers...")
+    
+    for i, data in enumerate(test_data):
+        original = array('q', data)
+        out = array('q', bytes(len(original) * original.itemsize))
+        algorithm.sort_buffer(original, out)
+        
+        
+        if list(out) != sorted(data) or list(original) != data:
+            print(f"  ❌ Buffer test {i+1} FAILED: output buffer not sorted correctly")
+            return False
+        
+        
+        algorithm.sort_buffer(original)
+        if list(original) != sorted(data):
+            print(f"  ❌ Buffer test {i+1} FAILED: in-place sort incorrect")
+            return False
+        
+        print(f"  ✅ Buffer test {i+1} passed")
+    
+    big_endian = (ctypes.c_int64.__ctype_be__ * 3)(3, 1, 2)
+    try:
+        algorithm.sort_buffer(big_endian)
+        print("  ❌ Buffer test accepted a big-endian buffer")
+        return False
+    except ValueError:
+        pass
+    
+    return True
+
+def test_selection(test_data):
+    print("Testing selection APIs...")
+    
+    for i, data in enumerate(test_data):
+        expected = sorted(data)
+        
+        for k in {0, len(data) // 2, len(data) - 1}:
+            if not 0 <= k < len(data):
+                continue
+            
+            if quickselect(data, k) != expected[k]:
+                print(f"  ❌ Selection test {i+1} FAILED: quickselect k={k}")
+                return False
+            if top_k(data, k) != expected[:k]:
+                print(f"  ❌ Selection test {i+1} FAILED: top_k k={k}")
+                return False
+            if partial_sort(data, k)[:k] != expected[:k]:
+                print(f"  ❌ Selection test {i+1} FAILED: partial_sort k={k}")
+                return False
+        
+        print(f"  ✅ Selection test {i+1} passed")
+    
+    return True
+
+def test_incremental_sorted_list(test_data):
+    print("Testing IncrementalSortedList...")
+    
+    container = IncrementalSortedList()
+    expected = []
+    
+    for i, data in enumerate(test_data):
+        container.insert_batch(data)
+        expected = sorted(expected + data)
+        
+        if container.to_list() != expected:
+            print(f"  ❌ Incremental test {i+1} FAILED: batch insert out of order")
+            return False
+        
+        if data:
+            container.remove(data[0])
+            expected.remove(data[0])
+            expected_rank = sum(1 for value in expected if value < data[0])
+            if container.to_list() != expected or container.rank(data[0]) != expected_rank:
+                print(f"  ❌ Incremental test {i+1} FAILED: remove/rank incorrect")
+                return False
+        
+        print(f"  ✅ Incremental test {i+1} passed")
+    
+    return True
+
+def test_sort_many(algorithm, test_data):
+    print(f"Testing {algorithm.name} sort_many...")
+    
+    batch = test_data + [data[:n] for data in test_data for n in (2, 5, 8, 9, 16)]
+    expected = [sorted(data) for data in batch]
+    
+    for method in ['base_case', 'segmented', 'per_call']:
+        if sort_many(batch, algorithm, method) != expected:
+            print(f"  ❌ sort_many ({method}) FAILED")
+            return False
+        print(f"  ✅ sort_many ({method}) passed")
+    
+    
+    floats = [[value + 0.5 for value in range(size, 0, -1)] for size in [40] * 64]
+    if sort_many(floats) != [sorted(arr) for arr in floats]:
+        print("  ❌ sort_many (auto) truncated float input")
+        return False
+    try:
+        sort_many(floats, method='segmented')
+        print("  ❌ sort_many (segmented) accepted float input")
+        return False
+    except TypeError:
+        pass
+    
+    full_sorts = []
+    probe = QuickSort(4)
+    probe.sort = lambda arr: full_sorts.append(len(arr)) or sorted(arr)
+    if probe.sort_many([[3, 1, 2], [6, 5, 4, 3, 2, 1]]) != [[1, 2, 3], [1, 2, 3, 4, 5, 6]] or full_sorts != [6]:
+        print("  ❌ sort_many ignored the instance cutoff")
+        return False
+    
+    return True
+
+def test_argsort(algorithm, test_data):
+    print(f"Testing {algorithm.name} argsort...")
+    
+    for i, data in enumerate(test_data + [[-5, 3, -5, 0, 7, -2]]):
+        records = [float(value) for value in data]
+        for keys in (data, records):
+            expected = sorted(range(len(keys)), key=lambda index: keys[index])
+            if algorithm.argsort(keys) != expected:
+                print(f"  ❌ argsort test {i+1} FAILED")
+                return False
+    
+    print(f"  ✅ argsort passed {len(test_data) + 1} tests")
+    return True
+
+def test_apply_permutation(test_data):
+    print("Testing apply_permutation...")
+    
+    for i, data in enumerate(test_data):
+        perm = QuickSort().argsort(data)
+        original = perm.copy()
+        keys, labels, buffer = list(data), [f"row{index}" for index in range(len(data))], array('q', data)
+        apply_permutation(perm, keys, labels, buffer)
+        
+        if perm != original or keys != sorted(data) or list(buffer) != keys:
+            print(f"  ❌ apply_permutation test {i+1} FAILED")
+            return False
+        if labels != [f"row{index}" for index in original]:
+            print(f"  ❌ apply_permutation test {i+1} moved columns inconsistently")
+            return False
+    
+    for perm in ([1, 0, 2, 2], [1, 0, 3, 3], [2, 0, 1, 4]):
+        keys, labels = [10, 20, 30, 40], ['a', 'b', 'c', 'd']
+        try:
+            apply_permutation(perm, keys, labels)
+            print(f"  ❌ apply_permutation accepted the invalid permutation {perm}")
+            return False
+        except ValueError:
+            pass
+        if keys != [10, 20, 30, 40] or labels != ['a', 'b', 'c', 'd']:
+            print(f"  ❌ apply_permutation moved data before rejecting {perm}")
+            return False
+    
+    print(f"  ✅ apply_permutation passed {len(test_data)} tests")
+    return True
+
+def test_sort_cache(test_data):
+    print("Testing sort cache...")
+    
+    cached = CachedAlgorithm(QuickSort())
+    for _ in range(2):
+        for i, data in enumerate(test_data):
+            result = cached.sort(data)
+            if result != sorted(data):
+                print(f"  ❌ cached sort test {i+1} FAILED")
+                return False
+            result.append(0)
+            
+            buffer = array('q', data)
+            if list(cached.sort_buffer(buffer)) != sorted(data):
+                print(f"  ❌ cached buffer test {i+1} FAILED")
+                return False
+    
+    stats = cached.cache_stats()
+    if stats['hits'] != stats['misses'] or stats['sorted_inputs'] == 0:
+        print(f"  ❌ unexpected cache statistics {stats}")
+        return False
+    
+    data = test_data[0]
+    for _ in range(2):
+        strided = array('q', [0] * (2 * len(data)))
+        target = memoryview(strided)[::2]
+        cached.sort_buffer(array('q', data), target)
+        if list(target) != sorted(data):
+            print("  ❌ cached buffer sort into a strided target FAILED")
+            return False
+    
+    for data in ([3, 1, 2], [1, 2, 3]):
+        cached.sort_buffer(array('q', data))
+        for out in (array('d', [0] * 3), array('b', [0] * 24), array('q', [0] * 4)):
+            try:
+                cached.sort_buffer(array('q', data), out)
+                print(f"  ❌ cached buffer sort wrote into a mismatched {out.typecode!r} output")
+                return False
+            except ValueError:
+                pass
+    try:
+        cached.sort_buffer((ctypes.c_int64.__ctype_be__ * 3)(1, 2, 3))
+        print("  ❌ cached buffer sort accepted a big-endian buffer")
+        return False
+    except ValueError:
+        pass
+    
+    mixed = CachedAlgorithm(QuickSort())
+    for data in ([True, False], [1, 0], [1.0, 0.0], [True, False]):
+        result = mixed.sort(data)
+        if result != sorted(data) or [type(item) for item in result] != [type(item) for item in sorted(data)]:
+            print(f"  ❌ cached sort returned {result} for {data}")
+            return False
+    if mixed.cache_stats()['hits'] != 1:
+        print("  ❌ sort cache keys collide across element types")
+        return False
+    
+    small = CachedAlgorithm(QuickSort(), max_bytes=4096)
+    for size in range(200, 1000, 100):
+        small.sort(list(range(size, 0, -1)))
+    if small.cache_stats()['evictions'] == 0 or small.cache.current_bytes > 4096:
+        print("  ❌ sort cache exceeded its byte budget")
+        return False
+    
+    with tempfile.TemporaryDirectory() as disk_dir:
+        CachedAlgorithm(MergeSort(), disk_dir=disk_dir).sort(test_data[0])
+        reloaded = CachedAlgorithm(MergeSort(), disk_dir=disk_dir)
+        if reloaded.sort(test_data[0]) != sorted(test_data[0]) or reloaded.cache_stats()['disk_hits'] != 1:
+            print("  ❌ sort cache disk tier FAILED")
+            return False
+    
+    cached = CachedAlgorithm(QuickSort())
+    datasets = {'random': {20: test_data[0] * 3, 40: test_data[0] * 6}}
+    results = PerformanceAnalyzer().analyze_algorithms({'Quick Sort': QuickSort(), cached.name: cached}, datasets)
+    if results['algorithms'] != ['Quick Sort'] or list(results['results']) != ['Quick Sort']:
+        print("  ❌ cached variant leaked into the ranked results")
+        return False
+    for size, performance in results['cached_results'][cached.name]['random'].items():
+        cache = performance['cache']
+        if cache['misses'] != 1 or cache['hits'] != len(performance['execution_times']) - 1:
+            print(f"  ❌ cell {size} recorded cumulative cache statistics {cache}")
+            return False
+    if results['metadata']['cache_stats'][cached.name]['misses'] != 2:
+        print("  ❌ run cache statistics are wrong")
+        return False
+    
+    print(f"  ✅ sort cache passed {len(test_data)} tests")
+    return True
+
+def test_string_sorts(string_data):
+    print("Testing string sorts...")
+    
+    algorithms = [MultikeyQuickSort(), MultikeyQuickSort(0), BurstSort(), BurstSort(2, 0), QuickSort(), MergeSort()]
+    for algorithm in algorithms:
+        for i, data in enumerate(string_data):
+            if algorithm.sort(data) != sorted(data):
+                print(f"  ❌ {algorithm.name} string test {i+1} FAILED")
+                return False
+            if algorithm.argsort(data) != sorted(range(len(data)), key=lambda index: data[index]):
+                print(f"  ❌ {algorithm.name} string argsort test {i+1} FAILED")
+                return False
+        if not algorithm.supports_buffers:
+            try:
+                algorithm.sort_buffer(array('q', [2, 1]))
+                print(f"  ❌ {algorithm.name} accepted a numeric buffer")
+                return False
+            except ValueError:
+                pass
+        print(f"  ✅ {algorithm.name} passed {len(string_data)} string tests")
+    
+    return True
+
+def build_results(times):
+    algorithms = list(times)
+    data_types = list(next(iter(times.values())))
+    data_sizes = list(next(iter(next(iter(times.values())).values())))
+    
+    results = {'algorithms': algorithms, 'data_types': data_types, 'data_sizes': data_sizes,
+               'metadata': {'timestamp': '2024-01-01 00:00:00'}, 'results': {}}
+    for algo_name, type_data in times.items():
+        for data_type, size_data in type_data.items():
+            for size, execution_times in size_data.items():
+                results['results'].setdefault(algo_name, {}).setdefault(data_type, {})[size] = {
+                    'execution_times': execution_times,
+                    'statistics': calculate_statistics(execution_times),
+                    'time_complexities': {'best': 'O(n log n)', 'average': 'O(n log n)', 'worst': 'O(n²)'},
+                    'space_complexity': 'O(log n)'
+                }
+    return results
+
+def test_results_store():
+    print("Testing columnar results round-trip...")
+    
+    results = build_results({
+        'Quick Sort': {'random': {100: [0.002, 0.003, 0.004], 1000: [0.03, 0.02]}},
+        'Merge Sort': {'random': {100: [0.001, 0.002, 0.003], 1000: [0.05, 0.04]}}
+    })
+    results['results']['Quick Sort']['random'][100]['interference'] = {
+        'cpu_time_mean': 0.0025, 'gc_pause_total': 0.0, 'flagged_trials': [1]}
+    
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = save_columnar_results(results, 'performance_results_test', directory)
+        loaded = load_columnar_results(csv_path)
+        timings = load_timings(csv_path)
+    
+    expected = results_to_frame(results)
+    if not loaded.equals(expected) or loaded.attrs != expected.attrs:
+        print("  ❌ CSV round-trip changed the frame")
+        return False
+    if not np.array_equal(timings, results_to_timings(results), equal_nan=True) or timings.shape != (4, 3):
+        print("  ❌ .npy round-trip changed the timings")
+        return False
+    
+    print("  ✅ columnar results round-trip passed")
+    return True
+
+def test_results_cube():
+    print("Testing ResultsCube...")
+    
+    cube = ResultsCube.from_results(build_results({
+        'A': {'random': {100: [1.0, 1.0], 1000: [5.0, 5.0]}},
+        'B': {'random': {100: [2.0, 2.0], 1000: [3.0, 5.0]}},
+        'C': {'random': {100: [3.0, 3.0], 1000: [6.0, 6.0]}}
+    }))
+    
+    if cube.best().tolist() != [[0, 1]]:
+        print(f"  ❌ best returned {cube.best().tolist()}")
+        return False
+    if cube.win_matrix().tolist() != [[0, 1, 2], [1, 0, 2], [0, 0, 0]]:
+        print(f"  ❌ win_matrix returned {cube.win_matrix().tolist()}")
+        return False
+    if cube.cell_mean('B', 'random', 1000) != 4.0 or cube.ranks()[:, 0, 1].tolist() != [2, 1, 3]:
+        print("  ❌ cell means or ranks are wrong")
+        return False
+    
+    frame = results_to_frame(build_results({'A': {'random': {100: [1.0]}}, 'B': {'random': {100: [2.0]}}}))
+    frame.attrs['algorithms'] = ['A']
+    try:
+        ResultsCube.from_frame(frame)
+        print("  ❌ ResultsCube accepted an algorithm missing from its axis")
+        return False
+    except ValueError as error:
+        if "'B'" not in str(error):
+            print(f"  ❌ ResultsCube error does not name the unknown label: {error}")
+            return False
+    
+    print("  ✅ ResultsCube passed")
+    return True
+
+def test_cache_sweep_ladder():
+    print("Testing cache sweep size ladder...")
+    
+    boundaries = cache_boundaries({'L1': 32768, 'L2': 1 << 20}, 8)
+    if boundaries != {'L1': 4096, 'L2': 131072}:
+        print(f"  ❌ cache boundaries are wrong: {boundaries}")
+        return False
+    
+    sizes = size_ladder(boundaries, min_size=1000, max_size=200000, points_per_boundary=3,
+                        span=4.0, background_factor=4.0)
+    if sizes != [1000, 1024, 4000, 4096, 16000, 16384, 32768, 64000, 131072, 200000]:
+        print(f"  ❌ size ladder is wrong: {sizes}")
+        return False
+    
+    cost = {2048: 1.0, 8192: 3.0, 100000: 10.0}
+    results = build_results({'A': {'random': {size: [ns * size * math.log2(size) / 1e9]
+                                              for size, ns in cost.items()}}})
+    slowdowns = boundary_slowdowns(results, boundaries, span=4.0)
+    if list(slowdowns['A']['random']) != ['L1'] or abs(slowdowns['A']['random']['L1'] - 3.0) > 1e-9:
+        print(f"  ❌ boundary slowdowns are wrong: {slowdowns}")
+        return False
+    
+    print("  ✅ cache sweep size ladder passed")
+    return True
+
+def test_analysis_sweeps(test_data):
+    print("Testing analysis sweeps on small inputs...")
+    
+    analyzer = PerformanceAnalyzer()
+    data = test_data[0] * 20
+    
+    fan_in = analyzer.analyze_merge_fan_in(data, fan_ins=[2, 3], num_trials=1)
+    if sorted(fan_in) != [2, 3] or fan_in[2]['passes'] < fan_in[3]['passes']:
+        print("  ❌ merge fan-in sweep FAILED")
+        return False
+    
+    selection = analyzer.analyze_selection(data, ratios=[0.1], num_trials=1)
+    cell = selection['ratios'][0.1]
+    if cell['k'] != 14 or not all(cell[op]['speedup_vs_full_sort'] > 0 for op in ('nth_element', 'top_k', 'partial_sort')):
+        print("  ❌ selection sweep FAILED")
+        return False
+    
+    incremental = analyzer.analyze_incremental_inserts(QuickSort(), total_size=200, batch_sizes=[50])
+    if incremental[50]['batches'] != 4 or incremental[50]['speedup'] <= 0:
+        print("  ❌ incremental insert sweep FAILED")
+        return False
+    
+    batch = analyzer.analyze_batch_sorting(QuickSort(), array_sizes=[4, 20], total_elements=400, num_trials=1)
+    if [batch[size]['num_arrays'] for size in (4, 20)] != [100, 20]:
+        print("  ❌ batch sorting sweep FAILED")
+        return False
+    
+    records = analyzer.analyze_indirect_sorting(QuickSort(), size=50, widths=[1, 3], num_trials=1)
+    if sorted(records) != [1, 3] or not all(records[width]['speedup_vs_direct'] > 0 for width in (1, 3)):
+        print("  ❌ indirect record sorting sweep FAILED")
+        return False
+    
+    print("  ✅ analysis sweeps passed")
+    return True
+
+def test_tuning_profile():
+    print("Testing tuning profiles...")
+    
+    saved = Config.tuning_parameters()
+    profile = {'version': Config.TUNING_PROFILE_VERSION, 'python_version': platform.python_version(),
+               'parameters': {'cutoffs': {'Quick Sort': 4}, 'heap_arity': 3, 'num_trials': 1}}
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.json')
+            with open(path, 'w') as f:
+                json.dump(profile, f)
+            Config.load_tuning_profile(path)
+        
+        tuning = Config.tuning_parameters()
+        if tuning['cutoffs'] != {'Quick Sort': 4} or tuning['heap_arity'] != 3:
+            print("  ❌ tuning profile was not applied")
+            return False
+        if tuning['num_trials'] != saved['num_trials']:
+            print("  ❌ tuning profile lowered NUM_TRIALS")
+            return False
+    finally:
+        Config.apply_tuning_parameters(saved)
+    
+    print("  ✅ tuning profile passed")
+    return True
+
+def test_openmetrics_render():
+    print("Testing OpenMetrics rendering...")
+    
+    registry = MetricsRegistry()
+    sorts = registry.register(Counter('sorts', 'Completed sort calls', ['algorithm']))
+    duration = registry.register(Histogram('sort_seconds', 'Sort wall time', ['size'], buckets=[1.0, 0.125]))
+    sorts.inc(algorithm='Quick "Sort"')
+    sorts.inc(2, algorithm='Quick "Sort"')
+    for value in (0.0625, 0.5, 2.0):
+        duration.observe(value, size=1000)
+    
+    expected = '\n'.join([
+        '# TYPE sorts counter',
+        '# HELP sorts Completed sort calls',
+        'sorts_total{algorithm="Quick \\"Sort\\""} 3',
+        '# TYPE sort_seconds histogram',
+        '# HELP sort_seconds Sort wall time',
+        'sort_seconds_bucket{size="1000",le="0.125"} 1',
+        'sort_seconds_bucket{size="1000",le="1.0"} 2',
+        'sort_seconds_bucket{size="1000",le="+Inf"} 3',
+        'sort_seconds_count{size="1000"} 3',
+        'sort_seconds_sum{size="1000"} 2.5625',
+        '# EOF'
+    ]) + '\n'
+    rendered = registry.render()
+    if rendered != expected:
+        print(f"  ❌ rendered OpenMetrics text is wrong:\n{rendered}")
+        return False
+    
+    try:
+        registry.register(Counter('sorts', 'Duplicate'))
+        print("  ❌ registry accepted a duplicate metric name")
+        return False
+    except ValueError:
+        pass
+    
+    print("  ✅ OpenMetrics rendering passed")
+    return True
+
+def test_distributed():
+    print("Testing distributed coordinator and workers...")
+    
+    options = {'algorithm_names': ['Quick Sort', 'Merge Sort'], 'data_types': ['random', 'sorted'],
+               'data_sizes': [50, 100], 'num_trials': 1}
+    results = run_local_cluster(num_workers=3, timeout=120, **options)
+    cells = [(algo_name, data_type, size) for algo_name in options['algorithm_names']
+             for data_type in options['data_types'] for size in options['data_sizes']]
+    if any(size not in results['results'][algo_name][data_type] for algo_name, data_type, size in cells):
+        print("  ❌ distributed run lost a matrix cell")
+        return False
+    workers = results['metadata']['workers']
+    if sum(worker['cells'] for worker in workers.values()) != len(cells):
+        print(f"  ❌ distributed run credited the wrong cells: {workers}")
+        return False
+    
+    coordinator = BenchmarkCoordinator(address=('127.0.0.1', 0), **options)
+    address = coordinator.start()
+    dropped = Client(address, authkey=coordinator.authkey)
+    dropped.send({'type': 'hello', 'worker_id': 'dropped', 'environment': {}})
+    dropped_cell = tuple(dropped.recv()['cell'])
+    dropped.close()
+    
+    worker = threading.Thread(target=BenchmarkWorker(address, coordinator.authkey, 'steady').run, daemon=True)
+    worker.start()
+    results = coordinator.wait(60)
+    worker.join(timeout=5)
+    
+    algo_name, data_type, size = dropped_cell
+    if size not in results['results'][algo_name][data_type] or results['metadata']['workers']['dropped']['cells'] != 0:
+        print("  ❌ dropped worker's cell was not requeued")
+        return False
+    if results['metadata']['workers']['steady']['cells'] != len(cells):
+        print("  ❌ requeued cell was not completed by the remaining worker")
+        return False
+    
+    print(f"  ✅ distributed run merged {len(cells)} cells and requeued a dropped cell")
+    return True
+
+def test_interpreter_comparison():
+    print("Testing interpreter comparison...")
+    
+    interpreters = discover_interpreters([sys.executable, sys.executable, 'no-such-python'])
+    if list(interpreters.values()) != [sys.executable]:
+        print(f"  ❌ interpreter discovery returned {interpreters}")
+        return False
+    
+    saved = Config.tuning_parameters()
+    try:
+        Config.apply_tuning_parameters(dict(saved, cutoffs={'Quick Sort': 4}))
+        comparison = InterpreterComparison([sys.executable], data_sizes=[40, 80], num_trials=2,
+                                           algorithm_names=['Quick Sort', 'Heap Sort']).run()
+    finally:
+        Config.apply_tuning_parameters(saved)
+    
+    if comparison['interpreters'] != list(interpreters):
+        print("  ❌ the current interpreter's run was not merged")
+        return False
+    label = comparison['interpreters'][0]
+    results = interpreter_results(comparison, label)
+    if results['algorithms'] != ['Quick Sort', 'Heap Sort'] or results['data_sizes'] != [40, 80]:
+        print("  ❌ merged comparison has the wrong matrix axes")
+        return False
+    for algo_name in results['algorithms']:
+        for data_type in results['data_types']:
+            for size in ('40', '80'):
+                if len(results['results'][algo_name][data_type][size]['execution_times']) != 2:
+                    print(f"  ❌ cell {algo_name}/{data_type}/{size} is missing from the merged results")
+                    return False
+    
+    metadata = results['metadata']
+    if metadata['tuning']['cutoffs'] != {'Quick Sort': 4} or metadata['algorithm_parameters']['Quick Sort']['cutoff'] != 4:
+        print("  ❌ the subprocess did not use the driver's tuning parameters")
+        return False
+    
+    print("  ✅ interpreter comparison passed")
+    return True
+
+def test_cell_profiler():
+    print("Testing CellProfiler...")
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        profiler = CellProfiler(['Quick Sort:random:*'], top_n=3, output_dir=output_dir)
+        if not profiler.wants('Quick Sort', 'random', 30000) or profiler.wants('Merge Sort', 'random', 30000):
+            print("  ❌ profiler selectors matched the wrong cells")
+            return False
+        
+        switch_interval = sys.getswitchinterval()
+        entry = profiler.profile_cell(QuickSort(), generate_random_array(30000), 'Quick Sort', 'random', 30000)
+        if sys.getswitchinterval() != switch_interval:
+            print("  ❌ stack sampler did not restore the switch interval")
+            return False
+        
+        for path in (entry['pstats_path'], entry['collapsed_path']):
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                print(f"  ❌ profiler did not write {os.path.basename(path)}")
+                return False
+        with open(entry['collapsed_path']) as f:
+            stacks = [line for line in f.read().splitlines() if line]
+        if entry['samples'] == 0 or not stacks or not all(line.rsplit(' ', 1)[1].isdigit() for line in stacks):
+            print("  ❌ stack sampler collected no collapsed stacks")
+            return False
+        if len(entry['hot_functions']) != 3:
+            print("  ❌ profiler did not report the hot functions")
+            return False
+    
+    print("  ✅ CellProfiler passed")
+    return True
+
+def test_environment():
+    print("Testing environment fingerprints...")
+    
+    environment = collect_environment()
+    if compare_environments(environment, json.loads(json.dumps(environment))) != []:
+        print("  ❌ identical fingerprints were reported as different")
+        return False
+    mismatches = compare_environments(environment, dict(environment, cpu_model='Other CPU'))
+    if len(mismatches) != 1 or not mismatches[0].startswith('cpu_model'):
+        print(f"  ❌ changed CPU model was not reported: {mismatches}")
+        return False
+    
+    quiet = {'cpu_governor': 'performance', 'load_average': [0.1, 0.1, 0.1], 'logical_cores': 4,
+             'cpu_freq_mhz': 3000, 'cpu_freq_max_mhz': 3200,
+             'memory_available_bytes': 8 << 30, 'memory_total_bytes': 16 << 30}
+    busy = dict(quiet, cpu_governor='powersave', load_average=[6.0, 6.0, 6.0], cpu_freq_mhz=1200,
+                memory_available_bytes=1 << 30)
+    if comparability_warnings(quiet) != [] or len(comparability_warnings(busy)) != 4:
+        print("  ❌ comparability warnings are wrong")
+        return False
+    
+    counters = PerfCounters({'unsupported': 0xFFFF})
+    counters.reset()
+    counters.start()
+    counters.stop()
+    if counters.available or counters.read() != {'unsupported': None}:
+        print("  ❌ PerfCounters did not degrade without perf_event_open support")
+        return False
+    
+    print("  ✅ environment fingerprints passed")
+    return True
+
+def test_trial_monitor():
+    print("Testing TrialMonitor...")
+    
+    monitor = TrialMonitor()
+    if monitor.available:
+        callbacks = len(gc.callbacks)
+        monitor.start()
+        sum(i * i for i in range(200000))
+        gc.collect()
+        metrics = monitor.stop()
+        
+        if len(gc.callbacks) != callbacks:
+            print("  ❌ TrialMonitor left its gc callback installed")
+            return False
+        if metrics['cpu_time'] <= 0 or metrics['gc_collections'] < 1 or metrics['gc_pause'] <= 0:
+            print(f"  ❌ TrialMonitor missed the forced collection: {metrics}")
+            return False
+        if metrics['gc_collections_by_generation'][2] < 1:
+            print("  ❌ TrialMonitor attributed the full collection to the wrong generation")
+            return False
+        
+        monitor.start()
+        if monitor.stop()['gc_collections'] != 0:
+            print("  ❌ TrialMonitor carried collections over between trials")
+            return False
+    
+    quiet = {'cpu_time': 0.1, 'gc_pause': 0.0, 'involuntary_switches': 0}
+    noisy = {'cpu_time': 0.05, 'gc_pause': 0.01, 'involuntary_switches': 50}
+    if interference_flags(quiet, 0.1) != []:
+        print("  ❌ interference_flags flagged a clean trial")
+        return False
+    if interference_flags(noisy, 0.1) != ['cpu_starved', 'gc_pauses', 'context_switches']:
+        print("  ❌ interference_flags missed an interfered trial")
+        return False
+    if interference_flags(dict(noisy, involuntary_switches=None), 0.0001) != ['gc_pauses']:
+        print("  ❌ interference_flags ignored the minimum wall time or missing switch counts")
+        return False
+    
+    print("  ✅ TrialMonitor passed")
+    return True
+
+def test_dataset_pipeline():
+    print("Testing DatasetPipeline...")
+    
+    sizes, data_types = [10, 50], ['random', 'sorted', 'reversed']
+    expected = list(DataGenerator().iter_datasets(sizes, seed=7, data_types=data_types))
+    expected_compact = list(DataGenerator().iter_datasets([300000], seed=7, compact=True, data_types=['random']))
+    for mode in ('thread', 'process'):
+        if list(DatasetPipeline(sizes, seed=7, data_types=data_types, mode=mode)) != expected:
+            print(f"  ❌ {mode} pipeline changed the dataset order or contents")
+            return False
+        compact = DatasetPipeline([300000], seed=7, compact=True, data_types=['random'], mode=mode)
+        if list(compact) != expected_compact:
+            print(f"  ❌ {mode} pipeline corrupted a compact dataset")
+            return False
+        
+        try:
+            list(DatasetPipeline(sizes, seed=7, data_types=['random', 'no_such_type'], mode=mode))
+            print(f"  ❌ {mode} pipeline swallowed a producer error")
+            return False
+        except RuntimeError as error:
+            if 'no_such_type' not in str(error):
+                print(f"  ❌ {mode} pipeline lost the producer traceback")
+                return False
+    
+    print("  ✅ DatasetPipeline passed")
+    return True
+
 def main():
     print("🧪 Running Quick Tests for Sorting Algorithms")
     print("=" * 50)
@@ -44,14 +756,98 @@ def main():
         list(range(100))  
     ]
     
-    algorithms = [QuickSort(), MergeSort(), HeapSort()]
+    algorithms = [QuickSort(), MergeSort(), HeapSort(), MultiwayMergeSort(2), MultiwayMergeSort(5),
+                  QuickSort(0), MergeSort(0), HeapSort(0), MergeSort(40), HeapSort(64),
+                  HeapSort(16, 3), HeapSort(0, 4)]
     
     all_passed = True
     for algorithm in algorithms:
         if not test_algorithm(algorithm, test_data):
             all_passed = False
+        if not test_algorithm_buffers(algorithm, test_data):
+            all_passed = False
+        if not test_sort_many(algorithm, test_data):
+            all_passed = False
+        if not test_argsort(algorithm, test_data):
+            all_passed = False
         print()
     
+    if not test_selection(test_data):
+        all_passed = False
+    print()
+    
+    if not test_incremental_sorted_list(test_data):
+        all_passed = False
+    print()
+    
+    if not test_apply_permutation(test_data):
+        all_passed = False
+    print()
+    
+    if not test_sort_cache(test_data):
+        all_passed = False
+    print()
+    
+    generator = DataGenerator(seed=1)
+    string_data = [
+        ['banana', 'apple', 'cherry', 'apple', ''],
+        ['abc', 'ab', 'a', '', 'abcd', 'abd'],
+        ['x' * 300 + str(i % 7) for i in range(100)],
+        [str(i) for i in range(200, 0, -1)]
+    ] + [generator.generate_dataset(data_type, 500) for data_type in generator.config.STRING_DATA_TYPES]
+    
+    if not test_string_sorts(string_data):
+        all_passed = False
+    print()
+    
+    if not test_results_store():
+        all_passed = False
+    print()
+    
+    if not test_results_cube():
+        all_passed = False
+    print()
+    
+    if not test_dataset_pipeline():
+        all_passed = False
+    print()
+    
+    if not test_cache_sweep_ladder():
+        all_passed = False
+    print()
+    
+    if not test_analysis_sweeps(test_data):
+        all_passed = False
+    print()
+    
+    if not test_tuning_profile():
+        all_passed = False
+    print()
+    
+    if not test_distributed():
+        all_passed = False
+    print()
+    
+    if not test_interpreter_comparison():
+        all_passed = False
+    print()
+    
+    if not test_cell_profiler():
+        all_passed = False
+    print()
+    
+    if not test_environment():
+        all_passed = False
+    print()
+    
+    if not test_trial_monitor():
+        all_passed = False
+    print()
+    
+    if not test_openmetrics_render():
+        all_passed = False
+    print()
+    
     if all_passed:
         print("🎉 All tests passed! Algorithms are working correctly.")
     else:
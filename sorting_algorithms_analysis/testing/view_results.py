@@ -1,45 +1,49 @@
 
 import json
 import os
+import sys
 import glob
 
 
-results_dir = os.path.join(os.path.dirname(__file__), '../results/performance_data')
-json_files = glob.glob(os.path.join(results_dir, 'performance_results_*.json'))
-if not json_files:
-    raise FileNotFoundError('No performance results JSON files found in results/performance_data/')
-results_file = max(json_files, key=os.path.getmtime)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.analysis.results_cube import ResultsCube
 
-with open(results_file, 'r') as f:
-    results = json.load(f)
+results_dir = os.path.join(os.path.dirname(__file__), '../results/performance_data')
+results_files = glob.glob(os.path.join(results_dir, 'performance_results_*.csv'))
+if not results_files:
+    results_files = glob.glob(os.path.join(results_dir, 'performance_results_*.json'))
+if not results_files:
+    raise FileNotFoundError('No performance results files found in results/performance_data/')
+results_file = max(results_files, key=os.path.getmtime)
+
+if results_file.endswith('.csv'):
+    cube = ResultsCube.load(results_file)
+else:
+    with open(results_file, 'r') as f:
+        cube = ResultsCube.from_results(json.load(f))
 
 print("🔍 ANALYSIS RESULTS SUMMARY")
 print("=" * 50)
 
-print(f"Algorithms tested: {', '.join(results['algorithms'])}")
-print(f"Data types: {', '.join(results['data_types'])}")
-print(f"Data sizes: {results['data_sizes']}")
-print(f"Analysis date: {results['metadata']['timestamp']}")
+print(f"Algorithms tested: {', '.join(cube.algorithms)}")
+print(f"Data types: {', '.join(cube.data_types)}")
+print(f"Data sizes: {cube.data_sizes}")
+print(f"Analysis date: {cube.metadata['timestamp']}")
 print()
 
 
 print("🏆 BEST PERFORMERS:")
 print("-" * 30)
 
-for data_type in results['data_types']:
+best = cube.best()
+best_times = cube.best_times()
+
+for t, data_type in enumerate(cube.data_types):
     print(f"\n{data_type.replace('_', ' ').title()} Data:")
     
-    for size in results['data_sizes']:
-        best_algo = None
-        best_time = float('inf')
-        
-        for algo_name in results['algorithms']:
-            mean_time = results['results'][algo_name][data_type][str(size)]['statistics']['mean']
-            if mean_time < best_time:
-                best_time = mean_time
-                best_algo = algo_name
-        
-        print(f"  {size//1000}K: {best_algo} ({best_time:.6f}s)")
+    for s, size in enumerate(cube.data_sizes):
+        print(f"  {size//1000}K: {cube.algorithms[best[t, s]]} ({best_times[t, s]:.6f}s)")
 
 print(f"\n✅ Analysis completed successfully!")
 print(f"📊 View graphs in: src/results/graphs/")